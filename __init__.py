@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import time
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.importlib import async_import_module
 
+from .bypass import async_register_bypass_zones_service
 from .const import (
     CONF_DEVICE,
     CONF_NAME,
+    DATA_SCHEDULER,
     DEFAULT_NAME,
     DOMAIN,
+    EVENT_ADEMCO,
+    MANUFACTURER,
+    MODEL,
     PLATFORMS,
 )
+from .entity import build_unique_id
+from .profiler import async_register_profile_service, async_register_trace_service
+from .topology import PanelTopology, compile_topology
 
 import logging
 
@@ -33,6 +43,10 @@ class AdemcoRuntimeData:
     config: dict
     device_id: str
     device_name: str
+    entry_id: str
+    topology: PanelTopology
+    # Seconds from the start of async_setup_entry to each setup phase.
+    setup_timings: dict[str, float] = field(default_factory=dict)
 
 
 type AdemcoConfigEntry = ConfigEntry[AdemcoRuntimeData]
@@ -47,12 +61,44 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             "YAML block from configuration.yaml.",
             DOMAIN,
         )
+    async_register_profile_service(hass)
+    async_register_trace_service(hass)
+    async_register_bypass_zones_service(hass)
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: AdemcoConfigEntry) -> bool:
+    """Migrate old config entries."""
+    if entry.version > 1:
+        return False
+
+    if entry.minor_version < 2:
+        # Unique IDs used to be global (ademco.zone17); namespace them by
+        # config entry so several panels can coexist.
+        legacy_prefix = f"{DOMAIN}."
+
+        @callback
+        def _migrate_unique_id(entity_entry: er.RegistryEntry) -> dict[str, str] | None:
+            unique_id = entity_entry.unique_id
+            if not unique_id.startswith(legacy_prefix) or unique_id.count(".") != 1:
+                return None
+            return {
+                "new_unique_id": build_unique_id(
+                    entry.entry_id, unique_id[len(legacy_prefix) :]
+                )
+            }
+
+        await er.async_migrate_entries(hass, entry.entry_id, _migrate_unique_id)
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+        log.debug("Migrated Ademco entry %s to namespaced unique IDs", entry.entry_id)
+
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: AdemcoConfigEntry) -> bool:
     """Set up Ademco from a config entry."""
-    from .ademco import AlarmPanel
+    started = time.monotonic()
+    from .ademco import AlarmPanel, Scheduler
 
     config = dict(entry.data)
     panel_name = str(config.get(CONF_NAME, "")).strip()
@@ -73,6 +119,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: AdemcoConfigEntry) -> bo
         create_task=lambda coro, name: entry.async_create_background_task(
             hass, coro, f"{DOMAIN}_{name}"
         ),
+        # One timer heap drives status polling for every configured panel.
+        scheduler=hass.data.setdefault(DATA_SCHEDULER, Scheduler(hass.loop)),
     )
 
     device_id = config.get(CONF_DEVICE) or entry.entry_id
@@ -82,21 +130,64 @@ async def async_setup_entry(hass: HomeAssistant, entry: AdemcoConfigEntry) -> bo
     if device := device_registry.async_get_device(identifiers={(DOMAIN, device_id)}):
         if device.name_by_user is None and device.name != device_name:
             device_registry.async_update_device(device.id, name=device_name)
+    else:
+        # Panel events carry the device id, so the device must exist before
+        # the first event, not only once an entity is added.
+        device = device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, device_id)},
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+            name=device_name,
+        )
+
+    @callback
+    def _async_fire_panel_event(event: dict) -> None:
+        hass.bus.async_fire(
+            EVENT_ADEMCO,
+            {**event, "device_id": device.id, "entry_id": entry.entry_id},
+        )
+
+    entry.async_on_unload(panel.registerEventCallback(_async_fire_panel_event))
+
+    topology = compile_topology(config)
+    # Latching is panel behaviour, so it applies whether or not the zone's
+    # entity is created or enabled.
+    for zone_topology in topology.zones:
+        zone = panel.getZone(zone_topology.zone_id)
+        if zone is not None:
+            zone.latchSeconds = max(zone.latchSeconds, zone_topology.latch_seconds)
 
     entry.runtime_data = AdemcoRuntimeData(
         panel=panel,
         config=config,
         device_id=device_id,
         device_name=device_name,
+        entry_id=entry.entry_id,
+        topology=topology,
     )
 
+    timings = entry.runtime_data.setup_timings
+
+    # The serial libraries are imported lazily on connect; import them in
+    # the executor first so the loop never blocks on the import.
     try:
+        if panel.transport is not None:
+            for module in panel.transport.required_modules:
+                await async_import_module(hass, module)
+        timings["import"] = time.monotonic() - started
+        # Only starts the connect task, so it is done before any platform is
+        # forwarded: a failure here leaves nothing to unload.
         await panel.async_start()
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     except Exception:
         await panel.async_stop()
         raise
 
+    # Entities come up while the link connects; they show unavailable until
+    # the first zone report arrives.
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    timings["entities_ready"] = time.monotonic() - started
+
     log.debug(
         "Configured Ademco panel on %s",
         config.get(CONF_DEVICE),
@@ -1,32 +1,99 @@
 from __future__ import annotations
 
-from asyncio.streams import StreamReader, StreamWriter
 from collections.abc import Callable
 import asyncio
 from asyncio import CancelledError
 from contextlib import suppress
+from functools import partial
 import logging
+import random
+from types import MappingProxyType
 from typing import Any, Dict, List
 
+from .outbound import (
+    COMMAND_DEADLINE,
+    AdemcoError,
+    CommandExpired,
+    CommandQueueFull,
+    OutboundQueue,
+)
+from .protocol import (
+    CORRUPT_FRAME,
+    REPORT_TYPES,
+    STATUS_REQUESTS,
+    OutputStatusChanged,
+    PanelProtocol,
+    PartitionMapChanged,
+    PartitionStatusChanged,
+    Record,
+    SystemEvent,
+    ZoneStatusChanged,
+    build_bypass_keys,
+    build_keypad_command,
+    build_output_command,
+    build_partition_control_command,
+    checksum,
+    decode_system_event,
+    encode_command,
+    parse_message,
+    twos_comp,
+)
+from .scheduler import ScheduledCall, Scheduler
+from .snapshot import PanelSnapshot, PartitionSnapshot, ZoneSnapshot
+from .trace import WireTrace
+from .transport import (
+    LoopbackTransport,
+    SerialTransport,
+    TcpTransport,
+    Transport,
+    create_transport,
+)
+
 log = logging.getLogger(__name__)
 
 REFRESH_INTERVAL = 3600
-
-
-def twos_comp(val, bits):
-    """compute the 2's complement of int value val"""
-    if (val & (1 << (bits - 1))) != 0:  # if sign bit is set e.g., 8bit: 128-255
-        val = val - (1 << bits)  # compute negative value
-    return val
-
-
-def checksum(s: str) -> str:
-    tot = 0
-    for l in s:
-        tot = tot + ord(l)
-    tot = ((tot % 256) * -1) % 256
-    i = "%.2X" % (twos_comp(tot, 256))
-    return i
+# Follow-up delays for the refresh sequence; the write queue paces commands.
+# The refresh continues as soon as the zone report arrives, so the settle delay
+# only applies when the panel is slow to answer.
+ZONE_STATUS_SETTLE = 3
+ZONE_STATUS_RETRY = 5
+
+# The ks keypad command carries at most this many keystrokes per frame.
+KEYPAD_MAX_KEYS = 5
+# How long to wait for bypass events or a zone report after the last frame.
+BYPASS_CONFIRM_TIMEOUT = 10
+# How long a finished output schedule waits for a CS report to confirm it.
+OUTPUT_CONFIRM_TIMEOUT = 10
+
+# Each full-state report backs one subsystem's readiness.
+SUBSYSTEM_REPORTS = {
+    "ZS": "zones",
+    "AS": "partitions",
+    "CS": "outputs",
+    "ZP": "partition_map",
+}
+SUBSYSTEMS = tuple(SUBSYSTEM_REPORTS.values())
+# Reports are refreshed hourly; data older than two missed refreshes is stale.
+REPORT_STALE_AFTER = 2 * REFRESH_INTERVAL + 60
+
+# A status request whose report has not arrived within REQUEST_TIMEOUT
+# seconds, or that was followed by a corrupt frame, is re-issued up to
+# REQUEST_RETRIES times.
+REQUEST_TIMEOUT = 5
+REQUEST_RETRIES = 3
+# A corrupt frame with no request outstanding re-reads zones at most once per
+# this many seconds, so a noisy line cannot flood the queue with requests.
+CORRUPT_REREAD_INTERVAL = 30
+# Written status request frame -> the report type that answers it.
+REQUEST_FRAMES = {
+    encode_command(command): report_type
+    for report_type, command in STATUS_REQUESTS.items()
+}
+
+# Reconnect backoff: the first retry is fast so a USB-serial hiccup recovers in
+# well under a second, later retries back off so a dead adapter is not hammered.
+RECONNECT_INITIAL_DELAY = 0.25
+RECONNECT_BACKOFF_FACTOR = 2
 
 
 class AlarmPanel:
@@ -35,10 +102,37 @@ class AlarmPanel:
         config: dict,
         loop: asyncio.AbstractEventLoop | None = None,
         create_task: Callable[[Any, str], asyncio.Task] | None = None,
+        transport: Transport | None = None,
+        scheduler: Scheduler | None = None,
     ) -> None:
         self.loop = loop or asyncio.get_running_loop()
+        # Several panels can share one scheduler so they share one timer.
+        self._scheduler = scheduler or Scheduler(self.loop)
         self.SERIAL_PORT = config.get("device", "/dev/ttyUSB0")
         self.BAUD_RATE = config.get("baud", "1200")
+        if transport is None:
+            try:
+                transport = create_transport({**config, "device": self.SERIAL_PORT})
+            except ValueError:
+                log.exception("Invalid Ademco connection settings")
+        self._transport = transport
+
+        # Report application and command framing; this class drives it over
+        # the transport and mirrors its records onto Zone/Partition/Output.
+        self._protocol = PanelProtocol()
+        # Recent frames in both directions, for diagnostics and trace dumps.
+        self.trace = WireTrace()
+        # Bumped on every zone, partition, output or connection change. The
+        # last snapshot and its unchanged sections are reused until then.
+        self.state_version = 0
+        self._snapshot: PanelSnapshot | None = None
+        self._snapshot_zones: tuple[ZoneSnapshot, ...] | None = None
+        self._dirty_zones: set[int] = set()
+        self._snapshot_partitions: MappingProxyType | None = None
+        self._snapshot_outputs: frozenset[int] | None = None
+        # Callbacks held back while a report is being applied, so none of
+        # them sees (or snapshots) a half-applied report.
+        self._deferred: list[Callable[[], None]] | None = None
 
         #TODO Load last status instead of assume closed
         self._zones: Dict[int, Zone] = {}
@@ -51,20 +145,77 @@ class AlarmPanel:
 
         self._partitions: Dict[int, Partition] = {}
         self._partitionReport = None
-        self.reader: StreamReader | None = None
-        self.writer: StreamWriter | None = None
-        self.writeQueue: asyncio.Queue[bytes] = asyncio.Queue()
+        # Last CS report, kept so a repeat can still confirm schedules.
+        self._output_report = ""
+        # Bumped whenever the zone partition map changes, so callers can cache
+        # anything derived from it.
+        self.partition_map_version = 0
+        self._partition_zones: dict[int, list[Zone]] | None = None
+        self.writeQueue = OutboundQueue(self.loop)
         self.is_initialized = False
         self.connected = False
         self._callbacks: list[Callable[[], None]] = []
+        self._event_callbacks: list[Callable[[dict[str, Any]], None]] = []
         self._main_task: asyncio.Task | None = None
         self._listen_task: asyncio.Task | None = None
-        self._refresh_task: asyncio.Task | None = None
+        self._refresh_call: ScheduledCall | None = None
+        self._refresh_awaiting_zones = False
+        # Loop time each subsystem's report was last received on this link.
+        self._report_times: dict[str, float] = {}
+        self._stale_call: ScheduledCall | None = None
+        # Status requests written but not yet answered, by report type. One
+        # scheduler entry is armed for the earliest deadline.
+        self._pending_requests: dict[str, PendingRequest] = {}
+        self._request_call: ScheduledCall | None = None
+        self._corrupt_reread_at: float | None = None
+        # Counters since the panel was created; round_trip is the last
+        # request-to-report time in seconds.
+        self.link_stats: dict[str, float] = {
+            "frames": 0,
+            "corrupt": 0,
+            "requests": 0,
+            "retries": 0,
+            "timeouts": 0,
+            "abandoned": 0,
+            "round_trip": 0.0,
+        }
+        # Seconds from async_start to each startup phase: connect, first_frame,
+        # zone_sync (first ZS) and full_sync (ZS, CS and AS all received).
+        self.startup_timings: dict[str, float] = {}
+        self._startup_pending: set[str] | None = None
+        self._start_time = 0.0
+        # Latched zones share one scheduler entry, armed for the earliest
+        # deadline in _latch_deadlines (zone number -> loop time).
+        self._latch_deadlines: dict[int, float] = {}
+        self._latch_call: ScheduledCall | None = None
         self._write_task: asyncio.Task | None = None
-        self._restart_task: asyncio.Task | None = None
-        self._connect_lock = asyncio.Lock()
+        # _link_up gates the listen/write tasks, _link_lost wakes the supervisor
+        # as soon as either of them sees the connection fail.
+        self._link_up = asyncio.Event()
+        self._link_lost = asyncio.Event()
+        self._reconnect_attempts = 0
         self._stopped = False
         self._create_task = create_task
+        self._handlers: dict[str, Callable[[str], None]] = {
+            "ZS": self.processZoneStatusReport,
+            "ZP": self.processZonePartionReport,
+            "CS": self.processOutputStatusReport,
+            "AS": self.processArmingStatusReport,
+            "NQ": self.processSystemEvent,
+            "OK": self.processOK,
+        }
+        # Bookkeeping a repeated report still needs, without reapplying it.
+        self._repeat_handlers: dict[str, Callable[[], None]] = {
+            "ZS": self._zone_report_received,
+            "CS": self._confirm_outputs,
+        }
+        self._record_handlers: dict[type, Callable[[Any], None]] = {
+            ZoneStatusChanged: self._apply_zone_status,
+            PartitionMapChanged: self._apply_partition_map,
+            PartitionStatusChanged: self._apply_partition_status,
+            OutputStatusChanged: self._apply_output_status,
+            SystemEvent: self._apply_system_event,
+        }
 
         log.debug("Initializing Ademco panel")
 
@@ -72,6 +223,57 @@ class AlarmPanel:
     def available(self) -> bool:
         return self.connected and self.is_initialized
 
+    def is_ready(self, subsystem: str) -> bool:
+        """Return whether a subsystem has fresh data from the current link.
+
+        ``subsystem`` is one of ``SUBSYSTEMS``: zones, partitions, outputs or
+        partition_map. Each becomes ready when its own report arrives, so
+        entities do not wait on unrelated reports after a reconnect.
+        """
+        if not self.connected:
+            return False
+        received = self._report_times.get(subsystem)
+        return received is not None and (
+            self._scheduler.time() - received < REPORT_STALE_AFTER
+        )
+
+    def report_age(self, subsystem: str) -> float | None:
+        """Seconds since the subsystem's last report on this link, if any."""
+        received = self._report_times.get(subsystem)
+        return None if received is None else self._scheduler.time() - received
+
+    def _note_report(self, messageType: str) -> bool:
+        """Record a report's arrival; return True if it made data ready."""
+        subsystem = SUBSYSTEM_REPORTS.get(messageType)
+        if subsystem is None:
+            return False
+        became_ready = not self.is_ready(subsystem)
+        self._report_times[subsystem] = self._scheduler.time()
+        if self._stale_call is None:
+            self._stale_call = self._scheduler.call_later(
+                REPORT_STALE_AFTER, self._check_stale
+            )
+        return became_ready
+
+    def _check_stale(self) -> None:
+        """Tell listeners about subsystems that went stale, then re-arm."""
+        self._stale_call = None
+        if not self._report_times:
+            return
+        now = self._scheduler.time()
+        if any(now - t >= REPORT_STALE_AFTER for t in self._report_times.values()):
+            self._report_times = {
+                subsystem: t
+                for subsystem, t in self._report_times.items()
+                if now - t < REPORT_STALE_AFTER
+            }
+            self._notify_callbacks()
+        if self._report_times:
+            self._stale_call = self._scheduler.call_at(
+                min(self._report_times.values()) + REPORT_STALE_AFTER,
+                self._check_stale,
+            )
+
     def registerCallback(self, cb):
         self._callbacks.append(cb)
 
@@ -82,7 +284,14 @@ class AlarmPanel:
         return _remove_callback
 
     def _notify_callbacks(self) -> None:
-        for cb in list(self._callbacks):
+        self._run_callbacks(self._callbacks)
+
+    def _run_callbacks(self, callbacks: list[Callable[[], None]]) -> None:
+        if self._deferred is not None:
+            self._deferred.extend(callbacks)
+            return
+        # Copied: a callback may remove itself, e.g. a finished bypass wait.
+        for cb in list(callbacks):
             try:
                 cb()
             except Exception:
@@ -91,6 +300,7 @@ class AlarmPanel:
     def _set_connected(self, connected: bool) -> None:
         if self.connected != connected:
             self.connected = connected
+            self._state_changed()
             self._notify_callbacks()
 
     def _set_initialized(self, initialized: bool) -> None:
@@ -98,13 +308,26 @@ class AlarmPanel:
             self.is_initialized = initialized
             self._notify_callbacks()
 
+    @property
+    def transport(self) -> Transport | None:
+        return self._transport
+
     def _handle_disconnect(self) -> None:
-        self.reader = None
-        if self.writer is not None:
-            self.writer.close()
-        self.writer = None
+        self._link_up.clear()
+        self._cancel_refresh()
+        self._report_times = {}
+        if self._stale_call is not None:
+            self._stale_call.cancel()
+            self._stale_call = None
+        self._clear_pending_requests()
+        # Nothing queued for the old link may actuate after a reconnect.
+        self.writeQueue.clear("Ademco link was lost")
+        if self._transport is not None:
+            self._transport.abort()
         self._set_connected(False)
         self._set_initialized(False)
+        if not self._stopped:
+            self._link_lost.set()
 
     def _create_background_task(self, coro: Any, name: str) -> asyncio.Task:
         """Create a background task for panel runtime work."""
@@ -117,7 +340,13 @@ class AlarmPanel:
             return
 
         self._stopped = False
-        self.writeQueue = asyncio.Queue()
+        self.writeQueue = OutboundQueue(self.loop)
+        self._link_up.clear()
+        self._link_lost.clear()
+        self._reconnect_attempts = 0
+        self.startup_timings = {}
+        self._startup_pending = {"ZS", "CS", "AS"}
+        self._start_time = self.loop.time()
         self._main_task = self._create_background_task(self.main(), "main")
 
     async def async_stop(self) -> None:
@@ -126,9 +355,7 @@ class AlarmPanel:
         tasks = [
             self._main_task,
             self._listen_task,
-            self._refresh_task,
             self._write_task,
-            self._restart_task,
         ]
         pending = []
         for task in tasks:
@@ -137,119 +364,296 @@ class AlarmPanel:
                 pending.append(task)
         if pending:
             await asyncio.gather(*pending, return_exceptions=True)
-        if self.writer is not None:
-            self.writer.close()
-            wait_closed = getattr(self.writer, "wait_closed", None)
-            if callable(wait_closed):
-                with suppress(Exception):
-                    await wait_closed()
-        self.reader = None
-        self.writer = None
-        self.writeQueue = asyncio.Queue()
+        self._cancel_refresh()
+        if self._latch_call is not None:
+            self._latch_call.cancel()
+            self._latch_call = None
+        # Nothing would expire these latches once stopped.
+        latched, self._latch_deadlines = self._latch_deadlines, {}
+        for zone_num in latched:
+            self._zones[zone_num]._set_latched(False)
+        if self._stale_call is not None:
+            self._stale_call.cancel()
+            self._stale_call = None
+        self._clear_pending_requests()
+        self._link_up.clear()
+        self._link_lost.clear()
+        if self._transport is not None:
+            with suppress(Exception):
+                await self._transport.close()
+        self.writeQueue.clear("Ademco panel stopped")
+        self.writeQueue = OutboundQueue(self.loop)
         if self._main_task is not current_task:
             self._main_task = None
         if self._listen_task is not current_task:
             self._listen_task = None
-        if self._refresh_task is not current_task:
-            self._refresh_task = None
         if self._write_task is not current_task:
             self._write_task = None
-        if self._restart_task is not current_task:
-            self._restart_task = None
         self._set_connected(False)
         self._set_initialized(False)
 
-    def request_restart(self) -> None:
-        """Queue a restart from an exception path without duplicating tasks."""
-        if self._stopped:
-            return
-        if self._restart_task is None or self._restart_task.done():
-            self._restart_task = self._create_background_task(self.restart(), "restart")
-
-    async def restart(self):
-        # reset everything on errrors
-        try:
-            should_restart = not self._stopped
-            await self.async_stop()
-            if should_restart:
-                await self.async_start()
-        finally:
-            if self._restart_task is asyncio.current_task():
-                self._restart_task = None
-
-    async def _open_serial_connection(self) -> tuple[StreamReader, StreamWriter]:
-        """Open the Ademco serial transport lazily to avoid import-time overhead."""
-        import serial_asyncio
-
-        return await serial_asyncio.open_serial_connection(
-            url=self.SERIAL_PORT,
-            baudrate=self.BAUD_RATE,
-        )
-
     async def main(self):
+        """Supervise the connection and reconnect with backoff when it drops.
+
+        The listen and write tasks are started once and reused across
+        reconnects; they park on ``_link_up`` while the link is down. Status
+        polling runs on the shared scheduler rather than its own task.
+        """
         self._write_task = self._create_background_task(
             self.monitorWriteQueue(), "write_queue"
         )
         self._listen_task = self._create_background_task(self.listen(), "listen")
-        self._refresh_task = self._create_background_task(
-            self.refreshStatus(), "refresh_status"
-        )
         while not self._stopped:
-            if not self.reader or not self.writer:
-                if not self.SERIAL_PORT:
-                    log.info("No serial port configured")
-                    await asyncio.sleep(300)
-                    continue
+            if self._transport is None:
+                log.info("No serial port configured")
+                await asyncio.sleep(300)
+                continue
 
-                log.debug(
-                    "Connecting to: {}  Baud: {}".format(
-                        self.SERIAL_PORT, self.BAUD_RATE
-                    )
-                )
-                if self.reader or self.writer or self._stopped:
-                    await asyncio.sleep(1)
-                    continue
+            if not self._transport.connected:
                 try:
-                    async with self._connect_lock:
-                        if self.reader or self.writer or self._stopped:
-                            continue
-
-                        (
-                            self.reader,
-                            self.writer,
-                        ) = await self._open_serial_connection()
-                        self.writer.write(b"\r\n")
+                    await self._connect()
+                except CancelledError:
+                    break
                 except Exception:
                     self._handle_disconnect()
-                    log.exception("Caught Serial Exception")
-                    await asyncio.sleep(5)
+                    delay = self._next_reconnect_delay()
+                    log.exception(
+                        "Could not connect to %s, retrying in %.1f seconds",
+                        self.SERIAL_PORT,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
                     continue
-                except CancelledError:
-                    break
 
-                log.debug("Ademco Connected")
-                self._set_connected(True)
-            await asyncio.sleep(60)
+            await self._link_lost.wait()
+            self._link_lost.clear()
+            if not self._stopped:
+                delay = self._next_reconnect_delay()
+                log.warning(
+                    "Ademco connection lost, reconnecting in %.1f seconds", delay
+                )
+                await asyncio.sleep(delay)
+
+    async def _connect(self) -> None:
+        log.debug("Connecting to: %s  Baud: %s", self.SERIAL_PORT, self.BAUD_RATE)
+        await self._transport.connect()
+        await self._transport.write(b"\r\n")
+        self._link_lost.clear()
+        self._link_up.set()
+        log.debug("Ademco Connected")
+        self._mark_startup("connect")
+        self._set_connected(True)
+        self.refreshStatus()
+
+    def _next_reconnect_delay(self) -> float:
+        """Return a jittered exponential backoff delay for the next attempt."""
+        delay = min(
+            self._transport.reconnect_max_delay,
+            RECONNECT_INITIAL_DELAY
+            * RECONNECT_BACKOFF_FACTOR ** min(self._reconnect_attempts, 16),
+        )
+        self._reconnect_attempts += 1
+        return random.uniform(delay / 2, delay)
+
+    def refreshStatus(self) -> None:
+        """Start a full status refresh and schedule the next hourly one."""
+        self._cancel_refresh()
+        if self._stopped or not self.connected:
+            return
+        self.zoneStatusRequest()
+        self._refresh_awaiting_zones = True
+        self._refresh_call = self._scheduler.call_later(
+            ZONE_STATUS_SETTLE, self._continue_refresh
+        )
 
-    async def refreshStatus(self):
-        while not self._stopped:
-            self.zoneStatusRequest()
-            await asyncio.sleep(3)
+    def _continue_refresh(self) -> None:
+        self._refresh_call = None
+        if self._stopped or not self.connected:
+            return
+        if not self.is_initialized:
             #sometimes first attempt doesn't work.
-            while not self.is_initialized and not self._stopped:
-                self.zoneStatusRequest()
-                await asyncio.sleep(5)
-            self.outputStatusRequest()
-            await asyncio.sleep(2)
-            self.armingStatusRequest()
-            await asyncio.sleep(2)
-            if self._partitionReport is None:
-                self.zonePartitionRequest()
+            self.zoneStatusRequest()
+            self._refresh_awaiting_zones = True
+            self._refresh_call = self._scheduler.call_later(
+                ZONE_STATUS_RETRY, self._continue_refresh
+            )
+            return
+        self._refresh_awaiting_zones = False
+        self.outputStatusRequest()
+        self.armingStatusRequest()
+        # Asked for every time, even though it rarely changes, so the
+        # partition map stays fresh and is re-read after a reconnect.
+        self.zonePartitionRequest()
+
+        self._refresh_call = self._scheduler.call_later(
+            REFRESH_INTERVAL, self.refreshStatus
+        )
 
-            # await asyncio.sleep(2)
-            # TODO check that data has been received
+    def _cancel_refresh(self) -> None:
+        self._refresh_awaiting_zones = False
+        if self._refresh_call is not None:
+            self._refresh_call.cancel()
+            self._refresh_call = None
+
+    def _request_written(self, report_type: str) -> None:
+        now = self._scheduler.time()
+        pending = self._pending_requests.get(report_type)
+        if pending is None:
+            pending = self._pending_requests[report_type] = PendingRequest()
+        pending.sent_at = now
+        pending.deadline = now + REQUEST_TIMEOUT
+        self.link_stats["requests"] += 1
+        self._arm_request_timer(pending.deadline)
+
+    def _request_answered(self, report_type: str) -> None:
+        pending = self._pending_requests.pop(report_type, None)
+        if pending is not None and pending.sent_at is not None:
+            self.link_stats["round_trip"] = self._scheduler.time() - pending.sent_at
+
+    def _retry_requests(self, report_types: list[str], reason: str) -> None:
+        for report_type in report_types:
+            pending = self._pending_requests[report_type]
+            if pending.attempts >= REQUEST_RETRIES:
+                del self._pending_requests[report_type]
+                self.link_stats["abandoned"] += 1
+                log.warning(
+                    "Ademco panel did not answer the %s request after %s retries",
+                    report_type,
+                    REQUEST_RETRIES,
+                )
+                continue
+            pending.attempts += 1
+            # Not timed again until the retry is actually written.
+            pending.deadline = None
+            self.link_stats["retries"] += 1
+            log.debug("Re-requesting Ademco %s report after %s", report_type, reason)
+            self.sendCommand(STATUS_REQUESTS[report_type])
+
+    def _arm_request_timer(self, when: float) -> None:
+        call = self._request_call
+        if call is not None and not call.cancelled and call.when <= when:
+            return
+        if call is not None:
+            call.cancel()
+        self._request_call = self._scheduler.call_at(when, self._expire_requests)
+
+    def _expire_requests(self) -> None:
+        self._request_call = None
+        now = self._scheduler.time()
+        due = [
+            report_type
+            for report_type, pending in self._pending_requests.items()
+            if pending.deadline is not None and pending.deadline <= now
+        ]
+        if due:
+            self.link_stats["timeouts"] += len(due)
+            self._retry_requests(due, "a timeout")
+        deadlines = [
+            pending.deadline
+            for pending in self._pending_requests.values()
+            if pending.deadline is not None
+        ]
+        if deadlines:
+            self._arm_request_timer(min(deadlines))
+
+    def _clear_pending_requests(self) -> None:
+        self._pending_requests = {}
+        if self._request_call is not None:
+            self._request_call.cancel()
+            self._request_call = None
+
+    def _mark_startup(self, phase: str) -> None:
+        if self._startup_pending is not None and phase not in self.startup_timings:
+            self.startup_timings[phase] = self.loop.time() - self._start_time
+
+    def _note_startup_message(self, messageType: str) -> None:
+        self._mark_startup("first_frame")
+        if messageType == "ZS":
+            self._mark_startup("zone_sync")
+        self._startup_pending.discard(messageType)
+        if not self._startup_pending:
+            self._mark_startup("full_sync")
+            self._startup_pending = None
+
+    def _latch_zone(self, zone: "Zone") -> None:
+        """Hold ``zone`` latched until its latchSeconds after the close edge."""
+        when = self._scheduler.time() + zone.latchSeconds
+        self._latch_deadlines[zone.zoneNum] = when
+        self._arm_latch_timer(when)
+
+    def _unlatch_zone(self, zone: "Zone") -> None:
+        # The armed timer may now fire with nothing due; it just re-arms.
+        self._latch_deadlines.pop(zone.zoneNum, None)
+
+    def _arm_latch_timer(self, when: float) -> None:
+        call = self._latch_call
+        if call is not None and not call.cancelled and call.when <= when:
+            return
+        if call is not None:
+            call.cancel()
+        self._latch_call = self._scheduler.call_at(when, self._expire_latches)
+
+    def _expire_latches(self) -> None:
+        self._latch_call = None
+        now = self._scheduler.time()
+        expired = [
+            zone_num
+            for zone_num, when in self._latch_deadlines.items()
+            if when <= now
+        ]
+        for zone_num in expired:
+            del self._latch_deadlines[zone_num]
+        if self._latch_deadlines:
+            self._arm_latch_timer(min(self._latch_deadlines.values()))
+        for zone_num in expired:
+            self._zones[zone_num]._set_latched(False)
+
+    def snapshot(self) -> PanelSnapshot:
+        """Return an immutable view of zones, partitions and outputs.
+
+        The same object is returned until state changes, and only the
+        sections touched since the last snapshot are rebuilt.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        zones = self._snapshot_zones
+        if zones is None:
+            zones = tuple(zone._snapshot() for zone in self._zones.values())
+        elif self._dirty_zones:
+            rebuilt = list(zones)
+            for zone_id in self._dirty_zones:
+                rebuilt[zone_id - 1] = self._zones[zone_id]._snapshot()
+            zones = tuple(rebuilt)
+        self._dirty_zones.clear()
+        self._snapshot_zones = zones
+        if self._snapshot_partitions is None:
+            self._snapshot_partitions = MappingProxyType(
+                {
+                    partition_id: PartitionSnapshot(partition_id, partition.armStatus)
+                    for partition_id, partition in sorted(self._partitions.items())
+                }
+            )
+        if self._snapshot_outputs is None:
+            self._snapshot_outputs = frozenset(
+                output_id for output_id, output in self._outputs.items() if output.isOn
+            )
+        snapshot = self._snapshot = PanelSnapshot(
+            version=self.state_version,
+            connected=self.connected,
+            zones=zones,
+            partitions=self._snapshot_partitions,
+            outputs_on=self._snapshot_outputs,
+        )
+        return snapshot
 
-            await asyncio.sleep(REFRESH_INTERVAL)
+    def _state_changed(self) -> None:
+        self.state_version += 1
+        self._snapshot = None
+
+    def _zone_changed(self, zone: "Zone") -> None:
+        self._dirty_zones.add(zone.zoneNum)
+        self._state_changed()
 
     @property
     def zones(self) -> List["Zone"]:
@@ -265,6 +669,15 @@ class AlarmPanel:
             return []
         return sorted({int(partition_id) for partition_id in self._partitionReport if partition_id != "0"})
 
+    def getPartitionZones(self, partition_id: int) -> List["Zone"]:
+        """Return the zones assigned to a partition, cached per partition map."""
+        if self._partition_zones is None:
+            partition_zones: dict[int, list[Zone]] = {}
+            for zone in self._zones.values():
+                partition_zones.setdefault(zone.partition_id, []).append(zone)
+            self._partition_zones = partition_zones
+        return self._partition_zones.get(int(partition_id), [])
+
     def getZone(self, zoneId: int) -> "Zone":
         return self._zones.get(int(zoneId))
 
@@ -276,268 +689,430 @@ class AlarmPanel:
 
     async def listen(self):
         while not self._stopped:
-            if self.reader:
-                try:
-                    line = await self.reader.readline()
-                    self.handleMessage(line)
-                except CancelledError:
-                    break
-                except Exception:
-                    self._handle_disconnect()
-                    log.exception("Listen function threw exception")
-                    self.request_restart()
-                    break
-            else:
-                await asyncio.sleep(1)
-
-    def sendCommand(self, command: str):
-        if self._stopped or self.writer is None:
-            log.debug("Dropping Ademco command while disconnected: %s", command)
-            return
-
-        message = bytes(command + checksum(command), "utf-8") + b"\r\n"
-        self.writeQueue.put_nowait(message)
+            await self._link_up.wait()
+            try:
+                messages = await self._transport.read_messages()
+            except CancelledError:
+                break
+            except ConnectionError as err:
+                log.warning("Ademco connection lost: %s", err)
+                self._handle_disconnect()
+                continue
+            except Exception:
+                log.exception("Listen function threw exception")
+                self._handle_disconnect()
+                continue
+            for message in messages:
+                self.dispatchMessage(*message)
+
+    def sendCommand(
+        self, command: str, timeout: float | None = COMMAND_DEADLINE
+    ) -> asyncio.Future[None]:
+        """Queue a command and return a future that resolves once written.
+
+        Status requests are coalesced with an identical one still waiting.
+        Other commands are dropped with ``CommandExpired`` if they are not
+        written within ``timeout`` seconds, and raise ``CommandQueueFull``
+        when the queue has no room.
+        """
+        if self._stopped or not self.connected:
+            log.debug("Dropping Ademco command while disconnected")
+            return self.writeQueue.rejected("Ademco panel is not connected")
+
+        frame = encode_command(command)
+        if frame in REQUEST_FRAMES:
+            return self.writeQueue.put(frame, coalesce=True)
+        deadline = None if timeout is None else self.loop.time() + timeout
+        return self.writeQueue.put(frame, deadline)
 
     async def monitorWriteQueue(self):
         while not self._stopped:
-            if self.writer:
-                try:
-                    i = await self.writeQueue.get()
-                    log.debug("Sending Message: {}".format(i))
-                    self.writer.write(i)
-                    await self.writer.drain()
-                    await asyncio.sleep(1)
-                except CancelledError:
-                    break
-                except Exception:
-                    log.exception("Unexpected error in monitorWriteQueue:")
-                    self._handle_disconnect()
-                    self.request_restart()
-                    break
-            else:
-                await asyncio.sleep(2)
-
-    def _build_partition_control_command(
-        self, command: str, user_number: int | str, user_code: str
-    ) -> str:
-        user_number_str = str(user_number).strip()
-        user_code_str = str(user_code).strip()
-
-        if not user_number_str.isdigit():
-            raise ValueError("User number must be numeric")
-        if not user_code_str.isdigit():
-            raise ValueError("User code must be numeric")
-
-        if len(user_number_str) > 2:
-            raise ValueError("User number must be 1 or 2 digits")
-        if len(user_code_str) != 4:
-            raise ValueError("User code must be exactly 4 digits")
-
-        payload = f"{int(user_number_str):02d}{user_code_str}00"
-        return f"0E{command}{payload}"
-
-    def _build_keypad_command(self, partition_id: int | str, keys: str) -> str:
-        partition_str = str(partition_id).strip()
-        keys_str = str(keys).strip()
-
-        if not partition_str.isdigit():
-            raise ValueError("Partition must be numeric")
-        if len(partition_str) != 1:
-            raise ValueError("Partition must be a single digit")
-        if not keys_str or len(keys_str) > 5:
-            raise ValueError("Keypad command must be 1 to 5 keystrokes")
-        if not keys_str.isdigit():
-            raise ValueError("Keypad command must be numeric")
-
-        body = f"ks{partition_str}{keys_str}00"
-        length = len(body) + 4
-        return f"{length:02X}{body}"
-
-    def armAway(self, user_number: int | str, user_code: str) -> None:
-        self.sendCommand(
-            self._build_partition_control_command("aa", user_number, user_code)
+            await self._link_up.wait()
+            command = None
+            try:
+                command = await self.writeQueue.get()
+                # A caller that gives up cancels the future it was handed, so
+                # every outcome below checks it is still pending.
+                if not self._link_up.is_set():
+                    if not command.future.done():
+                        command.future.set_exception(
+                            CommandExpired("Ademco link was lost")
+                        )
+                    continue
+                for index, frame in enumerate(command.frames):
+                    if index:
+                        await asyncio.sleep(self._transport.write_interval)
+                    self.trace.record_tx(frame)
+                    await self._transport.write(frame)
+                if not command.future.done():
+                    command.future.set_result(None)
+                report_type = REQUEST_FRAMES.get(command.frame)
+                if report_type is not None:
+                    self._request_written(report_type)
+                await asyncio.sleep(self._transport.write_interval)
+            except CancelledError:
+                break
+            except Exception as err:
+                log.exception("Unexpected error in monitorWriteQueue:")
+                if command is not None and not command.future.done():
+                    command.future.set_exception(CommandExpired(str(err)))
+                self._handle_disconnect()
+
+    def armAway(
+        self, user_number: int | str, user_code: str
+    ) -> asyncio.Future[None]:
+        return self.sendCommand(
+            build_partition_control_command("aa", user_number, user_code)
         )
 
-    def armHome(self, user_number: int | str, user_code: str) -> None:
-        self.sendCommand(
-            self._build_partition_control_command("ah", user_number, user_code)
+    def armHome(
+        self, user_number: int | str, user_code: str
+    ) -> asyncio.Future[None]:
+        return self.sendCommand(
+            build_partition_control_command("ah", user_number, user_code)
         )
 
-    def disam(self, user_number: int | str, user_code: str) -> None:
-        self.sendCommand(
-            self._build_partition_control_command("ad", user_number, user_code)
+    def disam(
+        self, user_number: int | str, user_code: str
+    ) -> asyncio.Future[None]:
+        return self.sendCommand(
+            build_partition_control_command("ad", user_number, user_code)
         )
 
-    def sendKeypad(self, partition_id: int | str, keys: str) -> None:
-        self.sendCommand(self._build_keypad_command(partition_id, keys))
+    def sendKeypad(self, partition_id: int | str, keys: str) -> asyncio.Future[None]:
+        return self.sendCommand(build_keypad_command(partition_id, keys))
+
+    def sendKeypadSequence(
+        self,
+        partition_id: int | str,
+        keys: str,
+        timeout: float | None = COMMAND_DEADLINE,
+    ) -> asyncio.Future[None]:
+        """Send a keystroke sequence as back-to-back keypad frames.
+
+        Keystrokes accumulate on the panel across frames, so a long sequence
+        is split into the fewest frames the ks command allows. The frames are
+        queued as one command: ``timeout`` applies to the first frame, and
+        once it is written the rest follow without other commands in between.
+        A sequence is therefore sent whole or fails whole, never leaving a
+        half-entered sequence on the keypad.
+        """
+        frames = [
+            encode_command(
+                build_keypad_command(partition_id, keys[i : i + KEYPAD_MAX_KEYS])
+            )
+            for i in range(0, len(keys), KEYPAD_MAX_KEYS)
+        ]
+        if self._stopped or not self.connected:
+            log.debug("Dropping Ademco key sequence while disconnected")
+            return self.writeQueue.rejected("Ademco panel is not connected")
+        deadline = None if timeout is None else self.loop.time() + timeout
+        return self.writeQueue.put_sequence(frames, deadline)
 
     def bypassZone(
         self,
         partition_id: int | str,
         user_code: str,
         zone_number: int | str,
-    ) -> None:
-        zone_str = str(zone_number).strip()
-        code_str = str(user_code).strip()
+    ) -> asyncio.Future[None]:
+        return self.sendKeypadSequence(
+            partition_id, build_bypass_keys(user_code, [zone_number])
+        )
 
-        if not zone_str.isdigit():
-            raise ValueError("Zone number must be numeric")
-        if len(code_str) != 4 or not code_str.isdigit():
-            raise ValueError("User code must be exactly 4 digits")
+    def bypassZones(
+        self,
+        partition_id: int | str,
+        user_code: str,
+        zones: list[int | str],
+    ) -> asyncio.Future[set[int]]:
+        """Bypass several zones of one partition with a single key sequence.
+
+        Zones that are already bypassed are skipped, because the keypad
+        sequence toggles bypass. Returns a future that resolves with the zones
+        confirmed as bypassed by bypass events or the following zone report,
+        or fails with ``AdemcoError`` if the key sequence was not sent.
+        """
+        build_bypass_keys(user_code, zones)
+        requested = sorted({int(str(zone).strip()) for zone in zones})
+        if any(zone_id not in self._zones for zone_id in requested):
+            raise ValueError("Zone number must be between 1 and 96")
+        to_bypass = [
+            zone_id for zone_id in requested if not self._zones[zone_id].bypassed
+        ]
+        future: asyncio.Future[set[int]] = self.loop.create_future()
+        if not to_bypass:
+            future.set_result(set(requested))
+            return future
+
+        keys = build_bypass_keys(user_code, to_bypass)
+        sent = self.sendKeypadSequence(partition_id, keys)
+        self.zoneStatusRequest()
+        frame_count = -(-len(keys) // KEYPAD_MAX_KEYS)
+
+        already = set(requested) - set(to_bypass)
+        pending = set(to_bypass)
+        removers: list[Callable[[], None]] = []
+        timeout_call: ScheduledCall | None = None
+
+        def _release() -> None:
+            for remove in removers:
+                remove()
+            removers.clear()
+            if timeout_call is not None:
+                timeout_call.cancel()
+
+        def _finish() -> None:
+            _release()
+            if not future.done():
+                future.set_result(already | (set(to_bypass) - pending))
+
+        def _check() -> None:
+            for zone_id in list(pending):
+                if self._zones[zone_id].bypassed:
+                    pending.discard(zone_id)
+            if not pending:
+                _finish()
+
+        def _sent(result: asyncio.Future[None]) -> None:
+            # The sequence never reached the panel, so nothing will confirm.
+            if result.cancelled() or result.exception() is None:
+                return
+            _release()
+            if not future.done():
+                future.set_exception(result.exception())
+
+        for zone_id in to_bypass:
+            removers.append(self._zones[zone_id].registerCallback(_check))
+        sent.add_done_callback(_sent)
+        interval = self._transport.write_interval if self._transport else 0
+        timeout_call = self._scheduler.call_later(
+            BYPASS_CONFIRM_TIMEOUT + (frame_count + 1) * interval, _finish
+        )
+        return future
 
-        # Emulate keypad entry: [code][6] then [zone], which is how single-zone
-        # bypass is exposed on VISTA keypads.
-        self.sendKeypad(partition_id, f"{code_str}6")
-        self.sendKeypad(partition_id, f"{int(zone_str):03d}")
+    def scheduleOutput(
+        self,
+        output_id: int | str,
+        pattern: list[tuple[bool, float]],
+        repeat: int | None = 1,
+        delay: float = 0,
+    ) -> "OutputSchedule":
+        """Run a timed on/off pattern on an output.
+
+        ``pattern`` is a list of ``(on, seconds)`` steps: each step sets the
+        output and holds it for ``seconds`` before the next one. The pattern
+        runs ``repeat`` times, or until cancelled when ``repeat`` is ``None``.
+        Steps are timed by the panel scheduler and their commands go through
+        the write queue in order with everything else. A new schedule, or a
+        direct turnOn/turnOff, replaces the output's running schedule.
+        """
+        output = self.getOutput(output_id)
+        if output is None:
+            raise ValueError(f"Unknown output {output_id}")
+        schedule = OutputSchedule(self, output, pattern, repeat)
+        output._set_schedule(schedule)
+        schedule._start(delay)
+        return schedule
+
+    def pulseOutput(self, output_id: int | str, seconds: float) -> "OutputSchedule":
+        """Turn an output on now and off again after ``seconds``.
+
+        The off command is queued by the panel scheduler, so it is sent even
+        if the caller goes away. Cancel the returned schedule to keep the
+        output on.
+        """
+        return self.scheduleOutput(output_id, [(True, seconds), (False, 0)])
+
+    def setOutputFor(
+        self, output_id: int | str, on: bool, seconds: float
+    ) -> "OutputSchedule":
+        """Hold an output on (or off) for ``seconds``, then flip it back."""
+        return self.scheduleOutput(output_id, [(on, seconds), (not on, 0)])
 
     def armingStatusRequest(self):
-        self.sendCommand("08as00")
+        self.sendCommand(STATUS_REQUESTS["AS"])
 
     def zoneStatusRequest(self):
-        self.sendCommand("08zs00")
+        self.sendCommand(STATUS_REQUESTS["ZS"])
 
     def zonePartitionRequest(self):
-        self.sendCommand("08zp00")
+        self.sendCommand(STATUS_REQUESTS["ZP"])
 
     def outputStatusRequest(self):
-        self.sendCommand("08cs00")
+        self.sendCommand(STATUS_REQUESTS["CS"])
 
     def handleMessage(self, message: bytes):
-        message = message.lstrip(
-            b"P"
-        )  # Remove Ps that occasionally get sent without newlines
-        try:
-            message = message.decode("ASCII")
-        except UnicodeDecodeError:
-            log.warning("Ignoring undecodable Ademco payload: %r", message)
-            return
-        message = message.rstrip("\r\n")
-        if not message:  # If the P was received without new line skip it silently
+        parsed = parse_message(message)
+        if parsed is not None:
+            self.dispatchMessage(*parsed)
+
+    def dispatchMessage(self, messageType: str, data: str | None):
+        """Apply a validated message.
+
+        ``data`` is ``None`` when an I/O thread already saw an identical
+        report, so there is nothing to reapply.
+        """
+        self.trace.record_rx(messageType, data)
+        if messageType == CORRUPT_FRAME:
+            self.processCorruptFrame(data)
             return
-        log.debug("Received Message: {} ".format(message))
-        if not message[-2:] == checksum(message[:-2]):
-            log.critical(
-                "Received invalid checksum: {}, Calculated: {}".format(
-                    message, checksum(message[:-2])
-                )
-            )
-            return
-        length = int(message[0:2], 16)  # convert overall packet length to int
-        messageType = message[2:4]
-        dataLen = (
-            length - 8
-        )  # length =  packetLength:2 + packetType:2 + reserved:2    Don't include checksum:2
-        data = message[4 : 4 + dataLen]
-        mapping = {
-            "ZS": self.processZoneStatusReport,
-            "ZP": self.processZonePartionReport,
-            "CS": self.processOutputStatusReport,
-            "AS": self.processArmingStatusReport,
-            "NQ": self.processSystemEvent,
-            "OK": self.processOK,
-        }
-        if messageType in mapping.keys():
-            mapping[messageType](data)
+        self._reconnect_attempts = 0  # a valid frame proves the link is healthy
+        self.link_stats["frames"] += 1
+        if self._pending_requests and messageType in REPORT_TYPES:
+            self._request_answered(messageType)
+        if self._startup_pending is not None:
+            self._note_startup_message(messageType)
+        # Marked before the handler so entity callbacks it fires already see
+        # their data as ready. A repeated report still proves freshness.
+        became_ready = self._note_report(messageType)
+        handler = self._handlers.get(messageType)
+        if data is None:
+            repeat_handler = self._repeat_handlers.get(messageType)
+            if repeat_handler is not None:
+                repeat_handler()
+        elif handler is not None:
+            handler(data)
         else:
-            log.critical("Unhandled message type receieved:" + message)
+            log.critical("Unhandled message type receieved: %s%s", messageType, data)
+        if became_ready:
+            self._notify_callbacks()
+
+    def processCorruptFrame(self, data):
+        """Re-request whatever report the lost frame may have carried."""
+        self.link_stats["corrupt"] += 1
+        waiting = [
+            report_type
+            for report_type, pending in self._pending_requests.items()
+            if pending.deadline is not None
+        ]
+        if waiting:
+            self._retry_requests(waiting, "a corrupt frame")
+        elif self.is_initialized and "ZS" not in self._pending_requests:
+            # Nothing was asked for, so it was most likely an event; zone
+            # bits are the only state events change.
+            now = self._scheduler.time()
+            last = self._corrupt_reread_at
+            if last is None or now - last >= CORRUPT_REREAD_INTERVAL:
+                self._corrupt_reread_at = now
+                self.zoneStatusRequest()
 
     def processOK(self, data):
         # No need to do anything with OK
         pass
 
     def processZoneStatusReport(self, data):
-        for z, s in enumerate(data):
-            self._zones[z + 1].proccessStatus(int(s))
+        self._apply_records(self._protocol.apply_zone_status(data))
+        self._zone_report_received()
+
+    def _zone_report_received(self) -> None:
         self._set_initialized(True)
+        if self._refresh_awaiting_zones:
+            # The zone report is in; no need to sit out the settle delay.
+            self._cancel_refresh()
+            self._continue_refresh()
 
     def processArmingStatusReport(self, data):
-        changed = False
-        for p, s in enumerate(data):
-            partition_id = p + 1
-            partition = self._partitions.get(partition_id)
-            if partition is None:
-                self._partitions[partition_id] = Partition(self, partition_id, s)
-                changed = True
-            else:
-                changed = partition.proccessStatus(s) or changed
-        if changed:
+        records = self._protocol.apply_arming_status(data)
+        if records:
+            self._apply_records(records)
+            self._snapshot_partitions = None
+            self._state_changed()
             self._notify_callbacks()
 
     def processZonePartionReport(self, data):
-        if data != self._partitionReport:
-            self._partitionReport = data
-            self._notify_callbacks()
+        self._apply_records(self._protocol.apply_zone_partitions(data))
 
     def processOutputStatusReport(self, data):
-        for o, s in enumerate(data):
-            if s == "U":
+        self._apply_records(self._protocol.apply_output_status(data))
+        self._output_report = data
+        self._confirm_outputs()
+
+    def _confirm_outputs(self) -> None:
+        # Confirm pending schedules even when the report changed nothing.
+        data = self._output_report
+        for output in self._outputs.values():
+            if output._confirming is None:
                 continue
-            output_id = o + 1
-            output = self._outputs.get(output_id)
-            if output is None:
-                self._outputs[output_id] = Output(self, output_id, s)
-            else:
-                output.update_status(s)
+            reported = data[output.outputId - 1 : output.outputId]
+            if reported and reported != "U":
+                output._confirming._confirm(output.isOn)
+
+    def registerEventCallback(self, cb: Callable[[dict[str, Any]], None]):
+        """Call ``cb`` with every decoded NQ system event."""
+        self._event_callbacks.append(cb)
+
+        def _remove_callback() -> None:
+            if cb in self._event_callbacks:
+                self._event_callbacks.remove(cb)
+
+        return _remove_callback
 
     def processSystemEvent(self, data):
-        et = data[0:2]
-        zoneOrUser = int(data[2:4], 16)+1
-        # min = int(data[4:6])
-        # hour = int(data[6:8])
-        # day = int(data[8:10])
-        # month = int(data[10:12])
-        # time = datetime.time(min,hour)
-
-        desc = ""
-
-        if et == "00":
-            desc = "Perimeter Alarm"
-
-        # "01": "Entry/Exit Alarm",
-        # "04": "Interior Follower Alarm",
-        # "06": "Fire Alarm",
-        # "07": "Audible Panic Alarm",
-        # "08": "Silent Panic Alarm",
-        # "09": "24-Hr. Auxiliary",
-        # "0C": "Duress Alarm",
-        # "0E": "Other Alarm Restores",
-        # "0F": "RF Low Battery",
-        # "10": "RF Low Battery Restore",
-        # "15": "Arm-Stay/Home",
-        # "16": "Disarm",
-        # "18": "Arm",
-        # "1A": "Low Battery",
-        # "1B": "Low Battery Restore",
-        # "1C": "AC Fail",
-        # "1D": "AC Restore",
-        # "20": "Alarm Cancel",
-        # "23": "Day/Night Alarm",
-        # "24": "Day/Night Restore",
-        # "27": "Fail To Disarm",
-        # "28": "Fail To Arm",
-
-        elif et == "11":
-            desc = "Other Trouble"
-            self.getZone(zoneOrUser).trouble = True
-        elif et == "12":
-            desc = "Other Trouble Restore"
-            self.getZone(zoneOrUser).trouble = False
-        elif et == "21":
-            desc = "Other Bypass"
-            self.getZone(zoneOrUser).bypassed = True
-        elif et == "22":
-            desc = "Other Unbypass"
-            self.getZone(zoneOrUser).bypassed = False
-        elif et == "2B":
-            desc = "Faults"
-            self.getZone(zoneOrUser).opened = True
-        elif et == "2C":
-            desc = "FaultRestore"
-            self.getZone(zoneOrUser).opened = False
-
-        log.debug("Zone:{} - {}:{}".format(zoneOrUser, et, desc))
-
-        # log.critical("Unhandled Device Type for system event" + data)
+        self._apply_records(self._protocol.apply_system_event(data))
+
+    def _apply_records(self, records: list[Record]) -> None:
+        """Mirror protocol records onto the zone, partition and output objects.
+
+        Callbacks run once every record is applied, each at most once.
+        """
+        handlers = self._record_handlers
+        if self._deferred is not None:
+            for record in records:
+                handlers[type(record)](record)
+            return
+        deferred = self._deferred = []
+        try:
+            for record in records:
+                handlers[type(record)](record)
+        finally:
+            self._deferred = None
+        self._run_callbacks(list(dict.fromkeys(deferred)))
+
+    def _apply_zone_status(self, record: ZoneStatusChanged) -> None:
+        self._zones[record.zone_id].proccessStatus(record.status)
+
+    def _apply_partition_map(self, record: PartitionMapChanged) -> None:
+        self._partitionReport = record.report
+        self.partition_map_version += 1
+        self._partition_zones = None
+        # Every zone's partition may have moved.
+        self._snapshot_zones = None
+        self._state_changed()
+        self._notify_callbacks()
+
+    def _apply_partition_status(self, record: PartitionStatusChanged) -> None:
+        partition = self._partitions.get(record.partition_id)
+        if partition is None:
+            self._partitions[record.partition_id] = Partition(
+                self, record.partition_id, record.status
+            )
+        else:
+            partition.proccessStatus(record.status)
+
+    def _apply_output_status(self, record: OutputStatusChanged) -> None:
+        self._outputs[record.output_id]._set_status(record.status)
+
+    def _apply_system_event(self, record: SystemEvent) -> None:
+        event = record.event
+        log.debug(
+            "Zone/User:%s - %s:%s",
+            event["zone"] or event["user"],
+            event["code"],
+            event["description"],
+        )
+        self._run_callbacks([partial(cb, event) for cb in self._event_callbacks])
+
+
+class PendingRequest:
+    """A written status request that has not been answered yet."""
+
+    __slots__ = ("attempts", "sent_at", "deadline")
+
+    def __init__(self) -> None:
+        self.attempts = 0
+        self.sent_at: float | None = None
+        # None while a retry is queued but not yet written.
+        self.deadline: float | None = None
 
 
 class Partition:
@@ -558,7 +1133,7 @@ class Partition:
 
     def proccessStatus(self, status: str):
         if status not in ["A", "H", "D", "N"]:
-            log.critical("Invalid partition status received {}".format(status))
+            log.critical("Invalid partition status received %s", status)
             return False
         if status != self.armStatus:
             self.armStatus = status
@@ -574,6 +1149,9 @@ class Zone:
         self.bitStatus = ["0","0","0","0"]
         self.callbackList = []
         self.latchSeconds = latchSeconds
+        # True while a closed zone is held active for latchSeconds.
+        self.latched = False
+        self._was_open = False
         if zoneStatus:
             self.proccessStatus(zoneStatus)  # binary form of status
 
@@ -588,9 +1166,26 @@ class Zone:
             self._updated()
     
     def _updated(self):
-        for cb in self.callbackList:
-            cb()
-    
+        is_open = self.opened
+        if is_open != self._was_open:
+            self._was_open = is_open
+            if is_open:
+                self.latched = False
+                self._alarmPanel._unlatch_zone(self)
+            elif self.latchSeconds > 0:
+                self.latched = True
+                self._alarmPanel._latch_zone(self)
+        # Setters change bits outside of reports; keep the protocol in step.
+        self._alarmPanel._protocol.zone_status[self.zoneNum - 1] = self.status
+        self._alarmPanel._zone_changed(self)
+        self._alarmPanel._run_callbacks(self.callbackList)
+
+    def _set_latched(self, latched: bool) -> None:
+        if self.latched != latched:
+            self.latched = latched
+            self._alarmPanel._zone_changed(self)
+            self._alarmPanel._run_callbacks(self.callbackList)
+
     def registerCallback(self, cb):
         self.callbackList.append(cb)
 
@@ -600,6 +1195,24 @@ class Zone:
 
         return _remove_callback
 
+    @property
+    def status(self) -> int:
+        """Status bits as reported: 1-Open, 2-Trouble, 4-Alarm, 8-Bypassed."""
+        return int("".join(self.bitStatus), 2)
+
+    def _snapshot(self) -> ZoneSnapshot:
+        return ZoneSnapshot(
+            zone_id=self.zoneNum,
+            status=self.status,
+            partition_id=self.partition_id,
+            latched=self.latched,
+        )
+
+    @property
+    def active(self) -> bool:
+        """Return whether the zone is open or still latched after closing."""
+        return self.opened or self.latched
+
     @property
     def partionId(self) -> int:
         if not self._alarmPanel._partitionReport:
@@ -687,6 +1300,21 @@ class Output:
         self._alarmPanel = alarmPanel
         self.outputId = outputId
         self._status = int(status)  # binary form of status
+        self.callbackList = []
+        self._schedule: OutputSchedule | None = None
+        self._confirming: OutputSchedule | None = None
+
+    def _updated(self):
+        self._alarmPanel._run_callbacks(self.callbackList)
+
+    def registerCallback(self, cb):
+        self.callbackList.append(cb)
+
+        def _remove_callback() -> None:
+            if cb in self.callbackList:
+                self.callbackList.remove(cb)
+
+        return _remove_callback
 
     @property
     def isOff(self) -> bool:
@@ -700,18 +1328,168 @@ class Output:
             return True
         return False
 
-    def turnOn(self):
-        c = "0Acn{:0>2}00".format(self.outputId)
-        self._alarmPanel.sendCommand(c)
-        self._status = 1
+    @property
+    def schedule(self) -> "OutputSchedule | None":
+        return self._schedule
+
+    def turnOn(self) -> asyncio.Future[None]:
+        self._set_schedule(None)
+        return self._send(True)
+
+    def turnOff(self) -> asyncio.Future[None]:
+        self._set_schedule(None)
+        return self._send(False)
+
+    def _send(self, on: bool) -> asyncio.Future[None]:
+        sent = self._alarmPanel.sendCommand(build_output_command(self.outputId, on))
+        sent.add_done_callback(self._command_done)
+        self._set_status(1 if on else 0)
+        return sent
+
+    def _command_done(self, sent: asyncio.Future[None]) -> None:
+        # The optimistic status above is wrong if the command was dropped.
+        if not sent.cancelled() and sent.exception() is not None:
+            self._alarmPanel.outputStatusRequest()
+
+    def _set_schedule(self, schedule: "OutputSchedule | None") -> None:
+        previous = self._schedule
+        if previous is schedule:
+            return
+        self._schedule = schedule
+        if previous is not None:
+            previous.cancel()
+        # Entities show whether a schedule is running.
+        self._updated()
+
+    def _schedule_ended(self, schedule: "OutputSchedule") -> None:
+        if self._schedule is schedule:
+            self._schedule = None
+            self._updated()
 
-    def turnOff(self):
-        c = "0Acf{:0>2}00".format(self.outputId)
-        self._alarmPanel.sendCommand(c)
-        self._status = 0
+    def _set_status(self, status: int) -> None:
+        if status != self._status:
+            self._status = status
+            # Keep the protocol in step with optimistic updates, so the next
+            # report is diffed against what entities show.
+            self._alarmPanel._protocol.output_status[self.outputId - 1] = status
+            self._alarmPanel._snapshot_outputs = None
+            self._alarmPanel._state_changed()
+            self._updated()
 
     def update_status(self, status: int | str) -> None:
-        self._status = int(status)
+        self._set_status(int(status))
+        if self._confirming is not None:
+            self._confirming._confirm(self.isOn)
+
+
+class OutputSchedule:
+    """Timed on/off pattern for one output, driven by the panel scheduler."""
+
+    def __init__(
+        self,
+        alarmPanel: AlarmPanel,
+        output: Output,
+        pattern: list[tuple[bool, float]],
+        repeat: int | None,
+    ) -> None:
+        if not pattern:
+            raise ValueError("Output pattern needs at least one step")
+        if any(seconds < 0 for _, seconds in pattern):
+            raise ValueError("Output pattern durations must not be negative")
+        if repeat is not None and repeat < 1:
+            raise ValueError("Output pattern must repeat at least once")
+        self._alarmPanel = alarmPanel
+        self.output = output
+        self._pattern = [(bool(on), float(seconds)) for on, seconds in pattern]
+        self._remaining = repeat
+        self._index = 0
+        self._call: ScheduledCall | None = None
+        self._expected: bool | None = None
+        self.cancelled = False
+        # Resolves True once a CS report confirms the final state, False if it
+        # disagrees, times out or the schedule is cancelled.
+        self.done: asyncio.Future[bool] = alarmPanel.loop.create_future()
+        # Set when a step's command was not sent; the schedule is cancelled.
+        self.error: AdemcoError | None = None
+
+    @property
+    def active(self) -> bool:
+        return not self.cancelled and self._expected is None
+
+    def cancel(self) -> None:
+        """Stop the pattern; the output keeps its current state."""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        if self._call is not None:
+            self._call.cancel()
+            self._call = None
+        self.output._schedule_ended(self)
+        if self.output._confirming is self:
+            self.output._confirming = None
+        if not self.done.done():
+            self.done.set_result(False)
+
+    def _start(self, delay: float) -> None:
+        if delay > 0:
+            self._call = self._alarmPanel._scheduler.call_later(delay, self._step)
+        else:
+            self._step()
+
+    def _step(self) -> None:
+        self._call = None
+        on, seconds = self._pattern[self._index]
+        try:
+            sent = self.output._send(on)
+        except CommandQueueFull as err:
+            self.error = err
+            self.cancel()
+            raise
+        sent.add_done_callback(self._command_done)
+        self._index += 1
+        if self._index == len(self._pattern):
+            self._index = 0
+            if self._remaining is not None:
+                self._remaining -= 1
+                if self._remaining == 0:
+                    self._await_confirmation(on)
+                    return
+        self._call = self._alarmPanel._scheduler.call_later(seconds, self._step)
+
+    def _command_done(self, sent: asyncio.Future[None]) -> None:
+        if sent.cancelled() or sent.exception() is None or self.done.done():
+            return
+        log.warning(
+            "Output %s schedule stopped: %s", self.output.outputId, sent.exception()
+        )
+        self.error = sent.exception()
+        self.cancel()
+
+    def _await_confirmation(self, expected: bool) -> None:
+        self._expected = expected
+        self.output._schedule_ended(self)
+        self.output._confirming = self
+        # Queued behind the final command, so the report reflects it.
+        self._alarmPanel.outputStatusRequest()
+        self._call = self._alarmPanel._scheduler.call_later(
+            OUTPUT_CONFIRM_TIMEOUT, self._confirm, None
+        )
+
+    def _confirm(self, is_on: bool | None) -> None:
+        if self._call is not None:
+            self._call.cancel()
+            self._call = None
+        if self.output._confirming is self:
+            self.output._confirming = None
+        confirmed = is_on is not None and is_on == self._expected
+        if not confirmed:
+            log.warning(
+                "Output %s was not confirmed %s by the panel",
+                self.output.outputId,
+                "on" if self._expected else "off",
+            )
+        if not self.done.done():
+            self.done.set_result(confirmed)
 
 
 # loop= asyncio.get_event_loop()
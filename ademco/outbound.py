@@ -0,0 +1,192 @@
+"""Bounded outbound command queue for an Ademco panel."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+
+log = logging.getLogger(__name__)
+
+# Control commands allowed to wait for the writer at once.
+WRITE_QUEUE_SIZE = 16
+# A control command not written within this many seconds is dropped rather
+# than actuating late.
+COMMAND_DEADLINE = 10
+
+
+class AdemcoError(Exception):
+    """Base class for errors raised by the Ademco panel runtime."""
+
+
+class CommandQueueFull(AdemcoError):
+    """The outbound queue has no room; the command was not queued."""
+
+
+class CommandExpired(AdemcoError):
+    """A queued command was dropped before it reached the panel."""
+
+
+def _consume(future: asyncio.Future) -> None:
+    # Callers may never await a command; fetching the exception here keeps
+    # asyncio from logging it as never retrieved.
+    if not future.cancelled():
+        future.exception()
+
+
+class OutboundCommand:
+    """One framed command, or an unbroken frame sequence, for the writer."""
+
+    __slots__ = ("frames", "deadline", "coalesce", "future")
+
+    def __init__(
+        self,
+        frames: tuple[bytes, ...],
+        deadline: float | None,
+        coalesce: bool,
+        future: asyncio.Future[None],
+    ) -> None:
+        self.frames = frames
+        # Checked once, before the first frame; a sequence that has started
+        # is always written to the end.
+        self.deadline = deadline
+        self.coalesce = coalesce
+        # Resolves once every frame is written, or fails with CommandExpired.
+        self.future = future
+
+    @property
+    def frame(self) -> bytes:
+        return self.frames[0]
+
+
+class OutboundQueue:
+    """FIFO of framed commands with a size limit, deadlines and coalescing.
+
+    Control commands count against ``maxsize`` and carry a deadline; ``put``
+    raises ``CommandQueueFull`` instead of growing the queue. A poll is
+    coalesced with an identical poll queued after the last control command,
+    so it is still written after everything queued before it. That allows at
+    most one poll of each kind between two control commands, which bounds
+    polls without a limit of their own. Commands that pass their deadline are
+    failed with ``CommandExpired`` when the writer reaches them. A frame
+    sequence is queued as one command, so it is written whole or not at all.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, maxsize: int = WRITE_QUEUE_SIZE
+    ) -> None:
+        self._loop = loop
+        self.maxsize = maxsize
+        self._items: deque[OutboundCommand] = deque()
+        # Frame -> poll queued after the last control command; only these
+        # can be coalesced without reordering.
+        self._tail_polls: dict[bytes, OutboundCommand] = {}
+        self._controls = 0
+        self._waiter: asyncio.Future[None] | None = None
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def free(self) -> int:
+        """Room left for control commands."""
+        return self.maxsize - self._controls
+
+    def put(
+        self,
+        frame: bytes,
+        deadline: float | None = None,
+        coalesce: bool = False,
+    ) -> asyncio.Future[None]:
+        """Queue ``frame`` and return a future for its write."""
+        if coalesce:
+            waiting = self._tail_polls.get(frame)
+            if waiting is not None:
+                return waiting.future
+        elif self._controls >= self.maxsize:
+            raise CommandQueueFull(
+                f"Ademco command queue is full ({self.maxsize} commands waiting)"
+            )
+        return self._append(
+            OutboundCommand((frame,), deadline, coalesce, self._future())
+        )
+
+    def put_sequence(
+        self, frames: list[bytes], deadline: float | None = None
+    ) -> asyncio.Future[None]:
+        """Queue ``frames`` to be written back to back as one command.
+
+        Each frame counts against ``maxsize``. The deadline applies to the
+        start of the sequence, and no other command is written in between.
+        """
+        if not frames:
+            raise ValueError("Empty frame sequence")
+        if self._controls + len(frames) > self.maxsize:
+            raise CommandQueueFull(
+                f"Ademco command queue has no room for {len(frames)} frames"
+            )
+        return self._append(
+            OutboundCommand(tuple(frames), deadline, False, self._future())
+        )
+
+    def _future(self) -> asyncio.Future[None]:
+        future = self._loop.create_future()
+        future.add_done_callback(_consume)
+        return future
+
+    def _append(self, command: OutboundCommand) -> asyncio.Future[None]:
+        self._items.append(command)
+        if command.coalesce:
+            self._tail_polls[command.frame] = command
+        else:
+            self._controls += len(command.frames)
+            self._tail_polls = {}
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+        return command.future
+
+    async def get(self) -> OutboundCommand:
+        """Return the next command that is still within its deadline."""
+        while True:
+            while self._items:
+                command = self._pop()
+                if command.deadline is not None and self._loop.time() > command.deadline:
+                    self.expired += 1
+                    log.warning("Dropping Ademco command that missed its deadline")
+                    if not command.future.done():
+                        command.future.set_exception(
+                            CommandExpired(
+                                "Ademco command was not sent before its deadline"
+                            )
+                        )
+                    continue
+                return command
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+    def _pop(self) -> OutboundCommand:
+        command = self._items.popleft()
+        if command.coalesce:
+            if self._tail_polls.get(command.frame) is command:
+                del self._tail_polls[command.frame]
+        else:
+            self._controls -= len(command.frames)
+        return command
+
+    def rejected(self, reason: str) -> asyncio.Future[None]:
+        """Return an already failed future for a command that was not queued."""
+        future = self._future()
+        future.set_exception(CommandExpired(reason))
+        return future
+
+    def clear(self, reason: str) -> None:
+        """Fail every waiting command, e.g. when the link drops."""
+        while self._items:
+            command = self._pop()
+            if not command.future.done():
+                command.future.set_exception(CommandExpired(reason))
+        self._tail_polls = {}
@@ -0,0 +1,404 @@
+"""Sans-I/O core of the Ademco home automation protocol.
+
+Framing, checksums, command building and report application live here with
+no event loop, tasks or transport. ``PanelProtocol`` consumes raw bytes or
+parsed messages and returns state-change records; ``AlarmPanel`` drives it
+over a transport and applies the records to its zones, partitions and
+outputs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+# Full-state reports; a repeat of the previous report carries no new state.
+REPORT_TYPES = frozenset({"ZS", "ZP", "CS", "AS"})
+
+# Message type given to lines that failed decoding or the checksum; the
+# data is the line as received.
+CORRUPT_FRAME = "??"
+
+ZONE_COUNT = 96
+OUTPUT_COUNT = 96
+
+# Zone status bits, as reported in ZS: 1-Open, 2-Trouble, 4-Alarm, 8-Bypassed.
+ZONE_OPEN = 0x1
+ZONE_TROUBLE = 0x2
+ZONE_ALARM = 0x4
+ZONE_BYPASSED = 0x8
+
+PARTITION_STATUSES = frozenset({"A", "H", "D", "N"})
+
+# Full-state report requests, by the report type they answer with.
+STATUS_REQUESTS = {
+    "ZS": "08zs00",
+    "ZP": "08zp00",
+    "CS": "08cs00",
+    "AS": "08as00",
+}
+
+# NQ system event codes -> (event type, category, description, subject).
+# The subject says whether the two digits after the code name a zone or a user.
+SYSTEM_EVENTS: dict[str, tuple[str, str, str, str | None]] = {
+    "00": ("perimeter_alarm", "alarm", "Perimeter Alarm", "zone"),
+    "01": ("entry_exit_alarm", "alarm", "Entry/Exit Alarm", "zone"),
+    "04": ("interior_follower_alarm", "alarm", "Interior Follower Alarm", "zone"),
+    "06": ("fire_alarm", "fire", "Fire Alarm", "zone"),
+    "07": ("audible_panic", "panic", "Audible Panic Alarm", "zone"),
+    "08": ("silent_panic", "panic", "Silent Panic Alarm", "zone"),
+    "09": ("auxiliary_alarm", "alarm", "24-Hr. Auxiliary", "zone"),
+    "0C": ("duress", "panic", "Duress Alarm", "user"),
+    "0E": ("alarm_restore", "alarm_restore", "Other Alarm Restores", "zone"),
+    "0F": ("rf_low_battery", "trouble", "RF Low Battery", "zone"),
+    "10": ("rf_low_battery_restore", "trouble_restore", "RF Low Battery Restore", "zone"),
+    "11": ("trouble", "trouble", "Other Trouble", "zone"),
+    "12": ("trouble_restore", "trouble_restore", "Other Trouble Restore", "zone"),
+    "15": ("arm_stay", "arm", "Arm-Stay/Home", "user"),
+    "16": ("disarm", "disarm", "Disarm", "user"),
+    "18": ("arm_away", "arm", "Arm", "user"),
+    "1A": ("low_battery", "trouble", "Low Battery", None),
+    "1B": ("low_battery_restore", "trouble_restore", "Low Battery Restore", None),
+    "1C": ("ac_fail", "ac_fail", "AC Fail", None),
+    "1D": ("ac_restore", "ac_restore", "AC Restore", None),
+    "20": ("alarm_cancel", "disarm", "Alarm Cancel", "user"),
+    "21": ("bypass", "bypass", "Other Bypass", "zone"),
+    "22": ("unbypass", "unbypass", "Other Unbypass", "zone"),
+    "23": ("day_night_alarm", "alarm", "Day/Night Alarm", "zone"),
+    "24": ("day_night_restore", "alarm_restore", "Day/Night Restore", "zone"),
+    "27": ("fail_to_disarm", "trouble", "Fail To Disarm", "user"),
+    "28": ("fail_to_arm", "trouble", "Fail To Arm", "user"),
+    "2B": ("fault", "fault", "Faults", "zone"),
+    "2C": ("fault_restore", "fault_restore", "FaultRestore", "zone"),
+}
+
+# NQ event codes that change a zone's status bits -> (bit, set).
+EVENT_ZONE_BITS: dict[str, tuple[int, bool]] = {
+    "11": (ZONE_TROUBLE, True),
+    "12": (ZONE_TROUBLE, False),
+    "21": (ZONE_BYPASSED, True),
+    "22": (ZONE_BYPASSED, False),
+    "2B": (ZONE_OPEN, True),
+    "2C": (ZONE_OPEN, False),
+}
+
+
+def twos_comp(val, bits):
+    """compute the 2's complement of int value val"""
+    if (val & (1 << (bits - 1))) != 0:  # if sign bit is set e.g., 8bit: 128-255
+        val = val - (1 << bits)  # compute negative value
+    return val
+
+
+def checksum(s: str) -> str:
+    tot = 0
+    for l in s:
+        tot = tot + ord(l)
+    tot = ((tot % 256) * -1) % 256
+    i = "%.2X" % (twos_comp(tot, 256))
+    return i
+
+
+def decode_system_event(data: str) -> dict[str, Any] | None:
+    """Decode the data of an NQ message into an event dictionary.
+
+    Returns ``None`` for short data. Unknown codes are still returned with
+    type and category ``unknown`` so callers can log or forward them.
+    """
+    if len(data) < 4:
+        return None
+    code = data[0:2].upper()
+    try:
+        number = int(data[2:4], 16) + 1
+    except ValueError:
+        return None
+    event_type, category, description, subject = SYSTEM_EVENTS.get(
+        code, ("unknown", "unknown", f"Event {code}", None)
+    )
+    return {
+        "code": code,
+        "type": event_type,
+        "category": category,
+        "description": description,
+        "zone": number if subject == "zone" else None,
+        "user": number if subject == "user" else None,
+    }
+
+
+def parse_message(message: bytes) -> tuple[str, str] | None:
+    """Validate one raw panel line and return ``(message_type, data)``.
+
+    Returns ``None`` for blank lines and ``(CORRUPT_FRAME, line)`` for lines
+    that are undecodable or fail the checksum, so the caller can resync.
+    """
+    message = message.lstrip(
+        b"P"
+    )  # Remove Ps that occasionally get sent without newlines
+    try:
+        message = message.decode("ASCII")
+    except UnicodeDecodeError:
+        log.warning("Ignoring undecodable Ademco payload: %r", message)
+        return CORRUPT_FRAME, repr(message)
+    message = message.rstrip("\r\n")
+    if not message:  # If the P was received without new line skip it silently
+        return None
+    expected = checksum(message[:-2])
+    if message[-2:] != expected:
+        log.warning(
+            "Received invalid checksum: %s, Calculated: %s", message, expected
+        )
+        return CORRUPT_FRAME, message
+    try:
+        length = int(message[0:2], 16)  # convert overall packet length to int
+    except ValueError:
+        log.warning("Received malformed Ademco frame: %s", message)
+        return CORRUPT_FRAME, message
+    messageType = message[2:4]
+    dataLen = (
+        length - 8
+    )  # length =  packetLength:2 + packetType:2 + reserved:2    Don't include checksum:2
+    data = message[4 : 4 + dataLen]
+    return messageType, data
+
+
+def encode_command(command: str) -> bytes:
+    """Frame a command for the wire: checksum appended, CRLF terminated."""
+    return bytes(command + checksum(command), "utf-8") + b"\r\n"
+
+
+def build_partition_control_command(
+    command: str, user_number: int | str, user_code: str
+) -> str:
+    """Build an arm away (aa), arm home (ah) or disarm (ad) command."""
+    user_number_str = str(user_number).strip()
+    user_code_str = str(user_code).strip()
+
+    if not user_number_str.isdigit():
+        raise ValueError("User number must be numeric")
+    if not user_code_str.isdigit():
+        raise ValueError("User code must be numeric")
+
+    if len(user_number_str) > 2:
+        raise ValueError("User number must be 1 or 2 digits")
+    if len(user_code_str) != 4:
+        raise ValueError("User code must be exactly 4 digits")
+
+    payload = f"{int(user_number_str):02d}{user_code_str}00"
+    return f"0E{command}{payload}"
+
+
+def build_keypad_command(partition_id: int | str, keys: str) -> str:
+    """Build one ks keypad frame of up to five keystrokes."""
+    partition_str = str(partition_id).strip()
+    keys_str = str(keys).strip()
+
+    if not partition_str.isdigit():
+        raise ValueError("Partition must be numeric")
+    if len(partition_str) != 1:
+        raise ValueError("Partition must be a single digit")
+    if not keys_str or len(keys_str) > 5:
+        raise ValueError("Keypad command must be 1 to 5 keystrokes")
+    if not keys_str.isdigit():
+        raise ValueError("Keypad command must be numeric")
+
+    body = f"ks{partition_str}{keys_str}00"
+    length = len(body) + 4
+    return f"{length:02X}{body}"
+
+
+def build_bypass_keys(user_code: str, zones: list[int | str]) -> str:
+    """Return the keystrokes that bypass ``zones``."""
+    code_str = str(user_code).strip()
+    if len(code_str) != 4 or not code_str.isdigit():
+        raise ValueError("User code must be exactly 4 digits")
+    zone_keys = []
+    for zone_number in zones:
+        zone_str = str(zone_number).strip()
+        if not zone_str.isdigit():
+            raise ValueError("Zone number must be numeric")
+        zone_keys.append(f"{int(zone_str):03d}")
+
+    # Emulate keypad entry: [code][6] then each zone as three digits, which
+    # is how bypass is exposed on VISTA keypads.
+    return f"{code_str}6{''.join(zone_keys)}"
+
+
+def build_output_command(output_id: int | str, on: bool) -> str:
+    """Build a relay output on (cn) or off (cf) command."""
+    return "0A{}{:0>2}00".format("cn" if on else "cf", output_id)
+
+
+class FrameDecoder:
+    """Split a raw byte stream into panel lines.
+
+    Bytes may arrive in any chunking; partial lines are held until the rest
+    of the line is fed.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""
+
+    def feed(self, data: bytes) -> list[bytes]:
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b"\n")
+        return lines
+
+    def clear(self) -> None:
+        self._buffer = b""
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneStatusChanged:
+    zone_id: int
+    status: int
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionMapChanged:
+    # One partition digit per zone, as sent in ZP.
+    report: str
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionStatusChanged:
+    partition_id: int
+    status: str
+
+
+@dataclass(frozen=True, slots=True)
+class OutputStatusChanged:
+    output_id: int
+    status: int
+
+
+@dataclass(frozen=True, slots=True)
+class SystemEvent:
+    # As returned by decode_system_event, plus the zone's partition.
+    event: dict[str, Any]
+
+
+Record = (
+    ZoneStatusChanged
+    | PartitionMapChanged
+    | PartitionStatusChanged
+    | OutputStatusChanged
+    | SystemEvent
+)
+
+
+class PanelProtocol:
+    """Synchronous Ademco protocol state machine.
+
+    Holds the last known zone, partition and output state and turns each
+    message into the records of what it changed, in the order they should
+    be applied. Repeated reports produce no records.
+    """
+
+    def __init__(self) -> None:
+        self.zone_status = [0] * ZONE_COUNT
+        self.output_status = [0] * OUTPUT_COUNT
+        self.partition_status: dict[int, str] = {}
+        self.partition_map: str | None = None
+        self._decoder = FrameDecoder()
+        self._appliers = {
+            "ZS": self.apply_zone_status,
+            "ZP": self.apply_zone_partitions,
+            "CS": self.apply_output_status,
+            "AS": self.apply_arming_status,
+            "NQ": self.apply_system_event,
+        }
+
+    def receive_data(self, data: bytes) -> list[Record]:
+        """Consume raw bytes and return the records of every whole line."""
+        records: list[Record] = []
+        for line in self._decoder.feed(data):
+            parsed = parse_message(line)
+            if parsed is not None:
+                records.extend(self.receive_message(*parsed))
+        return records
+
+    def receive_message(self, message_type: str, data: str) -> list[Record]:
+        """Apply one validated message."""
+        applier = self._appliers.get(message_type)
+        if applier is None:
+            if message_type not in ("OK", CORRUPT_FRAME):
+                log.critical("Unhandled message type receieved: %s%s", message_type, data)
+            return []
+        return applier(data)
+
+    def connection_lost(self) -> None:
+        """Drop any partial line; state is kept until the next reports."""
+        self._decoder.clear()
+
+    def zone_partition(self, zone_id: int) -> int:
+        if not self.partition_map or not 0 < zone_id <= len(self.partition_map):
+            return 0
+        return int(self.partition_map[zone_id - 1])
+
+    def apply_zone_status(self, data: str) -> list[Record]:
+        records: list[Record] = []
+        zone_status = self.zone_status
+        for index, char in enumerate(data[:ZONE_COUNT]):
+            status = int(char, 16)
+            if status != zone_status[index]:
+                zone_status[index] = status
+                records.append(ZoneStatusChanged(index + 1, status))
+        return records
+
+    def apply_zone_partitions(self, data: str) -> list[Record]:
+        if data == self.partition_map:
+            return []
+        self.partition_map = data
+        return [PartitionMapChanged(data)]
+
+    def apply_arming_status(self, data: str) -> list[Record]:
+        records: list[Record] = []
+        for index, status in enumerate(data):
+            partition_id = index + 1
+            current = self.partition_status.get(partition_id)
+            if status == current:
+                continue
+            # A partition is taken as first reported; after that only valid
+            # statuses are applied.
+            if current is not None and status not in PARTITION_STATUSES:
+                log.critical("Invalid partition status received %s", status)
+                continue
+            self.partition_status[partition_id] = status
+            records.append(PartitionStatusChanged(partition_id, status))
+        return records
+
+    def apply_output_status(self, data: str) -> list[Record]:
+        records: list[Record] = []
+        output_status = self.output_status
+        for index, char in enumerate(data[:OUTPUT_COUNT]):
+            if char == "U":
+                continue
+            status = int(char)
+            if status != output_status[index]:
+                output_status[index] = status
+                records.append(OutputStatusChanged(index + 1, status))
+        return records
+
+    def apply_system_event(self, data: str) -> list[Record]:
+        event = decode_system_event(data)
+        if event is None:
+            log.warning("Ignoring malformed Ademco system event: %s", data)
+            return []
+        zone_id = event["zone"]
+        in_range = zone_id is not None and zone_id <= ZONE_COUNT
+        event["partition"] = self.zone_partition(zone_id) if in_range else None
+        # The event goes first: an alarm is announced before its zone bits
+        # fan out to entity state writes.
+        records: list[Record] = [SystemEvent(event)]
+        bit = EVENT_ZONE_BITS.get(event["code"])
+        if bit is not None and in_range:
+            mask, value = bit
+            current = self.zone_status[zone_id - 1]
+            status = current | mask if value else current & ~mask
+            if status != current:
+                self.zone_status[zone_id - 1] = status
+                records.append(ZoneStatusChanged(zone_id, status))
+        return records
@@ -0,0 +1,124 @@
+"""Timer heap shared by every Ademco panel."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import heapq
+import itertools
+import logging
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+# Rebuild the heap once this many cancelled calls have piled up in it.
+COMPACT_THRESHOLD = 64
+
+
+class ScheduledCall:
+    """Handle for a call queued on a ``Scheduler``."""
+
+    __slots__ = ("_scheduler", "when", "callback", "args", "cancelled")
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        self._scheduler = scheduler
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        if not self.cancelled:
+            self.cancelled = True
+            self._scheduler._call_cancelled()
+
+
+class Scheduler:
+    """Run timed callbacks from one heap and a single loop timer.
+
+    Panels share one scheduler, so N panels (and all of their timed work) cost
+    one armed ``loop.call_at`` handle instead of a task or timer per job.
+    Cancelled calls are dropped lazily when they reach the top of the heap.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self._loop = loop
+        self._heap: list[tuple[float, int, ScheduledCall]] = []
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_when: float | None = None
+        self._cancelled = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    def time(self) -> float:
+        return self.loop.time()
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> ScheduledCall:
+        return self.call_at(self.time() + delay, callback, *args)
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> ScheduledCall:
+        call = ScheduledCall(self, when, callback, args)
+        heapq.heappush(self._heap, (when, next(self._counter), call))
+        if self._timer_when is None or when < self._timer_when:
+            self._arm(when)
+        return call
+
+    def close(self) -> None:
+        """Drop every pending call."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_when = None
+        for _, _, call in self._heap:
+            call.cancelled = True
+        self._heap.clear()
+        self._cancelled = 0
+
+    def _arm(self, when: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self.loop.call_at(when, self._run)
+        self._timer_when = when
+
+    def _call_cancelled(self) -> None:
+        self._cancelled += 1
+        if self._cancelled > COMPACT_THRESHOLD and self._cancelled > len(self._heap) // 2:
+            self._heap[:] = [item for item in self._heap if not item[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _run(self) -> None:
+        self._timer = None
+        self._timer_when = None
+        now = self.loop.time()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, call = heapq.heappop(heap)
+            if call.cancelled:
+                self._cancelled = max(0, self._cancelled - 1)
+                continue
+            call.cancelled = True
+            try:
+                call.callback(*call.args)
+            except Exception:
+                log.exception("Ademco scheduled callback raised unexpectedly")
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+            self._cancelled = max(0, self._cancelled - 1)
+        if heap and (self._timer_when is None or heap[0][0] < self._timer_when):
+            self._arm(heap[0][0])
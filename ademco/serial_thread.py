@@ -0,0 +1,150 @@
+"""Serial transport whose port, framing and validation live on a dedicated thread."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+import logging
+import queue
+import threading
+from typing import Any
+
+from .protocol import REPORT_TYPES, FrameDecoder, parse_message
+from .transport import Transport
+
+log = logging.getLogger(__name__)
+
+# Read timeout for the port; also bounds how long a queued write waits.
+READ_TIMEOUT = 0.05
+
+
+class ThreadedSerialTransport(Transport):
+    """Serial transport that keeps panel I/O off the event loop.
+
+    The thread owns the serial port, splits and checksum-validates frames and
+    drops repeats of the previous full report. Parsed records are handed to
+    the loop in batches with ``call_soon_threadsafe``, so panel timing does
+    not depend on how busy the loop is.
+    """
+
+    required_modules = ("serial",)
+
+    def __init__(self, url: str, baudrate: int | str) -> None:
+        self.url = url
+        self.baudrate = baudrate
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._inbox: asyncio.Queue[list[tuple[str, str | None]] | Exception] = (
+            asyncio.Queue()
+        )
+        self._outbox: queue.SimpleQueue[bytes] = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._connected = False
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def _open_port(self) -> Any:
+        import serial
+
+        return serial.serial_for_url(
+            self.url, baudrate=int(self.baudrate), timeout=READ_TIMEOUT
+        )
+
+    async def connect(self) -> None:
+        loop = asyncio.get_running_loop()
+        port = await loop.run_in_executor(None, self._open_port)
+        self._loop = loop
+        self._inbox = asyncio.Queue()
+        self._outbox = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(port, self._stop, self._outbox, self._inbox),
+            name="ademco_serial_io",
+            daemon=True,
+        )
+        self._connected = True
+        self._thread.start()
+
+    async def write(self, frame: bytes) -> None:
+        if not self._connected:
+            raise ConnectionError("Ademco transport is not connected")
+        self._outbox.put(frame)
+
+    async def read_messages(self) -> list[tuple[str, str | None]]:
+        if not self._connected:
+            raise ConnectionError("Ademco transport is not connected")
+        batch = await self._inbox.get()
+        if isinstance(batch, Exception):
+            self._connected = False
+            raise batch
+        return batch
+
+    def abort(self) -> None:
+        if self._connected:
+            self._connected = False
+            self._inbox.put_nowait(ConnectionResetError("Serial I/O thread stopped"))
+        self._stop.set()
+
+    async def close(self) -> None:
+        self.abort()
+        thread = self._thread
+        self._thread = None
+        if thread is not None and self._loop is not None:
+            await self._loop.run_in_executor(None, thread.join, 1)
+
+    def _deliver(self, inbox: asyncio.Queue, item: Any) -> None:
+        """Hand a batch or failure to the loop from the I/O thread."""
+        with suppress(RuntimeError):  # loop already closed during shutdown
+            self._loop.call_soon_threadsafe(inbox.put_nowait, item)
+
+    def _run(
+        self,
+        port: Any,
+        stop: threading.Event,
+        outbox: queue.SimpleQueue,
+        inbox: asyncio.Queue,
+    ) -> None:
+        decoder = FrameDecoder()
+        last_reports: dict[str, str] = {}
+        try:
+            while not stop.is_set():
+                while True:
+                    try:
+                        frame = outbox.get_nowait()
+                    except queue.Empty:
+                        break
+                    port.write(frame)
+                    # A command may change panel state, so the next report
+                    # must reach the loop even if it repeats the last one.
+                    last_reports.clear()
+
+                chunk = port.read(port.in_waiting or 1)
+                if not chunk:
+                    continue
+                batch: list[tuple[str, str | None]] = []
+                for line in decoder.feed(chunk):
+                    parsed = parse_message(line)
+                    if parsed is None:
+                        continue
+                    message_type, data = parsed
+                    if message_type in REPORT_TYPES:
+                        if last_reports.get(message_type) == data:
+                            batch.append((message_type, None))
+                            continue
+                        last_reports[message_type] = data
+                    elif message_type == "NQ":
+                        # Events change zone bits between zone reports.
+                        last_reports.pop("ZS", None)
+                    batch.append(parsed)
+                if batch:
+                    self._deliver(inbox, batch)
+        except Exception as err:
+            if not stop.is_set():
+                log.debug("Ademco serial I/O thread failed", exc_info=True)
+                self._deliver(inbox, ConnectionError(f"Serial I/O failed: {err}"))
+        finally:
+            with suppress(Exception):
+                port.close()
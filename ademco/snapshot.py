@@ -0,0 +1,80 @@
+"""Immutable point-in-time views of Ademco panel state."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from .protocol import ZONE_ALARM, ZONE_BYPASSED, ZONE_OPEN, ZONE_TROUBLE
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneSnapshot:
+    """One zone: its status bits, partition and latch."""
+
+    zone_id: int
+    status: int
+    partition_id: int
+    latched: bool
+
+    @property
+    def opened(self) -> bool:
+        return bool(self.status & ZONE_OPEN)
+
+    @property
+    def trouble(self) -> bool:
+        return bool(self.status & ZONE_TROUBLE)
+
+    @property
+    def alarm(self) -> bool:
+        return bool(self.status & ZONE_ALARM)
+
+    @property
+    def bypassed(self) -> bool:
+        return bool(self.status & ZONE_BYPASSED)
+
+    @property
+    def active(self) -> bool:
+        return self.opened or self.latched
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionSnapshot:
+    """One partition's arming status: A, H, D or N."""
+
+    partition_id: int
+    status: str
+
+    @property
+    def armed(self) -> bool:
+        return self.status in ("A", "H")
+
+    @property
+    def ready(self) -> bool:
+        return self.status != "N"
+
+
+@dataclass(frozen=True, slots=True)
+class PanelSnapshot:
+    """Consistent view of zones, partitions and outputs after one report.
+
+    ``version`` increases with every state change, so two snapshots with the
+    same version are the same object. Sections that did not change between
+    two snapshots are shared rather than copied.
+    """
+
+    version: int
+    connected: bool
+    # Indexed by zone number - 1.
+    zones: tuple[ZoneSnapshot, ...]
+    partitions: Mapping[int, PartitionSnapshot]
+    # Ids of the outputs reported on.
+    outputs_on: frozenset[int]
+
+    def zone(self, zone_id: int) -> ZoneSnapshot | None:
+        if 0 < zone_id <= len(self.zones):
+            return self.zones[zone_id - 1]
+        return None
+
+    def output_on(self, output_id: int) -> bool:
+        return output_id in self.outputs_on
@@ -0,0 +1,101 @@
+"""In-memory wire trace of recent Ademco panel frames."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+import time
+from typing import Any
+
+# Frames kept in the ring; at 1200 baud that is several minutes of traffic.
+TRACE_SIZE = 500
+
+# Outgoing commands that carry a user code or keypad keys.
+_CODE_COMMANDS = frozenset({"aa", "ah", "ad"})
+_KEYPAD_COMMAND = "ks"
+
+
+def redact_command(frame: str) -> str:
+    """Mask user codes and keypad keys in an outgoing frame."""
+    # The checksum is masked too, since it narrows down the hidden digits.
+    command = frame[2:4]
+    if command in _CODE_COMMANDS:
+        # 0E aa NN CCCC 00 + checksum: NN is the user number, CCCC the code.
+        return f"{frame[:6]}****{frame[10:12]}**"
+    if command == _KEYPAD_COMMAND:
+        # LL ks P KEYS 00 + checksum.
+        keys_end = len(frame) - 4
+        return f"{frame[:5]}{'*' * (keys_end - 5)}{frame[keys_end:keys_end + 2]}**"
+    return frame
+
+
+class WireTrace:
+    """Ring buffer of recent frames, formatted only when read.
+
+    Recording appends one tuple to a bounded ``deque``, which needs no lock
+    and drops the oldest frame once full. ``sample`` keeps every Nth frame;
+    0 turns recording off.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE, sample: int = 1) -> None:
+        self._frames: deque[tuple[float, str, Any, Any]] = deque(maxlen=size)
+        self.sample = sample
+        self._seen = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def record_rx(self, message_type: str, data: str | None) -> None:
+        """Record a validated incoming message; ``data`` None is a repeat."""
+        if self.sample != 1 and not self._keep():
+            return
+        self._frames.append((time.time(), "rx", message_type, data))
+
+    def record_tx(self, frame: bytes) -> None:
+        """Record an outgoing frame as written to the transport."""
+        if self.sample != 1 and not self._keep():
+            return
+        self._frames.append((time.time(), "tx", frame, None))
+
+    def _keep(self) -> bool:
+        if self.sample <= 0:
+            return False
+        self._seen += 1
+        return self._seen % self.sample == 0
+
+    def clear(self) -> None:
+        self._frames.clear()
+        self._seen = 0
+
+    def entries(self) -> list[dict[str, str]]:
+        """Return the trace oldest first, with user codes masked."""
+        entries = []
+        for stamp, direction, payload, data in list(self._frames):
+            if direction == "tx":
+                text = redact_command(payload.decode("ascii", "replace").rstrip("\r\n"))
+            elif data is None:
+                text = f"{payload} (repeat)"
+            else:
+                text = f"{payload}{data}"
+            entries.append(
+                {
+                    "time": datetime.fromtimestamp(stamp).isoformat(timespec="milliseconds"),
+                    "direction": direction,
+                    "frame": text,
+                }
+            )
+        return entries
+
+    def dump(self, path: str | Path) -> int:
+        """Write the trace to ``path`` one frame per line; return the count.
+
+        This does blocking file I/O, so run it in an executor.
+        """
+        entries = self.entries()
+        lines = [
+            f"{entry['time']} {entry['direction']} {entry['frame']}\n"
+            for entry in entries
+        ]
+        Path(path).write_text("".join(lines), encoding="utf-8")
+        return len(entries)
@@ -0,0 +1,312 @@
+"""Transports that carry Ademco frames over serial, TCP or memory."""
+
+from __future__ import annotations
+
+import asyncio
+from asyncio.streams import StreamReader, StreamWriter
+from collections.abc import Callable, Iterable, Mapping
+from contextlib import suppress
+import logging
+import socket
+from typing import Any
+from urllib.parse import urlsplit
+
+from .protocol import parse_message
+
+log = logging.getLogger(__name__)
+
+TRANSPORT_SERIAL = "serial"
+TRANSPORT_TCP = "tcp"
+TRANSPORT_LOOPBACK = "loopback"
+
+TCP_SCHEMES = ("socket", "tcp")
+
+# The panel needs roughly a second between commands on a real link.
+PANEL_WRITE_INTERVAL = 1.0
+
+SERIAL_RECONNECT_MAX_DELAY = 300
+# Network links are cheap to retry and ser2net boxes come back quickly after a
+# reboot, so cap the backoff much lower than for a local serial adapter.
+TCP_RECONNECT_MAX_DELAY = 30
+
+TCP_CONNECT_TIMEOUT = 10
+# Probe an idle link after 10 s and give up after three missed probes, so a
+# ser2net box that drops off the network is noticed in ~25 s instead of hours.
+TCP_KEEPALIVE_IDLE = 10
+TCP_KEEPALIVE_INTERVAL = 5
+TCP_KEEPALIVE_COUNT = 3
+
+
+def parse_tcp_address(device: str) -> tuple[str, int] | None:
+    """Return ``(host, port)`` when ``device`` names a TCP endpoint.
+
+    Accepts ``socket://host:port``, ``tcp://host:port`` and bare ``host:port``.
+    Serial device paths and other pyserial URLs such as ``rfc2217://`` return
+    ``None`` so they keep going through the serial transport.
+    """
+    device = str(device).strip()
+    if not device or device.startswith("/"):
+        return None
+    if "://" not in device:
+        if ":" not in device:
+            return None
+        device = f"tcp://{device}"
+
+    parts = urlsplit(device)
+    if parts.scheme not in TCP_SCHEMES:
+        return None
+    try:
+        port = parts.port
+    except ValueError as err:
+        raise ValueError(f"Invalid TCP port in {device}") from err
+    if not parts.hostname or port is None:
+        raise ValueError(f"TCP address must be host:port, got {device}")
+    return parts.hostname, port
+
+
+def configure_tcp_socket(sock: socket.socket | None) -> None:
+    """Disable Nagle and enable aggressive keepalive on a panel socket."""
+    if sock is None:
+        return
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE)
+    elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS spelling
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, TCP_KEEPALIVE_IDLE)
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        sock.setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL
+        )
+    if hasattr(socket, "TCP_KEEPCNT"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, TCP_KEEPALIVE_COUNT)
+
+
+async def open_tcp_connection(
+    host: str, port: int, timeout: float = TCP_CONNECT_TIMEOUT
+) -> tuple[StreamReader, StreamWriter]:
+    """Open a tuned TCP stream to a ser2net-style serial server."""
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(host, port), timeout
+    )
+    try:
+        configure_tcp_socket(writer.get_extra_info("socket"))
+    except OSError:
+        log.debug("Could not tune socket options for %s:%s", host, port, exc_info=True)
+    return reader, writer
+
+
+class Transport:
+    """Frame-oriented link to an Ademco panel.
+
+    A frame is one CRLF-terminated panel message. ``read_frame`` raises
+    ``ConnectionError`` once the link is gone so the panel supervisor can
+    reconnect.
+    """
+
+    # Pause after each write so the panel is not flooded with commands.
+    write_interval = PANEL_WRITE_INTERVAL
+    # Upper bound for the panel's reconnect backoff on this kind of link.
+    reconnect_max_delay = SERIAL_RECONNECT_MAX_DELAY
+    # Modules ``connect`` imports lazily; callers can import them up front
+    # off the event loop.
+    required_modules: tuple[str, ...] = ()
+
+    @property
+    def connected(self) -> bool:
+        raise NotImplementedError
+
+    async def connect(self) -> None:
+        raise NotImplementedError
+
+    async def write(self, frame: bytes) -> None:
+        raise NotImplementedError
+
+    async def read_frame(self) -> bytes:
+        raise NotImplementedError
+
+    async def read_messages(self) -> list[tuple[str, str | None]]:
+        """Return the next validated ``(message_type, data)`` records."""
+        parsed = parse_message(await self.read_frame())
+        return [parsed] if parsed is not None else []
+
+    def abort(self) -> None:
+        """Drop the link immediately from a synchronous failure path."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        self.abort()
+
+
+class StreamTransport(Transport):
+    """Transport backed by an asyncio ``StreamReader``/``StreamWriter`` pair."""
+
+    def __init__(self) -> None:
+        self._reader: StreamReader | None = None
+        self._writer: StreamWriter | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._reader is not None and self._writer is not None
+
+    async def _open(self) -> tuple[StreamReader, StreamWriter]:
+        raise NotImplementedError
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await self._open()
+
+    async def write(self, frame: bytes) -> None:
+        writer = self._writer
+        if writer is None:
+            raise ConnectionError("Ademco transport is not connected")
+        writer.write(frame)
+        await writer.drain()
+
+    async def read_frame(self) -> bytes:
+        reader = self._reader
+        if reader is None:
+            raise ConnectionError("Ademco transport is not connected")
+        line = await reader.readline()
+        if not line and reader.at_eof():
+            raise ConnectionResetError("Ademco connection closed by the remote end")
+        return line
+
+    def abort(self) -> None:
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer is not None:
+            with suppress(Exception):
+                writer.close()
+
+    async def close(self) -> None:
+        writer = self._writer
+        self.abort()
+        if writer is not None:
+            with suppress(Exception):
+                await writer.wait_closed()
+
+
+class SerialTransport(StreamTransport):
+    """Local serial port, or any pyserial URL such as ``rfc2217://``."""
+
+    required_modules = ("serial_asyncio",)
+
+    def __init__(self, url: str, baudrate: int | str) -> None:
+        super().__init__()
+        self.url = url
+        self.baudrate = baudrate
+
+    async def _open(self) -> tuple[StreamReader, StreamWriter]:
+        """Open the Ademco serial transport lazily to avoid import-time overhead."""
+        import serial_asyncio
+
+        return await serial_asyncio.open_serial_connection(
+            url=self.url,
+            baudrate=self.baudrate,
+        )
+
+
+class TcpTransport(StreamTransport):
+    """Raw TCP stream to a ser2net-style serial server."""
+
+    reconnect_max_delay = TCP_RECONNECT_MAX_DELAY
+
+    def __init__(
+        self, host: str, port: int, timeout: float = TCP_CONNECT_TIMEOUT
+    ) -> None:
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    async def _open(self) -> tuple[StreamReader, StreamWriter]:
+        return await open_tcp_connection(self.host, self.port, self.timeout)
+
+
+class LoopbackTransport(Transport):
+    """In-memory transport for tests, benchmarks and simulators.
+
+    Frames written by the panel are appended to ``sent`` and passed to the
+    optional ``responder``, whose returned frames are delivered back to the
+    panel. ``feed`` injects unsolicited frames and ``drop`` simulates a
+    link failure. There is no write pacing, so it runs at CPU speed.
+    """
+
+    write_interval = 0.0
+    reconnect_max_delay = 1.0
+
+    def __init__(
+        self, responder: Callable[[bytes], Iterable[bytes] | None] | None = None
+    ) -> None:
+        self.responder = responder
+        self.sent: list[bytes] = []
+        self._inbox: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._connected = False
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    async def connect(self) -> None:
+        self._inbox = asyncio.Queue()
+        self._connected = True
+
+    async def write(self, frame: bytes) -> None:
+        if not self._connected:
+            raise ConnectionError("Ademco transport is not connected")
+        self.sent.append(frame)
+        if self.responder is not None:
+            for reply in self.responder(frame) or ():
+                self.feed(reply)
+
+    async def read_frame(self) -> bytes:
+        if not self._connected:
+            raise ConnectionError("Ademco transport is not connected")
+        frame = await self._inbox.get()
+        if frame is None:
+            raise ConnectionResetError("Loopback transport dropped")
+        return frame
+
+    def feed(self, frame: bytes) -> None:
+        """Deliver a frame to the panel as if the panel sent it."""
+        self._inbox.put_nowait(frame)
+
+    def drop(self) -> None:
+        """Simulate the remote end going away."""
+        if self._connected:
+            self._connected = False
+            self._inbox.put_nowait(None)
+
+    def abort(self) -> None:
+        self.drop()
+
+
+def create_transport(config: Mapping[str, Any]) -> Transport | None:
+    """Build the transport selected by a panel config.
+
+    ``transport`` may be ``serial``, ``tcp`` or ``loopback``. When it is not
+    set, TCP addresses select the TCP transport and anything else is treated
+    as a serial device. Serial devices run on a dedicated I/O thread when
+    ``io_thread`` is set. Returns ``None`` when no device is configured.
+    """
+    kind = str(config.get("transport") or "").strip().lower()
+    device = str(config.get("device") or "").strip()
+
+    if kind == TRANSPORT_LOOPBACK:
+        return LoopbackTransport()
+    if not device:
+        return None
+    if kind in ("", TRANSPORT_TCP):
+        address = parse_tcp_address(device)
+        if address is not None:
+            return TcpTransport(*address)
+        if kind == TRANSPORT_TCP:
+            raise ValueError(f"TCP transport needs host:port, got {device}")
+    elif kind != TRANSPORT_SERIAL:
+        raise ValueError(f"Unknown Ademco transport: {kind}")
+    if config.get("io_thread"):
+        from .serial_thread import ThreadedSerialTransport
+
+        return ThreadedSerialTransport(device, config.get("baud", "1200"))
+    return SerialTransport(device, config.get("baud", "1200"))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
@@ -16,11 +17,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AdemcoConfigEntry
-from .const import CONF_PARTITIONS
+from .ademco import AdemcoError
 from .entity import AdemcoEntity
 
 if TYPE_CHECKING:
     from .ademco import Partition, Zone
+    from .topology import PartitionTopology
 
 
 async def async_setup_entry(
@@ -31,11 +33,7 @@ async def async_setup_entry(
     """Set up Ademco partition entities from a config entry."""
     runtime_data = entry.runtime_data
     panel = runtime_data.panel
-    partition_configs = {
-        int(item["id"]): item
-        for item in runtime_data.config.get(CONF_PARTITIONS, [])
-        if str(item.get("id", "")).isdigit()
-    }
+    partition_topologies = runtime_data.topology.partitions
     known_partition_ids: set[int] = set()
 
     @callback
@@ -57,8 +55,9 @@ async def async_setup_entry(
                     panel,
                     runtime_data.device_id,
                     runtime_data.device_name,
+                    runtime_data.entry_id,
                     partition,
-                    partition_configs.get(partition_id),
+                    partition_topologies.get(partition_id),
                 )
             )
         if entities:
@@ -73,24 +72,38 @@ class AdemcoPartition(AdemcoEntity, AlarmControlPanelEntity):
     """Representation of an Ademco alarm partition."""
 
     _attr_should_poll = False
+    _readiness = ("partitions",)
+    # raw_status is derivable from the state; the rest is static per map.
+    _unrecorded_attributes = frozenset(
+        {"partition_id", "raw_status", "tracked_zone_count", "controllable"}
+    )
 
     def __init__(
         self,
         panel,
         device_id: str,
         device_name: str,
+        entry_id: str,
         partition: Partition,
-        config: dict[str, str] | None,
+        partition_topology: PartitionTopology | None,
     ) -> None:
         """Initialize an Ademco partition entity."""
-        super().__init__(panel, device_id, device_name)
+        super().__init__(panel, device_id, device_name, entry_id)
         self._partition = partition
-        self._config = config or {}
+        self._user_number = (
+            partition_topology.user_number if partition_topology is not None else ""
+        )
+        self._attr_name = (
+            partition_topology.name if partition_topology is not None else ""
+        ) or f"Partition {partition.partionNum}"
         self._zone_callbacks: dict[int, Callable[[], None]] = {}
         self._pending_state: AlarmControlPanelState | None = None
         self._pending_target: AlarmControlPanelState | None = None
-        self._attr_unique_id = f"ademco.partition{self._partition.partionNum}"
-        if self._config.get("userNumber"):
+        self._attributes_status = partition.armStatus
+        self._attr_unique_id = self._build_unique_id(
+            f"partition{self._partition.partionNum}"
+        )
+        if self._user_number:
             self._attr_supported_features = (
                 AlarmControlPanelEntityFeature.ARM_AWAY
                 | AlarmControlPanelEntityFeature.ARM_HOME
@@ -108,18 +121,10 @@ class AdemcoPartition(AdemcoEntity, AlarmControlPanelEntity):
         self._clear_zone_callbacks()
         await super().async_will_remove_from_hass()
 
-    @property
-    def name(self) -> str:
-        """Return the partition name."""
-        partition_name = self._config.get("name", "").strip()
-        if partition_name:
-            return partition_name
-        return f"Partition {self._partition.partionNum}"
-
     @property
     def code_format(self) -> CodeFormat | None:
         """Return the required code format for controllable partitions."""
-        if self._config.get("userNumber"):
+        if self._user_number:
             return CodeFormat.NUMBER
         return None
 
@@ -151,52 +156,62 @@ class AdemcoPartition(AdemcoEntity, AlarmControlPanelEntity):
             return AlarmControlPanelState.DISARMED
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, int | str | bool]:
-        """Return extra partition attributes."""
+    def _build_extra_state_attributes(self) -> dict[str, int | str | bool]:
+        """Build extra partition attributes."""
         return {
             "partition_id": self._partition.partionNum,
             "raw_status": self._partition.armStatus,
             "ready": self._partition.ready,
             "tracked_zone_count": len(self._tracked_zones()),
-            "controllable": bool(self._config.get("userNumber")),
+            "controllable": bool(self._user_number),
         }
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Disarm this partition using the configured user number."""
-        self._send_partition_command("disarm", code)
+        await self._send_partition_command("disarm", code)
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Arm this partition away using the configured user number."""
-        self._send_partition_command("away", code)
+        await self._send_partition_command("away", code)
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Arm this partition home/stay using the configured user number."""
-        self._send_partition_command("home", code)
+        await self._send_partition_command("home", code)
 
     @callback
     def _handle_panel_update(self) -> None:
         """Refresh zone subscriptions and state after panel updates."""
         self._refresh_zone_callbacks()
         self._update_pending_state()
+        if self._attributes_status != self._partition.armStatus:
+            self._attributes_status = self._partition.armStatus
+            self._invalidate_attributes()
         super()._handle_panel_update()
 
     @callback
     def _handle_zone_update(self) -> None:
         """Refresh entity state after a tracked zone updates."""
         self._update_pending_state()
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
+
+    def _state_fingerprint(self) -> tuple:
+        return (
+            self.available,
+            self.alarm_state,
+            self._partition.armStatus,
+            len(self._zone_callbacks),
+        )
 
     def _tracked_zones(self) -> list[Zone]:
-        return [
-            zone
-            for zone in self._panel.zones
-            if zone.partition_id == self._partition.partionNum
-        ]
-
-    def _send_partition_command(self, action: str, code: str | None) -> None:
-        """Send a partition control command when configured and valid."""
-        user_number = self._config.get("userNumber", "").strip()
+        return self._panel.getPartitionZones(self._partition.partionNum)
+
+    async def _send_partition_command(self, action: str, code: str | None) -> None:
+        """Send a partition control command when configured and valid.
+
+        The entity shows arming or disarming while the command waits for the
+        writer, and drops back to the panel state if it is never sent.
+        """
+        user_number = self._user_number
         if not user_number:
             raise HomeAssistantError(
                 f"Partition {self._partition.partionNum} is not configured for control"
@@ -204,19 +219,34 @@ class AdemcoPartition(AdemcoEntity, AlarmControlPanelEntity):
         if code is None:
             raise HomeAssistantError("A 4-digit user code is required")
 
-        if action == "away":
-            self._panel.armAway(user_number, code)
-            self._pending_state = AlarmControlPanelState.ARMING
-            self._pending_target = AlarmControlPanelState.ARMED_AWAY
-            return
-        if action == "home":
-            self._panel.armHome(user_number, code)
-            self._pending_state = AlarmControlPanelState.ARMING
-            self._pending_target = AlarmControlPanelState.ARMED_HOME
-            return
-        self._panel.disam(user_number, code)
-        self._pending_state = AlarmControlPanelState.DISARMING
-        self._pending_target = AlarmControlPanelState.DISARMED
+        try:
+            if action == "away":
+                sent = self._panel.armAway(user_number, code)
+                self._pending_state = AlarmControlPanelState.ARMING
+                self._pending_target = AlarmControlPanelState.ARMED_AWAY
+            elif action == "home":
+                sent = self._panel.armHome(user_number, code)
+                self._pending_state = AlarmControlPanelState.ARMING
+                self._pending_target = AlarmControlPanelState.ARMED_HOME
+            else:
+                sent = self._panel.disam(user_number, code)
+                self._pending_state = AlarmControlPanelState.DISARMING
+                self._pending_target = AlarmControlPanelState.DISARMED
+            self._async_write_state_if_changed()
+            await sent
+        except AdemcoError as err:
+            self._clear_pending_state()
+            raise HomeAssistantError(str(err)) from err
+        except asyncio.CancelledError:
+            self._clear_pending_state()
+            raise
+
+    @callback
+    def _clear_pending_state(self) -> None:
+        """Show the panel state again after a command was not sent."""
+        self._pending_state = None
+        self._pending_target = None
+        self._async_write_state_if_changed()
 
     @callback
     def _update_pending_state(self) -> None:
@@ -235,9 +265,7 @@ class AdemcoPartition(AdemcoEntity, AlarmControlPanelEntity):
 
     @callback
     def _refresh_zone_callbacks(self) -> None:
-        tracked_zone_ids = {
-            zone.zoneNum for zone in self._tracked_zones()
-        }
+        tracked_zone_ids = {zone.zoneNum for zone in self._tracked_zones()}
 
         for zone_id in list(self._zone_callbacks):
             if zone_id not in tracked_zone_ids:
@@ -13,24 +13,20 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.core import callback
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import (
     AddEntitiesCallback,
     async_get_current_platform,
 )
 
 from . import AdemcoConfigEntry
-from .bypass import build_partition_configs, supports_bypass, validate_bypass_request
-from .const import (
-    CONF_DOORS,
-    CONF_MOTIONS,
-    CONF_PROBLEMS,
-    CONF_WINDOWS,
-)
+from .ademco import AdemcoError
+from .bypass import supports_bypass, validate_bypass_request
 from .entity import AdemcoEntity
 
 if TYPE_CHECKING:
     from .ademco import Zone
+    from .topology import PanelTopology, ZoneTopology
 
 
 async def async_setup_entry(
@@ -42,59 +38,40 @@ async def async_setup_entry(
     entities = []
     runtime_data = entry.runtime_data
     panel = runtime_data.panel
-    config = runtime_data.config
-    partition_configs = build_partition_configs(config)
+    topology = runtime_data.topology
     platform = async_get_current_platform()
 
-    for zone_config in config.get(CONF_DOORS, []):
+    for zone_topology in topology.zones:
         entities.append(
             AdemcoZone(
                 panel,
                 runtime_data.device_id,
                 runtime_data.device_name,
-                panel.getZone(zone_config["id"]),
-                zone_config,
-                "door",
-                partition_configs,
+                runtime_data.entry_id,
+                panel.getZone(zone_topology.zone_id),
+                zone_topology,
+                topology,
             )
         )
 
-    for zone_config in config.get(CONF_WINDOWS, []):
-        entities.append(
-            AdemcoZone(
-                panel,
-                runtime_data.device_id,
-                runtime_data.device_name,
-                panel.getZone(zone_config["id"]),
-                zone_config,
-                "window",
-                partition_configs,
-            )
-        )
-    for zone_config in config.get(CONF_MOTIONS, []):
-        entities.append(
-            AdemcoZone(
-                panel,
-                runtime_data.device_id,
-                runtime_data.device_name,
-                panel.getZone(zone_config["id"]),
-                zone_config,
-                "motion",
-                partition_configs,
-            )
-        )
-    for zone_config in config.get(CONF_PROBLEMS, []):
-        entities.append(
-            AdemcoZone(
-                panel,
-                runtime_data.device_id,
-                runtime_data.device_name,
-                panel.getZone(zone_config["id"]),
-                zone_config,
-                "problem",
-                partition_configs,
-            )
-        )
+    if topology.zone_status_entities:
+        for zone_topology in topology.zones_by_id.values():
+            kinds = ["alarm", "trouble"]
+            if not zone_topology.bypassable:
+                # Door, window and motion zones already have a bypass switch.
+                kinds.append("bypassed")
+            for kind in kinds:
+                entities.append(
+                    AdemcoZoneStatusSensor(
+                        panel,
+                        runtime_data.device_id,
+                        runtime_data.device_name,
+                        runtime_data.entry_id,
+                        panel.getZone(zone_topology.zone_id),
+                        zone_topology,
+                        kind,
+                    )
+                )
 
     async_add_entities(entities)
     platform.async_register_entity_service(
@@ -113,30 +90,31 @@ class AdemcoZone(AdemcoEntity, BinarySensorEntity):
     """Representation of an Ademco zone."""
 
     _attr_should_poll = False
+    # Static or derivable from the state, so not worth a recorder row each.
+    _unrecorded_attributes = frozenset(
+        {"partition_id", "controllable_bypass", "latched", "latchSeconds"}
+    )
 
     def __init__(
         self,
         panel,
         device_id: str,
         device_name: str,
+        entry_id: str,
         zone: Zone,
-        config: dict[str, str],
-        device_class: str,
-        partition_configs: dict[int, dict[str, str]],
+        zone_topology: ZoneTopology,
+        topology: PanelTopology,
     ) -> None:
         """Initialize an Ademco zone entity."""
-        super().__init__(panel, device_id, device_name)
+        super().__init__(panel, device_id, device_name, entry_id)
         self._zone = zone
-        self._config = config
-        self._zone_type = device_class
-        self._partition_configs = partition_configs
-        self._attr_device_class = BinarySensorDeviceClass(device_class)
-        self._attr_unique_id = f"ademco.zone{self._zone.zoneNum}"
-        self._zone.latchSeconds = int(config.get("latchSeconds", "0") or 0)
-        self._latch_seconds = self._zone.latchSeconds
-        self._latched_on = False
-        self._was_open = self._zone.opened
-        self._remove_latch_timer = None
+        self._zone_topology = zone_topology
+        self._zone_type = zone_topology.zone_type
+        self._topology = topology
+        self._status_entities = topology.zone_status_entities
+        self._attr_name = zone_topology.display_name
+        self._attr_device_class = BinarySensorDeviceClass(zone_topology.zone_type)
+        self._attr_unique_id = self._build_unique_id(f"zone{self._zone.zoneNum}")
         self._remove_zone_callback = None
 
     async def async_added_to_hass(self) -> None:
@@ -146,85 +124,47 @@ class AdemcoZone(AdemcoEntity, BinarySensorEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Unregister callbacks."""
-        self._cancel_latch_timer()
         if self._remove_zone_callback is not None:
             self._remove_zone_callback()
             self._remove_zone_callback = None
         await super().async_will_remove_from_hass()
 
-    def _cancel_latch_timer(self) -> None:
-        """Cancel any pending latch clear timer."""
-        if self._remove_latch_timer is not None:
-            self._remove_latch_timer()
-            self._remove_latch_timer = None
-
-    @callback
-    def _clear_latch(self, _now=None) -> None:
-        """Clear the temporary latched-on state."""
-        self._remove_latch_timer = None
-        if not self._zone.opened and self._latched_on:
-            self._latched_on = False
-            self.async_write_ha_state()
-
     @callback
     def _handle_zone_update(self) -> None:
-        """Write state after a zone update."""
-        is_open = self._zone.opened
-        if is_open:
-            self._cancel_latch_timer()
-            self._latched_on = False
-        elif self._was_open and self._latch_seconds > 0:
-            self._latched_on = True
-            self._cancel_latch_timer()
-            self._remove_latch_timer = async_call_later(
-                self.hass,
-                self._latch_seconds,
-                self._clear_latch,
-            )
+        """Write state after a zone or latch update."""
+        self._invalidate_attributes()
+        self._async_write_state_if_changed()
 
-        self._was_open = is_open
-        self.async_write_ha_state()
+    def _state_fingerprint(self) -> tuple:
+        zone = self._zone
+        return (self.available, *zone.bitStatus, zone.latched, zone.partition_id)
 
-    @property
-    def extra_state_attributes(self):
-        """Return extra state attributes for the zone."""
+    def _build_extra_state_attributes(self):
+        """Build extra state attributes for the zone."""
         attributes = {
-            "bypassed": self._zone.bypassed,
-            "alarm": self._zone.alarm,
-            "trouble": self._zone.trouble,
             "partition_id": self._zone.partition_id,
             "controllable_bypass": self._supports_bypass,
         }
-        if self._latch_seconds > 0:
-            attributes["latched"] = self._latched_on
-            attributes["latchSeconds"] = self._latch_seconds
+        if not self._status_entities:
+            attributes["bypassed"] = self._zone.bypassed
+            attributes["alarm"] = self._zone.alarm
+            attributes["trouble"] = self._zone.trouble
+        if self._zone.latchSeconds > 0:
+            attributes["latched"] = self._zone.latched
+            attributes["latchSeconds"] = self._zone.latchSeconds
         return attributes
 
-    @property
-    def name(self):
-        """Return the legacy-compatible zone name."""
-        suffix = {
-            "door": "Door",
-            "window": "Window",
-            "motion": "Motion",
-            "problem": "Problem",
-        }[self._zone_type]
-        zone_name = self._config.get("name", "").strip()
-        if not zone_name:
-            return f"Zone {self._zone.zoneNum} {suffix}"
-        return f"{zone_name} {suffix}"
-
     @property
     def is_on(self) -> bool:
         """Return if the zone is currently active/open."""
-        return self._zone.opened or self._latched_on
+        return self._zone.active
 
     @property
     def _supports_bypass(self) -> bool:
         return supports_bypass(
             self._zone_type,
             self._zone.partition_id,
-            self._partition_configs,
+            self._topology,
         )
 
     async def async_bypass_zone(self, code: str) -> None:
@@ -233,9 +173,9 @@ class AdemcoZone(AdemcoEntity, BinarySensorEntity):
             self.name,
             self._zone_type,
             self._zone.partition_id,
-            self._partition_configs,
+            self._topology,
         )
-        self._panel.bypassZone(self._zone.partition_id, code, self._zone.zoneNum)
+        await self._send_bypass(code)
 
     async def async_unbypass_zone(self, code: str) -> None:
         """Unbypass this zone using the same Ademco keypad toggle sequence."""
@@ -243,8 +183,76 @@ class AdemcoZone(AdemcoEntity, BinarySensorEntity):
             self.name,
             self._zone_type,
             self._zone.partition_id,
-            self._partition_configs,
+            self._topology,
         )
         if not self._zone.bypassed:
             raise HomeAssistantError(f"{self.name} is not currently bypassed")
-        self._panel.bypassZone(self._zone.partition_id, code, self._zone.zoneNum)
+        await self._send_bypass(code)
+
+    async def _send_bypass(self, code: str) -> None:
+        """Send the bypass toggle sequence for this zone."""
+        try:
+            await self._panel.bypassZone(
+                self._zone.partition_id, code, self._zone.zoneNum
+            )
+        except AdemcoError as err:
+            raise HomeAssistantError(str(err)) from err
+
+
+class AdemcoZoneStatusSensor(AdemcoEntity, BinarySensorEntity):
+    """Alarm, trouble or bypass state of an Ademco zone as its own entity."""
+
+    _attr_should_poll = False
+
+    _DEVICE_CLASSES = {
+        "alarm": BinarySensorDeviceClass.SAFETY,
+        "trouble": BinarySensorDeviceClass.PROBLEM,
+        "bypassed": None,
+    }
+
+    def __init__(
+        self,
+        panel,
+        device_id: str,
+        device_name: str,
+        entry_id: str,
+        zone: Zone,
+        zone_topology: ZoneTopology,
+        kind: str,
+    ) -> None:
+        """Initialize an Ademco zone status sensor."""
+        super().__init__(panel, device_id, device_name, entry_id)
+        self._zone = zone
+        self._kind = kind
+        base_name = zone_topology.name or f"Zone {zone.zoneNum}"
+        self._attr_name = f"{base_name} {kind.capitalize()}"
+        self._attr_device_class = self._DEVICE_CLASSES[kind]
+        if kind == "bypassed":
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_unique_id = self._build_unique_id(f"zone{zone.zoneNum}_{kind}")
+        self._remove_zone_callback = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register zone update callbacks when enabled."""
+        await super().async_added_to_hass()
+        self._remove_zone_callback = self._zone.registerCallback(self._handle_zone_update)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister callbacks."""
+        if self._remove_zone_callback is not None:
+            self._remove_zone_callback()
+            self._remove_zone_callback = None
+        await super().async_will_remove_from_hass()
+
+    @property
+    def is_on(self) -> bool:
+        """Return the zone's alarm, trouble or bypass bit."""
+        return getattr(self._zone, self._kind)
+
+    def _state_fingerprint(self) -> tuple:
+        return (self.available, self.is_on)
+
+    @callback
+    def _handle_zone_update(self) -> None:
+        """Write state only when this sensor's bit changed."""
+        self._async_write_state_if_changed()
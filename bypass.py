@@ -2,42 +2,121 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+import re
+from typing import TYPE_CHECKING
 
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.service import async_extract_entity_ids
 
-from .const import CONF_PARTITIONS
+from .ademco import AdemcoError
+from .const import DOMAIN
+from .entity import parse_unique_id
+from .topology import BYPASS_ZONE_TYPES, PanelTopology
 
-BYPASS_ZONE_TYPES = {"door", "window", "motion"}
+if TYPE_CHECKING:
+    from .ademco import AlarmPanel
 
+SERVICE_BYPASS_ZONES = "bypass_zones"
+BYPASS_ZONES_SCHEMA = cv.make_entity_service_schema({vol.Required("code"): cv.string})
 
-def build_partition_configs(config: Mapping[str, object]) -> dict[int, dict[str, object]]:
-    """Build partition config lookup keyed by partition id."""
-    return {
-        int(item["id"]): item
-        for item in config.get(CONF_PARTITIONS, [])
-        if isinstance(item, Mapping) and str(item.get("id", "")).isdigit()
-    }
+ZONE_KEY_RE = re.compile(r"zone(\d+)(?:_bypass|_bypassed)?$")
 
 
 def supports_bypass(
     zone_type: str,
     partition_id: int,
-    partition_configs: Mapping[int, Mapping[str, object]],
+    topology: PanelTopology,
 ) -> bool:
     """Return whether the zone supports bypass control."""
-    partition_config = partition_configs.get(partition_id, {})
-    return zone_type in BYPASS_ZONE_TYPES and bool(partition_config.get("userNumber"))
+    return zone_type in BYPASS_ZONE_TYPES and topology.is_controllable(partition_id)
 
 
 def validate_bypass_request(
     name: str,
     zone_type: str,
     partition_id: int,
-    partition_configs: Mapping[int, Mapping[str, object]],
+    topology: PanelTopology,
 ) -> None:
     """Raise if the entity is not configured for bypass control."""
-    if not supports_bypass(zone_type, partition_id, partition_configs):
+    if not supports_bypass(zone_type, partition_id, topology):
         raise HomeAssistantError(f"{name} is not configured for Ademco bypass control")
     if partition_id <= 0:
         raise HomeAssistantError(f"{name} has no valid partition")
+
+
+@callback
+def async_register_bypass_zones_service(hass: HomeAssistant) -> None:
+    """Register ademco.bypass_zones for batched multi-zone bypass."""
+
+    async def _async_bypass_zones(call: ServiceCall) -> None:
+        entity_registry = er.async_get(hass)
+        groups: dict[tuple[str, int], tuple[AlarmPanel, list[int]]] = {}
+
+        for entity_id in sorted(await async_extract_entity_ids(hass, call)):
+            registry_entry = entity_registry.async_get(entity_id)
+            parsed = (
+                parse_unique_id(registry_entry.unique_id)
+                if registry_entry is not None and registry_entry.platform == DOMAIN
+                else None
+            )
+            match = ZONE_KEY_RE.match(parsed[1]) if parsed is not None else None
+            if match is None:
+                raise HomeAssistantError(f"{entity_id} is not an Ademco zone")
+
+            config_entry = hass.config_entries.async_get_entry(
+                registry_entry.config_entry_id
+            )
+            if config_entry is None or config_entry.state is not ConfigEntryState.LOADED:
+                raise HomeAssistantError(f"The Ademco panel for {entity_id} is not loaded")
+            runtime_data = config_entry.runtime_data
+            topology = runtime_data.topology
+
+            zone_id = int(match.group(1))
+            zone = topology.zones_by_id.get(zone_id)
+            partition_id = runtime_data.panel.getZone(zone_id).partition_id
+            validate_bypass_request(
+                entity_id,
+                zone.zone_type if zone is not None else "",
+                partition_id,
+                topology,
+            )
+            groups.setdefault(
+                (config_entry.entry_id, partition_id), (runtime_data.panel, [])
+            )[1].append(zone_id)
+
+        if not groups:
+            raise HomeAssistantError("No Ademco zones were selected")
+
+        try:
+            futures = [
+                panel.bypassZones(partition_id, call.data["code"], zones)
+                for (_, partition_id), (panel, zones) in groups.items()
+            ]
+            results = await asyncio.gather(*futures)
+        except (ValueError, AdemcoError) as err:
+            raise HomeAssistantError(str(err)) from err
+
+        unconfirmed = sorted(
+            zone_id
+            for (_, zones), confirmed in zip(groups.values(), results)
+            for zone_id in zones
+            if zone_id not in confirmed
+        )
+        if unconfirmed:
+            raise HomeAssistantError(
+                "The panel did not confirm bypass for zones "
+                + ", ".join(str(zone_id) for zone_id in unconfirmed)
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BYPASS_ZONES,
+        _async_bypass_zones,
+        schema=BYPASS_ZONES_SCHEMA,
+    )
@@ -10,18 +10,27 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigFlowResult
-from homeassistant.helpers.selector import TextSelector, TextSelectorConfig, TextSelectorType
+from homeassistant.helpers.selector import (
+    BooleanSelector,
+    TextSelector,
+    TextSelectorConfig,
+    TextSelectorType,
+)
 
+from .ademco.transport import parse_tcp_address
 from .const import (
     CONF_BAUD,
     CONF_DEVICE,
     CONF_DOORS,
     CONF_GARAGE_DOORS,
+    CONF_IO_THREAD,
     CONF_MOTIONS,
     CONF_NAME,
+    CONF_OUTPUTS,
     CONF_PARTITIONS,
     CONF_PROBLEMS,
     CONF_WINDOWS,
+    CONF_ZONE_STATUS_ENTITIES,
     DEFAULT_NAME,
     DOMAIN,
 )
@@ -35,6 +44,13 @@ def _default_title(data: dict[str, Any]) -> str:
     return name or DEFAULT_NAME
 
 
+def _validate_device(device: str) -> None:
+    """Raise if a network device is not a usable host:port pair."""
+    address = parse_tcp_address(device)
+    if address is not None and not 0 < address[1] < 65536:
+        raise ValueError
+
+
 def _normalize_zone_list(value: Any) -> list[dict[str, str]]:
     """Validate stored zone definitions."""
     if value is None:
@@ -84,6 +100,29 @@ def _normalize_garage_doors(value: Any) -> list[dict[str, str]]:
     return normalized
 
 
+def _normalize_outputs(value: Any) -> list[dict[str, str]]:
+    """Validate stored output definitions."""
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError
+
+    normalized: list[dict[str, str]] = []
+    for item in value:
+        if not isinstance(item, dict):
+            raise ValueError
+        output_id = item.get("id")
+        name = item.get("name")
+        if output_id is None or name is None:
+            raise ValueError
+        if not 1 <= int(output_id) <= 96:
+            raise ValueError
+
+        normalized.append({"id": str(output_id), "name": str(name)})
+
+    return normalized
+
+
 def _normalize_partitions(value: Any) -> list[dict[str, str]]:
     """Validate stored partition definitions."""
     if value is None:
@@ -133,6 +172,15 @@ def _parse_garage_line(line: str) -> dict[str, str]:
     return {"id": parts[0], "name": parts[1], "output": parts[2]}
 
 
+def _parse_output_line(line: str) -> dict[str, str]:
+    """Parse a single output line in the form output:name."""
+    parts = [part.strip() for part in line.split(":", 1)]
+    if len(parts) != 2 or not parts[0] or not parts[1]:
+        raise ValueError
+
+    return {"id": parts[0], "name": parts[1]}
+
+
 def _parse_partition_line(line: str) -> dict[str, str]:
     """Parse a partition line in the form partition:userNumber[:name]."""
     parts = [part.strip() for part in line.split(":", 2)]
@@ -149,6 +197,7 @@ def _parse_mapping_text(
     raw_value: str,
     garage_doors: bool = False,
     partitions: bool = False,
+    outputs: bool = False,
 ) -> list[dict[str, str]]:
     """Parse multiline mapping text or legacy JSON arrays from the UI."""
     raw_value = raw_value.strip()
@@ -159,6 +208,8 @@ def _parse_mapping_text(
         value = json.loads(raw_value)
         if partitions:
             return _normalize_partitions(value)
+        if outputs:
+            return _normalize_outputs(value)
         if garage_doors:
             return _normalize_garage_doors(value)
         return _normalize_zone_list(value)
@@ -166,6 +217,8 @@ def _parse_mapping_text(
     parsed: list[dict[str, str]] = []
     if partitions:
         parser = _parse_partition_line
+    elif outputs:
+        parser = _parse_output_line
     elif garage_doors:
         parser = _parse_garage_line
     else:
@@ -178,6 +231,8 @@ def _parse_mapping_text(
 
     if partitions:
         return _normalize_partitions(parsed)
+    if outputs:
+        return _normalize_outputs(parsed)
     if garage_doors:
         return _normalize_garage_doors(parsed)
     return _normalize_zone_list(parsed)
@@ -203,6 +258,12 @@ def _serialize_garage_lines(value: Any) -> str:
     return "\n".join(lines)
 
 
+def _serialize_output_lines(value: Any) -> str:
+    """Render stored output data as multiline text for the UI."""
+    lines = [f"{item['id']}:{item['name']}" for item in _normalize_outputs(value)]
+    return "\n".join(lines)
+
+
 def _serialize_partition_lines(value: Any) -> str:
     """Render stored partition data as multiline text for the UI."""
     lines: list[str] = []
@@ -220,11 +281,14 @@ def _normalize_entry_data(data: dict[str, Any]) -> dict[str, Any]:
         CONF_NAME: str(data.get(CONF_NAME, "")).strip() or DEFAULT_NAME,
         CONF_DEVICE: str(data.get(CONF_DEVICE, "")).strip(),
         CONF_BAUD: str(data.get(CONF_BAUD, "1200")).strip() or "1200",
+        CONF_IO_THREAD: bool(data.get(CONF_IO_THREAD, False)),
         CONF_DOORS: _normalize_zone_list(data.get(CONF_DOORS, [])),
         CONF_WINDOWS: _normalize_zone_list(data.get(CONF_WINDOWS, [])),
         CONF_MOTIONS: _normalize_zone_list(data.get(CONF_MOTIONS, [])),
         CONF_PROBLEMS: _normalize_zone_list(data.get(CONF_PROBLEMS, [])),
+        CONF_ZONE_STATUS_ENTITIES: bool(data.get(CONF_ZONE_STATUS_ENTITIES, False)),
         CONF_GARAGE_DOORS: _normalize_garage_doors(data.get(CONF_GARAGE_DOORS, [])),
+        CONF_OUTPUTS: _normalize_outputs(data.get(CONF_OUTPUTS, [])),
         CONF_PARTITIONS: _normalize_partitions(data.get(CONF_PARTITIONS, [])),
     }
 
@@ -237,6 +301,9 @@ def _build_connection_schema(defaults: dict[str, Any] | None = None) -> vol.Sche
             vol.Optional(CONF_NAME, default=defaults.get(CONF_NAME, DEFAULT_NAME)): TEXT_SELECTOR,
             vol.Optional(CONF_DEVICE, default=defaults.get(CONF_DEVICE, "")): TEXT_SELECTOR,
             vol.Required(CONF_BAUD, default=defaults.get(CONF_BAUD, "1200")): TEXT_SELECTOR,
+            vol.Optional(
+                CONF_IO_THREAD, default=defaults.get(CONF_IO_THREAD, False)
+            ): BooleanSelector(),
         }
     )
 
@@ -262,6 +329,10 @@ def _build_zone_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
                 CONF_PROBLEMS,
                 default=_serialize_zone_lines(defaults.get(CONF_PROBLEMS)),
             ): TEXT_SELECTOR,
+            vol.Optional(
+                CONF_ZONE_STATUS_ENTITIES,
+                default=defaults.get(CONF_ZONE_STATUS_ENTITIES, False),
+            ): BooleanSelector(),
         }
     )
 
@@ -279,6 +350,19 @@ def _build_garage_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
     )
 
 
+def _build_output_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
+    """Build the output switch mappings form schema."""
+    defaults = defaults or {}
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_OUTPUTS,
+                default=_serialize_output_lines(defaults.get(CONF_OUTPUTS)),
+            ): TEXT_SELECTOR,
+        }
+    )
+
+
 def _build_partition_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
     """Build the partition mappings form schema."""
     defaults = defaults or {}
@@ -296,6 +380,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Ademco."""
 
     VERSION = 1
+    MINOR_VERSION = 2
 
     def __init__(self) -> None:
         """Initialize the config flow."""
@@ -305,21 +390,29 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle a user-initiated flow."""
-        if self._async_current_entries():
-            return self.async_abort(reason="already_configured")
-
+        errors: dict[str, str] = {}
         if user_input is not None:
-            self._config = {
-                CONF_NAME: user_input.get(CONF_NAME, DEFAULT_NAME),
-                CONF_DEVICE: user_input.get(CONF_DEVICE, ""),
-                CONF_BAUD: user_input.get(CONF_BAUD, "1200"),
-            }
-            return await self.async_step_zones()
+            device = str(user_input.get(CONF_DEVICE, "")).strip()
+            if device:
+                self._async_abort_entries_match({CONF_DEVICE: device})
+            try:
+                _validate_device(device)
+            except ValueError:
+                errors[CONF_DEVICE] = "invalid_device"
+            else:
+                self._config = {
+                    CONF_NAME: user_input.get(CONF_NAME, DEFAULT_NAME),
+                    CONF_DEVICE: user_input.get(CONF_DEVICE, ""),
+                    CONF_BAUD: user_input.get(CONF_BAUD, "1200"),
+                    CONF_IO_THREAD: user_input.get(CONF_IO_THREAD, False),
+                }
+                return await self.async_step_zones()
 
         self._config = {}
         return self.async_show_form(
             step_id="user",
-            data_schema=_build_connection_schema(),
+            data_schema=_build_connection_schema(user_input),
+            errors=errors,
         )
 
     async def async_step_reconfigure(
@@ -327,14 +420,21 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle a reconfiguration flow."""
         defaults = dict(self._get_reconfigure_entry().data)
+        errors: dict[str, str] = {}
         if user_input is not None:
-            self._config = {**defaults, **user_input}
-            return await self.async_step_zones()
+            try:
+                _validate_device(user_input.get(CONF_DEVICE, ""))
+            except ValueError:
+                errors[CONF_DEVICE] = "invalid_device"
+            else:
+                self._config = {**defaults, **user_input}
+                return await self.async_step_zones()
 
         self._config = defaults
         return self.async_show_form(
             step_id="reconfigure",
-            data_schema=_build_connection_schema(defaults),
+            data_schema=_build_connection_schema({**defaults, **(user_input or {})}),
+            errors=errors,
         )
 
     async def async_step_zones(
@@ -358,6 +458,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_PROBLEMS: _parse_mapping_text(
                             user_input.get(CONF_PROBLEMS, "")
                         ),
+                        CONF_ZONE_STATUS_ENTITIES: user_input.get(
+                            CONF_ZONE_STATUS_ENTITIES, False
+                        ),
                     }
                 )
             except JSONDecodeError:
@@ -391,7 +494,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except ValueError:
                 errors["base"] = "invalid_mapping"
             else:
-                return await self.async_step_partitions()
+                return await self.async_step_outputs()
 
         return self.async_show_form(
             step_id="garage_doors",
@@ -399,6 +502,32 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_outputs(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the optional output switch mapping step."""
+        defaults = self._config
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                self._config[CONF_OUTPUTS] = _parse_mapping_text(
+                    user_input.get(CONF_OUTPUTS, ""),
+                    outputs=True,
+                )
+            except JSONDecodeError:
+                errors["base"] = "invalid_json"
+            except ValueError:
+                errors["base"] = "invalid_mapping"
+            else:
+                return await self.async_step_partitions()
+
+        return self.async_show_form(
+            step_id="outputs",
+            data_schema=_build_output_schema(defaults),
+            errors=errors,
+        )
+
     async def async_step_partitions(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -8,12 +8,21 @@ MANUFACTURER = "Ademco"
 MODEL = "RS232 Alarm Panel"
 DEFAULT_NAME = "Ademco Panel"
 
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+DATA_TRIGGER_CACHE = f"{DOMAIN}_trigger_cache"
+
+# Fired on the bus for every decoded panel system (NQ) event.
+EVENT_ADEMCO = f"{DOMAIN}_event"
+
 CONF_NAME = "name"
 CONF_DEVICE = "device"
 CONF_BAUD = "baud"
+CONF_IO_THREAD = "io_thread"
 CONF_DOORS = "doors"
 CONF_WINDOWS = "windows"
 CONF_MOTIONS = "motions"
 CONF_PROBLEMS = "problems"
+CONF_ZONE_STATUS_ENTITIES = "zone_status_entities"
 CONF_GARAGE_DOORS = "garagedoors"
+CONF_OUTPUTS = "outputs"
 CONF_PARTITIONS = "partitions"
@@ -13,16 +13,22 @@ from homeassistant.components.cover import (
     CoverState,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import AdemcoConfigEntry
-from .const import CONF_GARAGE_DOORS
+from .ademco import AdemcoError
 from .entity import AdemcoEntity
 
 log = logging.getLogger(__name__)
 
+RELAY_PULSE_SECONDS = 1.5
+# Covers the relay pulse, command pacing and the time for the contact to move.
+DOOR_TRAVEL_TIMEOUT = 12
+
 if TYPE_CHECKING:
-    from .ademco import Output, Zone
+    from .ademco import Output, OutputSchedule, Zone
+    from .topology import GarageDoorTopology
 
 
 async def async_setup_entry(
@@ -34,17 +40,17 @@ async def async_setup_entry(
     entities = []
     runtime_data = entry.runtime_data
     panel = runtime_data.panel
-    config = runtime_data.config
 
-    for garage_config in config.get(CONF_GARAGE_DOORS, []):
+    for garage_door in runtime_data.topology.garage_doors:
         entities.append(
             AdemcoGarageDoor(
                 panel,
                 runtime_data.device_id,
                 runtime_data.device_name,
-                panel.getZone(garage_config["id"]),
-                panel.getOutput(garage_config["output"]),
-                garage_config,
+                runtime_data.entry_id,
+                panel.getZone(garage_door.zone_id),
+                panel.getOutput(garage_door.output_id),
+                garage_door,
             )
         )
 
@@ -57,25 +63,32 @@ class AdemcoGarageDoor(AdemcoEntity, CoverEntity):
     _attr_should_poll = False
     _attr_device_class = CoverDeviceClass.GARAGE
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
+    _unrecorded_attributes = frozenset({"partition_id"})
+    # The door state comes from its zone and the relay pulse needs outputs.
+    _readiness = ("zones", "outputs")
 
     def __init__(
         self,
         panel,
         device_id: str,
         device_name: str,
+        entry_id: str,
         zone: Zone,
         output: Output,
-        config: dict[str, str],
+        garage_door: GarageDoorTopology,
     ) -> None:
         """Initialize an Ademco garage door."""
-        super().__init__(panel, device_id, device_name)
+        super().__init__(panel, device_id, device_name, entry_id)
         self._zone = zone
         self._output = output
-        self._config = config
+        door_name = garage_door.name or f"Zone {zone.zoneNum}"
+        self._attr_name = f"{door_name} Garage Door"
         self._status = CoverState.OPEN if zone.opened else CoverState.CLOSED
-        self._attr_unique_id = f"ademco.zone{self._zone.zoneNum}"
+        self._attr_unique_id = self._build_unique_id(f"zone{self._zone.zoneNum}")
         self._remove_zone_callback = None
         self._operation_lock = asyncio.Lock()
+        self._wait_target: CoverState | None = None
+        self._status_waiter: asyncio.Future[None] | None = None
 
     async def async_added_to_hass(self) -> None:
         """Register zone updates when the entity is added."""
@@ -89,9 +102,8 @@ class AdemcoGarageDoor(AdemcoEntity, CoverEntity):
             self._remove_zone_callback = None
         await super().async_will_remove_from_hass()
 
-    @property
-    def extra_state_attributes(self):
-        """Return extra state attributes."""
+    def _build_extra_state_attributes(self):
+        """Build extra state attributes."""
         return {
             "bypassed": self._zone.bypassed,
             "alarm": self._zone.alarm,
@@ -99,14 +111,6 @@ class AdemcoGarageDoor(AdemcoEntity, CoverEntity):
             "partition_id": self._zone.partition_id,
         }
 
-    @property
-    def name(self):
-        """Return the legacy-compatible garage door name."""
-        door_name = self._config.get("name", "").strip()
-        if not door_name:
-            return f"Zone {self._zone.zoneNum} Garage Door"
-        return f"{door_name} Garage Door"
-
     @property
     def current_cover_position(self):
         """Return 100 when open and 0 when closed."""
@@ -136,24 +140,58 @@ class AdemcoGarageDoor(AdemcoEntity, CoverEntity):
             self._status = CoverState.OPEN
         else:
             self._status = CoverState.CLOSED
-        self.async_write_ha_state()
-
-    async def _wait_for_status(self, target: CoverState, timeout: int = 10) -> bool:
-        """Wait for the zone callback to report the requested cover state."""
-        for _ in range(timeout):
-            await asyncio.sleep(1)
-            if self._status == target:
-                return True
-        return False
+        waiter = self._status_waiter
+        if waiter is not None and not waiter.done() and self._status == self._wait_target:
+            waiter.set_result(None)
+        self._invalidate_attributes()
+        self._async_write_state_if_changed()
+
+    def _state_fingerprint(self) -> tuple:
+        zone = self._zone
+        return (self.available, self._status, *zone.bitStatus, zone.partition_id)
+
+    async def _run_door(self, target: CoverState, timeout: float = DOOR_TRAVEL_TIMEOUT) -> bool:
+        """Pulse the relay and wait for the zone callback to report ``target``."""
+        self._wait_target = target
+        waiter = self._status_waiter = self.hass.loop.create_future()
+        try:
+            schedule = self.toggleRelay()
+            schedule.done.add_done_callback(
+                lambda _: self._pulse_finished(schedule, waiter)
+            )
+            async with asyncio.timeout(timeout):
+                await self._status_waiter
+            return True
+        except TimeoutError:
+            return False
+        except AdemcoError as err:
+            # The pulse never reached the panel; show the door as it really is.
+            self._wait_target = None
+            self._update_status()
+            raise HomeAssistantError(f"Could not move {self.name}: {err}") from err
+        finally:
+            self._wait_target = None
+            self._status_waiter = None
+            if not waiter.done():
+                waiter.cancel()
+
+    @staticmethod
+    def _pulse_finished(
+        schedule: OutputSchedule, waiter: asyncio.Future[None]
+    ) -> None:
+        # A rejected pulse fails the wait at once instead of after the travel
+        # timeout.
+        if schedule.error is not None and not waiter.done():
+            waiter.set_exception(schedule.error)
 
-    async def toggleRelay(self):
-        self._output.turnOn()
-        await asyncio.sleep(1.5)
-        self._output.turnOff()
+    def toggleRelay(self) -> OutputSchedule:
+        return self._panel.pulseOutput(self._output.outputId, RELAY_PULSE_SECONDS)
 
     async def async_open_cover(self, **kwargs):
-        if not self._panel.available:
-            log.warning("Could not open %s - panel is unavailable", self.name)
+        if not self.available:
+            log.warning(
+                "Could not open %s - zone or output status is not current", self.name
+            )
             return
 
         if self._operation_lock.locked():
@@ -163,10 +201,13 @@ class AdemcoGarageDoor(AdemcoEntity, CoverEntity):
         async with self._operation_lock:
             if self._zone.closed:
                 self._status = CoverState.OPENING
-                self.async_write_ha_state()
-                await self.toggleRelay()
-                if not await self._wait_for_status(CoverState.OPEN):
-                    log.critical("Garage door: %s did not open after 10 seconds", self.name)
+                self._async_write_state()
+                if not await self._run_door(CoverState.OPEN):
+                    log.critical(
+                        "Garage door: %s did not open after %s seconds",
+                        self.name,
+                        DOOR_TRAVEL_TIMEOUT,
+                    )
                     self._update_status()
             else:
                 log.info(
@@ -176,8 +217,10 @@ class AdemcoGarageDoor(AdemcoEntity, CoverEntity):
                 )
 
     async def async_close_cover(self, **kwargs):
-        if not self._panel.available:
-            log.warning("Could not close %s - panel is unavailable", self.name)
+        if not self.available:
+            log.warning(
+                "Could not close %s - zone or output status is not current", self.name
+            )
             return
 
         if self._operation_lock.locked():
@@ -187,10 +230,13 @@ class AdemcoGarageDoor(AdemcoEntity, CoverEntity):
         async with self._operation_lock:
             if self._zone.opened:
                 self._status = CoverState.CLOSING
-                self.async_write_ha_state()
-                await self.toggleRelay()
-                if not await self._wait_for_status(CoverState.CLOSED):
-                    log.critical("Garage door: %s did not close after 10 seconds", self.name)
+                self._async_write_state()
+                if not await self._run_door(CoverState.CLOSED):
+                    log.critical(
+                        "Garage door: %s did not close after %s seconds",
+                        self.name,
+                        DOOR_TRAVEL_TIMEOUT,
+                    )
                     self._update_status()
             else:
                 log.info(
@@ -1,4 +1,4 @@
-"""Provides device triggers for Ademco binary sensors."""
+"""Provides device triggers for Ademco binary sensors and panel events."""
 
 from __future__ import annotations
 
@@ -10,11 +10,19 @@ from homeassistant.components.device_automation.const import (
     CONF_TURNED_OFF,
     CONF_TURNED_ON,
 )
-from homeassistant.components.homeassistant.triggers import state as state_trigger
-from homeassistant.const import CONF_ENTITY_ID, CONF_FOR, CONF_TYPE
-from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.components.homeassistant.triggers import (
+    event as event_trigger,
+    state as state_trigger,
+)
+from homeassistant.const import CONF_DEVICE_ID, CONF_ENTITY_ID, CONF_FOR, CONF_TYPE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 
-from .const import DOMAIN
+from .const import DATA_TRIGGER_CACHE, DOMAIN, EVENT_ADEMCO
 
 CONF_MOTION = "motion"
 CONF_NO_MOTION = "no_motion"
@@ -57,7 +65,19 @@ ENTITY_TRIGGERS: dict[BinarySensorDeviceClass | str, list[dict[str, str]]] = {
     "none": [{CONF_TYPE: CONF_TURNED_ON}, {CONF_TYPE: CONF_TURNED_OFF}],
 }
 
-TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+# Panel-level triggers listen for ademco_event directly, keyed by category.
+PANEL_TRIGGERS = {
+    "panel_alarm": "alarm",
+    "panel_fire": "fire",
+    "panel_panic": "panic",
+    "panel_trouble": "trouble",
+    "panel_ac_fail": "ac_fail",
+    "panel_armed": "arm",
+    "panel_disarmed": "disarm",
+    "panel_bypass": "bypass",
+}
+
+ENTITY_TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
         vol.Required(CONF_TYPE): vol.In(TURNED_OFF + TURNED_ON),
@@ -65,9 +85,30 @@ TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     }
 )
 
+PANEL_TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {vol.Required(CONF_TYPE): vol.In(PANEL_TRIGGERS)}
+)
+
+TRIGGER_SCHEMA = vol.Any(PANEL_TRIGGER_SCHEMA, ENTITY_TRIGGER_SCHEMA)
+
 
 async def async_attach_trigger(hass, config, action, automation_info):
-    """Listen for state changes based on configuration."""
+    """Listen for panel events or state changes based on configuration."""
+    if config[CONF_TYPE] in PANEL_TRIGGERS:
+        event_config = event_trigger.TRIGGER_SCHEMA(
+            {
+                event_trigger.CONF_PLATFORM: "event",
+                event_trigger.CONF_EVENT_TYPE: EVENT_ADEMCO,
+                event_trigger.CONF_EVENT_DATA: {
+                    CONF_DEVICE_ID: config[CONF_DEVICE_ID],
+                    "category": PANEL_TRIGGERS[config[CONF_TYPE]],
+                },
+            }
+        )
+        return await event_trigger.async_attach_trigger(
+            hass, event_config, action, automation_info, platform_type="device"
+        )
+
     to_state = "on" if config[CONF_TYPE] in TURNED_ON else "off"
 
     state_config = {
@@ -84,11 +125,61 @@ async def async_attach_trigger(hass, config, action, automation_info):
     )
 
 
+@callback
+def _async_get_trigger_cache(hass: HomeAssistant) -> dict[str, list[dict[str, str]]]:
+    """Return the per-device trigger cache, creating it on first use.
+
+    The cache is dropped whenever a binary sensor registry entry is created,
+    updated or removed. That covers new zones, device moves and device class
+    overrides without having to track which device each entity belonged to.
+    """
+    if (cache := hass.data.get(DATA_TRIGGER_CACHE)) is not None:
+        return cache
+
+    cache = hass.data[DATA_TRIGGER_CACHE] = {}
+
+    @callback
+    def _async_filter(event_data: er.EventEntityRegistryUpdatedData) -> bool:
+        return event_data["entity_id"].startswith("binary_sensor.")
+
+    @callback
+    def _async_invalidate(_event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        cache.clear()
+
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED, _async_invalidate, event_filter=_async_filter
+    )
+    return cache
+
+
 async def async_get_triggers(hass, device_id):
     """List available triggers for Ademco binary sensors on a device."""
+    cache = _async_get_trigger_cache(hass)
+    if (triggers := cache.get(device_id)) is None:
+        triggers = cache[device_id] = _build_triggers(hass, device_id)
+    return list(triggers)
+
+
+@callback
+def _build_triggers(hass: HomeAssistant, device_id: str) -> list[dict[str, str]]:
+    """Build the panel and zone trigger list for one device."""
     triggers = []
     entity_registry = er.async_get(hass)
 
+    device = dr.async_get(hass).async_get(device_id)
+    if device is not None and any(
+        domain == DOMAIN for domain, _ in device.identifiers
+    ):
+        triggers.extend(
+            {
+                CONF_TYPE: trigger_type,
+                "platform": "device",
+                "device_id": device_id,
+                "domain": DOMAIN,
+            }
+            for trigger_type in PANEL_TRIGGERS
+        )
+
     for entry in er.async_entries_for_device(entity_registry, device_id):
         if entry.domain != "binary_sensor":
             continue
@@ -114,6 +205,8 @@ async def async_get_triggers(hass, device_id):
 
 async def async_get_trigger_capabilities(hass, config):
     """List trigger capabilities."""
+    if config[CONF_TYPE] in PANEL_TRIGGERS:
+        return {}
     return {
         "extra_fields": vol.Schema(
             {vol.Optional(CONF_FOR): cv.positive_time_period_dict}
@@ -0,0 +1,61 @@
+"""Diagnostics support for the Ademco integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import AdemcoConfigEntry
+from .ademco import SUBSYSTEMS
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: AdemcoConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for an Ademco config entry."""
+    runtime_data = entry.runtime_data
+    panel = runtime_data.panel
+    transport = panel.transport
+    snapshot = panel.snapshot()
+    return {
+        "config": runtime_data.config,
+        "panel": {
+            "connected": panel.connected,
+            "initialized": panel.is_initialized,
+            "transport": type(transport).__name__ if transport is not None else None,
+            "active_partition_ids": panel.active_partition_ids,
+            "link": panel.link_stats,
+            "write_queue": {
+                "waiting": len(panel.writeQueue),
+                "expired": panel.writeQueue.expired,
+            },
+            "subsystems": {
+                subsystem: {
+                    "ready": panel.is_ready(subsystem),
+                    "report_age": panel.report_age(subsystem),
+                }
+                for subsystem in SUBSYSTEMS
+            },
+        },
+        "state": {
+            "version": snapshot.version,
+            # Zones with any status bit set; the rest are closed.
+            "zones": {
+                zone.zone_id: zone.status for zone in snapshot.zones if zone.status
+            },
+            "partitions": {
+                partition_id: partition.status
+                for partition_id, partition in snapshot.partitions.items()
+            },
+            "outputs_on": sorted(snapshot.outputs_on),
+        },
+        # Recent frames, oldest first, with user codes masked.
+        "trace": panel.trace.entries(),
+        "startup": {
+            # Seconds from the start of config entry setup.
+            "setup": runtime_data.setup_timings,
+            # Seconds from the panel start.
+            "panel": panel.startup_timings,
+        },
+    }
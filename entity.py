@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -14,16 +14,41 @@ if TYPE_CHECKING:
     from .ademco import AlarmPanel
 
 
+def build_unique_id(entry_id: str, key: str) -> str:
+    """Return a unique ID namespaced to one panel config entry."""
+    return f"{DOMAIN}.{entry_id}.{key}"
+
+
+def parse_unique_id(unique_id: str) -> tuple[str, str] | None:
+    """Split a namespaced unique ID into ``(entry_id, key)``."""
+    domain, _, rest = unique_id.partition(".")
+    entry_id, _, key = rest.partition(".")
+    if domain != DOMAIN or not entry_id or not key:
+        return None
+    return entry_id, key
+
+
 class AdemcoEntity(Entity):
     """Base entity for Ademco entities attached to a panel device."""
 
     _attr_has_entity_name = False
     _attr_should_poll = False
+    # Fingerprint of the state last written by this integration.
+    _last_state_fingerprint: tuple | None = None
+    # Attributes are built on change and reused for every write in between.
+    _cached_attributes: dict[str, Any] | None = None
+    # Panel subsystems whose reports back this entity's state; see
+    # ``AlarmPanel.is_ready``.
+    _readiness: tuple[str, ...] = ("zones",)
 
-    def __init__(self, panel: AlarmPanel, device_id: str, device_name: str) -> None:
+    def __init__(
+        self, panel: AlarmPanel, device_id: str, device_name: str, entry_id: str
+    ) -> None:
         """Initialize the shared entity state."""
         self._panel = panel
+        self._entry_id = entry_id
         self._remove_panel_callback = None
+        self._partition_map_version = panel.partition_map_version
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device_id)},
             manufacturer=MANUFACTURER,
@@ -31,10 +56,14 @@ class AdemcoEntity(Entity):
             name=device_name,
         )
 
+    def _build_unique_id(self, key: str) -> str:
+        """Return this panel's unique ID for an entity key such as zone17."""
+        return build_unique_id(self._entry_id, key)
+
     @property
     def available(self) -> bool:
-        """Return if the backing panel connection is available."""
-        return self._panel.available
+        """Return if the reports backing this entity are fresh."""
+        return all(self._panel.is_ready(subsystem) for subsystem in self._readiness)
 
     async def async_added_to_hass(self) -> None:
         """Register for panel availability updates."""
@@ -48,7 +77,45 @@ class AdemcoEntity(Entity):
             self._remove_panel_callback()
             self._remove_panel_callback = None
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the cached attributes, building them after an invalidation."""
+        if self._cached_attributes is None:
+            self._cached_attributes = self._build_extra_state_attributes()
+        return self._cached_attributes
+
+    def _build_extra_state_attributes(self) -> dict[str, Any] | None:
+        """Build the extra state attributes; called only after a change."""
+        return None
+
+    @callback
+    def _invalidate_attributes(self) -> None:
+        self._cached_attributes = None
+
+    def _state_fingerprint(self) -> tuple:
+        """Return a cheap summary of everything this entity writes.
+
+        Subclasses extend it with the core values behind their state and
+        attributes. It must change whenever the written state would.
+        """
+        return (self.available,)
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write state and remember its fingerprint."""
+        self._last_state_fingerprint = self._state_fingerprint()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write state only when the fingerprint moved since the last write."""
+        if self._state_fingerprint() != self._last_state_fingerprint:
+            self._async_write_state()
+
     @callback
     def _handle_panel_update(self) -> None:
         """Write state after a panel-level update."""
-        self.async_write_ha_state()
+        if self._partition_map_version != self._panel.partition_map_version:
+            self._partition_map_version = self._panel.partition_map_version
+            self._invalidate_attributes()
+        self._async_write_state_if_changed()
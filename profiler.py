@@ -0,0 +1,213 @@
+"""On-demand profiling and wire trace dumps for the Ademco integration."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+from pathlib import Path
+import pstats
+import re
+import time
+import tracemalloc
+
+import voluptuous as vol
+
+from homeassistant.components import persistent_notification
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+log = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+SERVICE_DUMP_TRACE = "dump_trace"
+SERVICE_SET_TRACE_SAMPLE = "set_trace_sample"
+
+CONF_SECONDS = "seconds"
+CONF_TOP = "top"
+CONF_SAMPLE = "sample"
+
+DEFAULT_SECONDS = 60
+DEFAULT_TOP = 30
+MAX_SECONDS = 600
+DEFAULT_TRACE_SAMPLE = 1
+MAX_TRACE_SAMPLE = 1000
+
+INTEGRATION_DIR = str(Path(__file__).resolve().parent)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SECONDS, default=DEFAULT_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_SECONDS)
+        ),
+        vol.Optional(CONF_TOP, default=DEFAULT_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
+    }
+)
+
+TRACE_SAMPLE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SAMPLE, default=DEFAULT_TRACE_SAMPLE): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_TRACE_SAMPLE)
+        ),
+    }
+)
+
+
+@callback
+def async_register_profile_service(hass: HomeAssistant) -> None:
+    """Register the ademco.profile service.
+
+    Nothing is hooked until the service runs, so an idle integration pays no
+    profiling cost.
+    """
+    lock = asyncio.Lock()
+
+    async def _async_profile(call: ServiceCall) -> None:
+        if lock.locked():
+            raise HomeAssistantError("An Ademco profile is already running")
+        async with lock:
+            await _async_run_profile(hass, call.data[CONF_SECONDS], call.data[CONF_TOP])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
+
+
+async def _async_run_profile(hass: HomeAssistant, seconds: float, top: int) -> None:
+    """Profile the event loop thread for a bounded window.
+
+    The panel listener, write queue and entity callbacks all run on the Home
+    Assistant loop, so profiling that thread covers every integration coroutine.
+    """
+    profiler = cProfile.Profile()
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    log.info("Profiling the Ademco integration for %s seconds", seconds)
+    profiler.enable()
+    try:
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+        # Copying every trace can take a while; keep it off the loop.
+        snapshot = await hass.async_add_executor_job(tracemalloc.take_snapshot)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    prof_path = hass.config.path(f"ademco_profile_{stamp}.prof")
+    summary_path = hass.config.path(f"ademco_profile_{stamp}.txt")
+    await hass.async_add_executor_job(
+        _write_profile, profiler, snapshot, seconds, top, prof_path, summary_path
+    )
+
+    log.info("Wrote Ademco profile to %s and %s", prof_path, summary_path)
+    persistent_notification.async_create(
+        hass,
+        f"Wrote `{prof_path}` and a top-{top} summary to `{summary_path}`.",
+        title="Ademco profile complete",
+        notification_id=f"{DOMAIN}_profile",
+    )
+
+
+def _write_profile(
+    profiler: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot,
+    seconds: float,
+    top: int,
+    prof_path: str,
+    summary_path: str,
+) -> None:
+    """Write the raw profile and a human-readable summary."""
+    profiler.dump_stats(prof_path)
+
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    total_time = 0.0
+    integration_time = 0.0
+    for (filename, _line, _func), (_cc, _nc, tottime, _ct, _callers) in stats.stats.items():
+        total_time += tottime
+        if filename.startswith(INTEGRATION_DIR):
+            integration_time += tottime
+
+    share = (integration_time / total_time * 100) if total_time else 0.0
+    output.write(f"Ademco profile over {seconds:g} seconds\n")
+    output.write(f"Loop thread CPU time: {total_time:.3f}s\n")
+    output.write(
+        f"Ademco integration own time: {integration_time:.3f}s ({share:.1f}%)\n\n"
+    )
+
+    output.write(f"Top {top} Ademco functions by cumulative time\n")
+    stats.sort_stats("cumulative").print_stats(re.escape(INTEGRATION_DIR), top)
+
+    output.write(f"\nTop {top} Ademco allocation sites\n")
+    filtered = snapshot.filter_traces(
+        [tracemalloc.Filter(True, f"{INTEGRATION_DIR}/*")]
+    )
+    for stat in filtered.statistics("lineno")[:top]:
+        output.write(f"  {stat}\n")
+
+    Path(summary_path).write_text(output.getvalue(), encoding="utf-8")
+
+
+@callback
+def async_register_trace_service(hass: HomeAssistant) -> None:
+    """Register the ademco.dump_trace and ademco.set_trace_sample services.
+
+    Each panel keeps its recent frames in memory; dump_trace writes them out,
+    one file per loaded panel, with user codes masked. set_trace_sample keeps
+    every Nth frame from then on, or stops recording at 0.
+    """
+
+    def _loaded_entries() -> list:
+        entries = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+        ]
+        if not entries:
+            raise HomeAssistantError("No Ademco panel is loaded")
+        return entries
+
+    async def _async_dump_trace(call: ServiceCall) -> None:
+        entries = _loaded_entries()
+
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        paths = []
+        for entry in entries:
+            path = hass.config.path(f"ademco_trace_{entry.entry_id}_{stamp}.txt")
+            count = await hass.async_add_executor_job(
+                entry.runtime_data.panel.trace.dump, path
+            )
+            log.info("Wrote %s Ademco frames to %s", count, path)
+            paths.append(path)
+
+        persistent_notification.async_create(
+            hass,
+            "\n".join(f"Wrote `{path}`." for path in paths),
+            title="Ademco wire trace",
+            notification_id=f"{DOMAIN}_trace",
+        )
+
+    async def _async_set_trace_sample(call: ServiceCall) -> None:
+        sample = call.data[CONF_SAMPLE]
+        for entry in _loaded_entries():
+            entry.runtime_data.panel.trace.sample = sample
+        log.info("Ademco wire trace now keeps every %s frame(s)", sample)
+
+    hass.services.async_register(DOMAIN, SERVICE_DUMP_TRACE, _async_dump_trace)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TRACE_SAMPLE,
+        _async_set_trace_sample,
+        schema=TRACE_SAMPLE_SCHEMA,
+    )
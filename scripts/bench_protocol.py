@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+"""Benchmark the Ademco protocol core on a replayed byte stream.
+
+Feeds a synthetic stream of zone reports, events, arming and output reports
+through ``PanelProtocol.receive_data`` in fixed-size chunks, with no event
+loop or transport involved.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ademco.protocol import PanelProtocol, checksum  # noqa: E402
+
+
+def frame(body: str) -> bytes:
+    message = f"{len(body) + 6:02X}{body}00"
+    return f"{message}{checksum(message)}\r\n".encode()
+
+
+def build_stream(frames: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    parts = [frame("ZP" + "1" * 96)]
+    for _ in range(frames):
+        kind = rng.random()
+        if kind < 0.5:
+            parts.append(frame("ZS" + "".join(rng.choice("0019") for _ in range(96))))
+        elif kind < 0.8:
+            zone = rng.randrange(96)
+            parts.append(frame(f"NQ{rng.choice(['2B', '2C', '11', '12'])}{zone:02X}00"))
+        elif kind < 0.9:
+            parts.append(frame("AS" + "".join(rng.choice("ADHN") for _ in range(8))))
+        else:
+            parts.append(frame("CS" + "".join(rng.choice("01") for _ in range(96))))
+    return b"".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--chunk", type=int, default=64, help="bytes per feed")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stream = build_stream(args.frames, args.seed)
+    protocol = PanelProtocol()
+    records = 0
+    start = time.perf_counter()
+    for offset in range(0, len(stream), args.chunk):
+        records += len(protocol.receive_data(stream[offset : offset + args.chunk]))
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.frames} frames, {len(stream)} bytes, {args.chunk} byte chunks")
+    print(f"  {records} records in {elapsed * 1000:.1f} ms")
+    print(f"  {args.frames / elapsed:,.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
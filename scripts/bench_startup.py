@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""Benchmark Ademco panel startup against a simulated panel.
+
+Each run starts one or more panels on the in-memory loopback transport and
+reports the startup phases recorded in ``AlarmPanel.startup_timings``:
+connect, first_frame, zone_sync and full_sync.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import statistics
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ademco import AlarmPanel, LoopbackTransport, Scheduler, checksum  # noqa: E402
+
+PHASES = ("connect", "first_frame", "zone_sync", "full_sync")
+
+REPLIES = {
+    b"zs": "ZS" + "0" * 96,
+    b"zp": "ZP" + "1" * 96,
+    b"cs": "CS" + "0" * 96,
+    b"as": "AS" + "D" + "0" * 7,
+}
+
+
+def frame(body: str) -> bytes:
+    message = f"{len(body) + 6:02X}{body}00"
+    return f"{message}{checksum(message)}\r\n".encode()
+
+
+def make_responder(loop: asyncio.AbstractEventLoop, transport_ref: list, latency: float):
+    """Answer status requests the way a panel would, after ``latency``."""
+    frames = {command: frame(body) for command, body in REPLIES.items()}
+
+    def responder(sent: bytes) -> None:
+        reply = frames.get(sent[2:4])
+        if reply is not None:
+            loop.call_later(latency, transport_ref[0].feed, reply)
+
+    return responder
+
+
+async def run_once(panels: int, latency: float) -> list[dict[str, float]]:
+    loop = asyncio.get_running_loop()
+    scheduler = Scheduler(loop)
+    started = []
+    for _ in range(panels):
+        transport_ref: list[LoopbackTransport] = []
+        transport = LoopbackTransport(make_responder(loop, transport_ref, latency))
+        transport_ref.append(transport)
+        panel = AlarmPanel(
+            {"device": ""}, loop=loop, transport=transport, scheduler=scheduler
+        )
+        await panel.async_start()
+        started.append(panel)
+
+    try:
+        while any("full_sync" not in panel.startup_timings for panel in started):
+            await asyncio.sleep(0.001)
+    finally:
+        for panel in started:
+            await panel.async_stop()
+        scheduler.close()
+    return [dict(panel.startup_timings) for panel in started]
+
+
+def summarize(samples: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    summary = {}
+    for phase in PHASES:
+        values = [sample[phase] * 1000 for sample in samples if phase in sample]
+        if values:
+            summary[phase] = {
+                "median_ms": round(statistics.median(values), 3),
+                "min_ms": round(min(values), 3),
+                "max_ms": round(max(values), 3),
+            }
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--panels", type=int, default=1, help="panels per run")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="simulated panel reply latency in seconds",
+    )
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args()
+
+    samples: list[dict[str, float]] = []
+    for _ in range(args.runs):
+        samples.extend(asyncio.run(run_once(args.panels, args.latency)))
+    summary = summarize(samples)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"{args.runs} runs x {args.panels} panel(s), {args.latency * 1000:g} ms reply latency")
+    for phase, stats in summary.items():
+        print(
+            f"  {phase:<12} median {stats['median_ms']:>9.3f} ms"
+            f"  min {stats['min_ms']:>9.3f} ms  max {stats['max_ms']:>9.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,18 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Iterator
 import json
 from pathlib import Path
+import re
+import sys
+
+# Only these fields are kept per entry, so memory stays flat on big installs.
+ENTITY_FIELDS = ("id", "unique_id", "entity_id", "device_id", "config_entry_id")
+DEVICE_FIELDS = ("id", "identifiers", "name", "name_by_user")
+
+STREAM_CHUNK_SIZE = 1 << 20
+WHITESPACE = re.compile(r"[\s,]*")
 
 
 def load_json(path: Path) -> dict:
@@ -14,14 +24,79 @@ def load_json(path: Path) -> dict:
         return json.load(handle)
 
 
-def load_entity_entries(path: Path) -> list[dict]:
-    data = load_json(path)
-    return [entry for entry in data["data"]["entities"] if entry.get("platform") == "ademco"]
+def iter_array_items(path: Path, key: str) -> Iterator[dict]:
+    """Yield the objects of the first ``"key": [...]`` array in a JSON file.
+
+    The file is read in chunks and each array item is decoded on its own, so
+    only one item is held in memory at a time.
+    """
+    decoder = json.JSONDecoder()
+    marker = re.compile(rf'"{re.escape(key)}"\s*:\s*\[')
+    with path.open("r", encoding="utf-8") as handle:
+        buffer = ""
+        pos = 0
+
+        def fill() -> bool:
+            # Drop what was consumed before appending, so the buffer only
+            # ever holds the unparsed tail plus one chunk.
+            nonlocal buffer, pos
+            chunk = handle.read(STREAM_CHUNK_SIZE)
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return bool(chunk)
+
+        while (match := marker.search(buffer)) is None:
+            # Keep a tail in case the marker straddles two chunks.
+            pos = max(0, len(buffer) - len(key) - 16)
+            if not fill():
+                raise ValueError(f"{path} has no {key!r} array")
+        pos = match.end()
+
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                if not fill():
+                    raise ValueError(f"{path} ends inside the {key!r} array")
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if not fill():
+                    raise
+                continue
+            yield item
+            pos = end
+
+
+def is_ademco_device(entry: dict) -> bool:
+    identifiers = entry.get("identifiers") or []
+    return any(identifier[0] == "ademco" for identifier in identifiers)
 
 
-def load_device_entries(path: Path) -> list[dict]:
-    data = load_json(path)
-    return data["data"]["devices"]
+def slim(entry: dict, fields: tuple[str, ...]) -> dict:
+    return {field: entry.get(field) for field in fields}
+
+
+def load_entity_entries(path: Path, stream: bool = False) -> list[dict]:
+    if stream:
+        entries = iter_array_items(path, "entities")
+    else:
+        entries = load_json(path)["data"]["entities"]
+    return [
+        slim(entry, ENTITY_FIELDS)
+        for entry in entries
+        if entry.get("platform") == "ademco"
+    ]
+
+
+def load_device_entries(path: Path, stream: bool = False) -> list[dict]:
+    if stream:
+        entries = iter_array_items(path, "devices")
+    else:
+        entries = load_json(path)["data"]["devices"]
+    return [slim(entry, DEVICE_FIELDS) for entry in entries if is_ademco_device(entry)]
 
 
 def key_by(entries: list[dict], field: str) -> dict[str, dict]:
@@ -33,90 +108,204 @@ def key_by(entries: list[dict], field: str) -> dict[str, dict]:
     return keyed
 
 
-def print_entity_changes(before: list[dict], after: list[dict]) -> None:
+def diff_entities(before: list[dict], after: list[dict]) -> dict:
+    """Diff two Ademco entity lists by unique_id.
+
+    Registry entries whose registry id survived but whose unique_id changed
+    (an in-place unique ID migration) are reported as ``reidentified`` instead
+    of as a removal plus an addition.
+    """
     before_by_unique = key_by(before, "unique_id")
     after_by_unique = key_by(after, "unique_id")
+    after_by_id = key_by(after, "id")
 
-    removed = sorted(set(before_by_unique) - set(after_by_unique))
-    added = sorted(set(after_by_unique) - set(before_by_unique))
-    shared = sorted(set(before_by_unique) & set(after_by_unique))
+    removed_ids = set(before_by_unique) - set(after_by_unique)
+    added_ids = set(after_by_unique) - set(before_by_unique)
 
+    reidentified = []
+    for unique_id in sorted(removed_ids):
+        entry = before_by_unique[unique_id]
+        match = after_by_id.get(entry.get("id"))
+        if match is None or match["unique_id"] not in added_ids:
+            continue
+        removed_ids.discard(unique_id)
+        added_ids.discard(match["unique_id"])
+        reidentified.append(
+            {
+                "entity_id": match.get("entity_id"),
+                "before": unique_id,
+                "after": match["unique_id"],
+            }
+        )
+
+    renamed = []
+    device_moves = []
+    for unique_id in sorted(set(before_by_unique) & set(after_by_unique)):
+        before_entry = before_by_unique[unique_id]
+        after_entry = after_by_unique[unique_id]
+        if before_entry.get("entity_id") != after_entry.get("entity_id"):
+            renamed.append(
+                {
+                    "unique_id": unique_id,
+                    "before": before_entry.get("entity_id"),
+                    "after": after_entry.get("entity_id"),
+                }
+            )
+        if before_entry.get("device_id") != after_entry.get("device_id"):
+            device_moves.append(
+                {
+                    "unique_id": unique_id,
+                    "entity_id": after_entry.get("entity_id"),
+                    "before": before_entry.get("device_id"),
+                    "after": after_entry.get("device_id"),
+                }
+            )
+
+    return {
+        "before": len(before),
+        "after": len(after),
+        "added": [
+            {"unique_id": unique_id, "entity_id": after_by_unique[unique_id].get("entity_id")}
+            for unique_id in sorted(added_ids)
+        ],
+        "removed": [
+            {"unique_id": unique_id, "entity_id": before_by_unique[unique_id].get("entity_id")}
+            for unique_id in sorted(removed_ids)
+        ],
+        "renamed": renamed,
+        "reidentified": reidentified,
+        "device_moves": device_moves,
+    }
+
+
+def diff_devices(before: list[dict], after: list[dict]) -> dict:
+    before_by_id = key_by(before, "id")
+    after_by_id = key_by(after, "id")
+    return {
+        "before": len(before),
+        "after": len(after),
+        "added": [after_by_id[device_id] for device_id in sorted(set(after_by_id) - set(before_by_id))],
+        "removed": [before_by_id[device_id] for device_id in sorted(set(before_by_id) - set(after_by_id))],
+        "current": after,
+    }
+
+
+def print_entity_changes(changes: dict) -> None:
     print("Entity summary")
-    print(f"  before: {len(before)}")
-    print(f"  after:  {len(after)}")
-    print(f"  added:  {len(added)}")
-    print(f"  removed:{len(removed)}")
+    print(f"  before: {changes['before']}")
+    print(f"  after:  {changes['after']}")
+    print(f"  added:  {len(changes['added'])}")
+    print(f"  removed:{len(changes['removed'])}")
     print()
 
-    if added:
+    if changes["added"]:
         print("Added entities")
-        for unique_id in added:
-            entry = after_by_unique[unique_id]
-            print(f"  + {unique_id} -> {entry.get('entity_id')}")
+        for entry in changes["added"]:
+            print(f"  + {entry['unique_id']} -> {entry['entity_id']}")
         print()
 
-    if removed:
+    if changes["removed"]:
         print("Removed entities")
-        for unique_id in removed:
-            entry = before_by_unique[unique_id]
-            print(f"  - {unique_id} -> {entry.get('entity_id')}")
+        for entry in changes["removed"]:
+            print(f"  - {entry['unique_id']} -> {entry['entity_id']}")
         print()
 
-    moved = []
-    for unique_id in shared:
-        before_entry = before_by_unique[unique_id]
-        after_entry = after_by_unique[unique_id]
-        if before_entry.get("entity_id") != after_entry.get("entity_id"):
-            moved.append((unique_id, before_entry.get("entity_id"), after_entry.get("entity_id")))
+    if changes["reidentified"]:
+        print("Unique ID changes")
+        for entry in changes["reidentified"]:
+            print(f"  ~ {entry['entity_id']}: {entry['before']} -> {entry['after']}")
+        print()
 
-    if moved:
+    if changes["renamed"]:
         print("Entity ID changes")
-        for unique_id, before_id, after_id in moved:
-            print(f"  * {unique_id}: {before_id} -> {after_id}")
+        for entry in changes["renamed"]:
+            print(f"  * {entry['unique_id']}: {entry['before']} -> {entry['after']}")
         print()
 
+    if changes["device_moves"]:
+        print("Device moves")
+        for entry in changes["device_moves"]:
+            print(f"  > {entry['entity_id']}: {entry['before']} -> {entry['after']}")
+        print()
 
-def print_device_changes(before: list[dict], after: list[dict]) -> None:
-    def ademco_devices(entries: list[dict]) -> list[dict]:
-        devices = []
-        for entry in entries:
-            identifiers = entry.get("identifiers") or []
-            if any(identifier[0] == "ademco" for identifier in identifiers):
-                devices.append(entry)
-        return devices
-
-    before_devices = ademco_devices(before)
-    after_devices = ademco_devices(after)
 
+def print_device_changes(changes: dict) -> None:
     print("Device summary")
-    print(f"  before: {len(before_devices)}")
-    print(f"  after:  {len(after_devices)}")
+    print(f"  before: {changes['before']}")
+    print(f"  after:  {changes['after']}")
     print()
 
-    if after_devices:
+    if changes["current"]:
         print("Current Ademco devices")
-        for device in after_devices:
-            identifiers = ",".join(f"{key}:{value}" for key, value in device.get("identifiers", []))
+        for device in changes["current"]:
+            identifiers = ",".join(f"{key}:{value}" for key, value in device.get("identifiers") or [])
             print(f"  * {device.get('name_by_user') or device.get('name')} [{identifiers}]")
         print()
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("before_entity_registry", type=Path)
-    parser.add_argument("after_entity_registry", type=Path)
+    parser.add_argument(
+        "entity_registries",
+        type=Path,
+        nargs="+",
+        help="two or more core.entity_registry snapshots, oldest first",
+    )
     parser.add_argument("--before-device-registry", type=Path)
     parser.add_argument("--after-device-registry", type=Path)
+    parser.add_argument(
+        "--device-registry",
+        type=Path,
+        action="append",
+        default=[],
+        help="core.device_registry for each snapshot, in the same order",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="parse registries incrementally and keep only Ademco entries",
+    )
+    parser.add_argument("--json", action="store_true", help="print the diffs as JSON")
     args = parser.parse_args()
 
-    before_entities = load_entity_entries(args.before_entity_registry)
-    after_entities = load_entity_entries(args.after_entity_registry)
-    print_entity_changes(before_entities, after_entities)
-
+    snapshots = args.entity_registries
+    if len(snapshots) < 2:
+        parser.error("at least two entity registry snapshots are required")
+    device_registries = args.device_registry
     if args.before_device_registry and args.after_device_registry:
-        before_devices = load_device_entries(args.before_device_registry)
-        after_devices = load_device_entries(args.after_device_registry)
-        print_device_changes(before_devices, after_devices)
+        if len(snapshots) != 2:
+            parser.error("use --device-registry for more than two snapshots")
+        device_registries = [args.before_device_registry, args.after_device_registry]
+    if device_registries and len(device_registries) != len(snapshots):
+        parser.error("give one device registry per entity registry snapshot")
+
+    # Each snapshot is loaded once, even though inner ones are in two diffs.
+    entities = [load_entity_entries(path, args.stream) for path in snapshots]
+    devices = [load_device_entries(path, args.stream) for path in device_registries]
+
+    results = []
+    for index in range(1, len(snapshots)):
+        result = {
+            "before": str(snapshots[index - 1]),
+            "after": str(snapshots[index]),
+            "entities": diff_entities(entities[index - 1], entities[index]),
+        }
+        if devices:
+            result["devices"] = diff_devices(devices[index - 1], devices[index])
+        results.append(result)
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    for result in results:
+        if len(results) > 1:
+            print(f"== {result['before']} -> {result['after']}")
+            print()
+        print_entity_changes(result["entities"])
+        if "devices" in result:
+            print_device_changes(result["devices"])
 
 
 if __name__ == "__main__":
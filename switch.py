@@ -1,4 +1,4 @@
-"""Switch platform for Ademco zone bypass control."""
+"""Switch platform for Ademco zone bypass and relay output control."""
 
 from __future__ import annotations
 
@@ -16,12 +16,13 @@ from homeassistant.helpers.entity_platform import (
 )
 
 from . import AdemcoConfigEntry
-from .bypass import build_partition_configs, supports_bypass, validate_bypass_request
-from .const import CONF_DOORS, CONF_MOTIONS, CONF_WINDOWS
+from .ademco import AdemcoError
+from .bypass import supports_bypass, validate_bypass_request
 from .entity import AdemcoEntity
 
 if TYPE_CHECKING:
-    from .ademco import Zone
+    from .ademco import Output, Zone
+    from .topology import OutputTopology, PanelTopology, ZoneTopology
 
 
 async def async_setup_entry(
@@ -29,31 +30,39 @@ async def async_setup_entry(
     entry: AdemcoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up Ademco bypass switches from a config entry."""
+    """Set up Ademco bypass and output switches from a config entry."""
     entities = []
     runtime_data = entry.runtime_data
     panel = runtime_data.panel
-    config = runtime_data.config
-    partition_configs = build_partition_configs(config)
+    topology = runtime_data.topology
     platform = async_get_current_platform()
 
-    for zone_type, key in (
-        ("door", CONF_DOORS),
-        ("window", CONF_WINDOWS),
-        ("motion", CONF_MOTIONS),
-    ):
-        for zone_config in config.get(key, []):
-            entities.append(
-                AdemcoZoneBypassSwitch(
-                    panel,
-                    runtime_data.device_id,
-                    runtime_data.device_name,
-                    panel.getZone(zone_config["id"]),
-                    zone_config,
-                    zone_type,
-                    partition_configs,
-                )
+    for zone_topology in topology.zones:
+        if not zone_topology.bypassable:
+            continue
+        entities.append(
+            AdemcoZoneBypassSwitch(
+                panel,
+                runtime_data.device_id,
+                runtime_data.device_name,
+                runtime_data.entry_id,
+                panel.getZone(zone_topology.zone_id),
+                zone_topology,
+                topology,
             )
+        )
+
+    for output_topology in topology.outputs:
+        entities.append(
+            AdemcoOutputSwitch(
+                panel,
+                runtime_data.device_id,
+                runtime_data.device_name,
+                runtime_data.entry_id,
+                panel.getOutput(output_topology.output_id),
+                output_topology,
+            )
+        )
 
     async_add_entities(entities)
     platform.async_register_entity_service(
@@ -73,25 +82,31 @@ class AdemcoZoneBypassSwitch(AdemcoEntity, SwitchEntity):
 
     _attr_should_poll = False
     _attr_entity_category = EntityCategory.CONFIG
+    # The zone sensor already records open state and partition.
+    _unrecorded_attributes = frozenset(
+        {"partition_id", "zone_open", "controllable_bypass", "requires_code"}
+    )
 
     def __init__(
         self,
         panel,
         device_id: str,
         device_name: str,
+        entry_id: str,
         zone: Zone,
-        config: dict[str, str],
-        zone_type: str,
-        partition_configs: dict[int, dict[str, str]],
+        zone_topology: ZoneTopology,
+        topology: PanelTopology,
     ) -> None:
         """Initialize an Ademco bypass switch."""
-        super().__init__(panel, device_id, device_name)
+        super().__init__(panel, device_id, device_name, entry_id)
         self._zone = zone
-        self._config = config
-        self._zone_type = zone_type
-        self._partition_configs = partition_configs
+        self._zone_type = zone_topology.zone_type
+        self._topology = topology
+        self._attr_name = f"{zone_topology.display_name} Bypass"
         self._remove_zone_callback = None
-        self._attr_unique_id = f"ademco.zone{self._zone.zoneNum}_bypass"
+        self._attr_unique_id = self._build_unique_id(
+            f"zone{self._zone.zoneNum}_bypass"
+        )
 
     async def async_added_to_hass(self) -> None:
         """Register zone updates when the entity is added."""
@@ -107,19 +122,6 @@ class AdemcoZoneBypassSwitch(AdemcoEntity, SwitchEntity):
             self._remove_zone_callback = None
         await super().async_will_remove_from_hass()
 
-    @property
-    def name(self) -> str:
-        """Return the zone bypass switch name."""
-        suffix = {
-            "door": "Door",
-            "window": "Window",
-            "motion": "Motion",
-        }[self._zone_type]
-        zone_name = self._config.get("name", "").strip()
-        if not zone_name:
-            return f"Zone {self._zone.zoneNum} {suffix} Bypass"
-        return f"{zone_name} {suffix} Bypass"
-
     @property
     def icon(self) -> str:
         """Return a context-specific icon."""
@@ -130,9 +132,8 @@ class AdemcoZoneBypassSwitch(AdemcoEntity, SwitchEntity):
         """Return whether the zone is currently bypassed."""
         return self._zone.bypassed
 
-    @property
-    def extra_state_attributes(self) -> dict[str, object]:
-        """Return extra state attributes for the bypass switch."""
+    def _build_extra_state_attributes(self) -> dict[str, object]:
+        """Build extra state attributes for the bypass switch."""
         return {
             "partition_id": self._zone.partition_id,
             "zone_open": self._zone.opened,
@@ -145,7 +146,7 @@ class AdemcoZoneBypassSwitch(AdemcoEntity, SwitchEntity):
         return supports_bypass(
             self._zone_type,
             self._zone.partition_id,
-            self._partition_configs,
+            self._topology,
         )
 
     async def async_turn_on(self, **kwargs) -> None:
@@ -170,9 +171,9 @@ class AdemcoZoneBypassSwitch(AdemcoEntity, SwitchEntity):
             self.name,
             self._zone_type,
             self._zone.partition_id,
-            self._partition_configs,
+            self._topology,
         )
-        self._panel.bypassZone(self._zone.partition_id, code, self._zone.zoneNum)
+        await self._send_bypass(code)
 
     async def async_unbypass_zone(self, code: str) -> None:
         """Unbypass this zone using the same Ademco keypad toggle sequence."""
@@ -180,13 +181,108 @@ class AdemcoZoneBypassSwitch(AdemcoEntity, SwitchEntity):
             self.name,
             self._zone_type,
             self._zone.partition_id,
-            self._partition_configs,
+            self._topology,
         )
         if not self._zone.bypassed:
             raise HomeAssistantError(f"{self.name} is not currently bypassed")
-        self._panel.bypassZone(self._zone.partition_id, code, self._zone.zoneNum)
+        await self._send_bypass(code)
+
+    async def _send_bypass(self, code: str) -> None:
+        """Send the bypass toggle sequence for this zone."""
+        try:
+            await self._panel.bypassZone(
+                self._zone.partition_id, code, self._zone.zoneNum
+            )
+        except AdemcoError as err:
+            raise HomeAssistantError(str(err)) from err
 
     @callback
     def _handle_zone_update(self) -> None:
         """Write state after a zone update."""
-        self.async_write_ha_state()
+        self._invalidate_attributes()
+        self._async_write_state_if_changed()
+
+    def _state_fingerprint(self) -> tuple:
+        return (self.available, *self._zone.bitStatus, self._zone.partition_id)
+
+
+class AdemcoOutputSwitch(AdemcoEntity, SwitchEntity):
+    """Representation of an Ademco relay output.
+
+    State is pushed from the panel's output status (CS) reports through the
+    output's callbacks, so the entity never polls.
+    """
+
+    _attr_should_poll = False
+    _readiness = ("outputs",)
+
+    def __init__(
+        self,
+        panel,
+        device_id: str,
+        device_name: str,
+        entry_id: str,
+        output: Output,
+        output_topology: OutputTopology,
+    ) -> None:
+        """Initialize an Ademco output switch."""
+        super().__init__(panel, device_id, device_name, entry_id)
+        self._output = output
+        self._attr_name = output_topology.name or f"Output {output.outputId}"
+        self._remove_output_callback = None
+        self._attr_unique_id = self._build_unique_id(f"output{output.outputId}")
+
+    async def async_added_to_hass(self) -> None:
+        """Register output updates when the entity is added."""
+        await super().async_added_to_hass()
+        self._remove_output_callback = self._output.registerCallback(
+            self._handle_output_update
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister callbacks."""
+        if self._remove_output_callback is not None:
+            self._remove_output_callback()
+            self._remove_output_callback = None
+        await super().async_will_remove_from_hass()
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the panel reports the output on."""
+        return self._output.isOn
+
+    def _build_extra_state_attributes(self) -> dict[str, object]:
+        """Build extra state attributes for the output switch."""
+        return {
+            "output_id": self._output.outputId,
+            "scheduled": self._output.schedule is not None,
+        }
+
+    async def async_turn_on(self, **kwargs) -> None:
+        """Turn the output on and ask the panel to confirm it."""
+        try:
+            await self._output.turnOn()
+        except AdemcoError as err:
+            raise HomeAssistantError(str(err)) from err
+        self._panel.outputStatusRequest()
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Turn the output off and ask the panel to confirm it."""
+        try:
+            await self._output.turnOff()
+        except AdemcoError as err:
+            raise HomeAssistantError(str(err)) from err
+        self._panel.outputStatusRequest()
+
+    @callback
+    def _handle_output_update(self) -> None:
+        """Write state after an output status change."""
+        self._invalidate_attributes()
+        self._async_write_state_if_changed()
+
+    def _state_fingerprint(self) -> tuple:
+        return (
+            self.available,
+            self._output.isOn,
+            self._output.schedule is not None,
+        )
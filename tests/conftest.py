@@ -0,0 +1,6 @@
+"""Make the HA-free panel runtime in ``ademco/`` importable from tests."""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
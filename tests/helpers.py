@@ -0,0 +1,83 @@
+"""A simulated panel on the loopback transport for runtime tests."""
+
+from __future__ import annotations
+
+import asyncio
+
+from ademco import AlarmPanel, LoopbackTransport, checksum
+
+
+def frame(body: str) -> bytes:
+    """Frame a panel message body such as ``"ZS000..."`` for the wire."""
+    message = f"{len(body) + 6:02X}{body}00"
+    return f"{message}{checksum(message)}\r\n".encode()
+
+
+class FakePanel:
+    """Answer status requests from simple in-memory state.
+
+    Output commands (cn/cf) update ``outputs`` so CS reports reflect them.
+    Every written command is appended to ``sent`` as its two-letter code.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, latency: float = 0.001) -> None:
+        self.loop = loop
+        self.latency = latency
+        self.zones = "0" * 96
+        self.partitions = "D" * 8
+        self.partition_map = "1" * 96
+        self.outputs = ["0"] * 96
+        # Request codes that go unanswered.
+        self.silent: set[str] = set()
+        self.sent: list[str] = []
+        self.transport = LoopbackTransport(self._respond)
+        self.transport.write_interval = 0.001
+
+    def _respond(self, sent: bytes) -> None:
+        command = sent[2:4].decode()
+        if not command.strip():
+            return
+        self.sent.append(command)
+        if command in ("cn", "cf"):
+            self.outputs[int(sent[4:6]) - 1] = "1" if command == "cn" else "0"
+            return
+        if command in self.silent:
+            return
+        body = {
+            "zs": lambda: "ZS" + self.zones,
+            "zp": lambda: "ZP" + self.partition_map,
+            "cs": lambda: "CS" + "".join(self.outputs),
+            "as": lambda: "AS" + self.partitions,
+        }.get(command)
+        if body is not None:
+            self.feed(body(), self.latency)
+
+    def feed(self, body: str, delay: float = 0) -> None:
+        self.loop.call_later(delay, self.transport.feed, frame(body))
+
+
+async def start_panel(**fake_kwargs) -> tuple[AlarmPanel, FakePanel]:
+    """Start a panel on a fake and wait for its first full sync."""
+    loop = asyncio.get_running_loop()
+    fake = FakePanel(loop, **fake_kwargs)
+    panel = AlarmPanel({"device": ""}, loop=loop, transport=fake.transport)
+    await panel.async_start()
+    for _ in range(500):
+        if "full_sync" in panel.startup_timings:
+            break
+        await asyncio.sleep(0.002)
+    return panel, fake
+
+
+async def settle(seconds: float = 0.05) -> None:
+    await asyncio.sleep(seconds)
+
+
+async def wait_until(predicate, timeout: float = 2) -> None:
+    """Poll ``predicate`` until it holds; fail after ``timeout`` seconds."""
+
+    async def _poll() -> None:
+        while not predicate():
+            await asyncio.sleep(0.002)
+
+    await asyncio.wait_for(_poll(), timeout)
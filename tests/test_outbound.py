@@ -0,0 +1,174 @@
+"""Tests for the bounded outbound command queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ademco.outbound import CommandExpired, CommandQueueFull, OutboundQueue
+from helpers import start_panel
+
+
+async def _drain(queue: OutboundQueue) -> list[bytes]:
+    written = []
+    while len(queue):
+        command = await queue.get()
+        written.append(command.frame)
+    return written
+
+
+def test_poll_is_coalesced_only_after_the_last_command() -> None:
+    async def run() -> None:
+        queue = OutboundQueue(asyncio.get_running_loop())
+        first = queue.put(b"cs", coalesce=True)
+        assert queue.put(b"cs", coalesce=True) is first
+        queue.put(b"ks")
+        second = queue.put(b"cs", coalesce=True)
+        assert second is not first
+        assert await _drain(queue) == [b"cs", b"ks", b"cs"]
+
+    asyncio.run(run())
+
+
+def test_put_raises_when_full_but_polls_still_fit() -> None:
+    async def run() -> None:
+        queue = OutboundQueue(asyncio.get_running_loop(), maxsize=2)
+        queue.put(b"a")
+        queue.put(b"b")
+        with pytest.raises(CommandQueueFull):
+            queue.put(b"c")
+        queue.put(b"zs", coalesce=True)
+        assert queue.free == 0
+        assert len(queue) == 3
+
+    asyncio.run(run())
+
+
+def test_expired_command_is_dropped_with_an_error() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        queue = OutboundQueue(loop)
+        stale = queue.put(b"cn", deadline=loop.time() - 1)
+        fresh = queue.put(b"cf", deadline=loop.time() + 10)
+        assert await _drain(queue) == [b"cf"]
+        with pytest.raises(CommandExpired):
+            await stale
+        assert not fresh.done()
+        assert queue.expired == 1
+
+    asyncio.run(run())
+
+
+def test_clear_fails_waiting_commands() -> None:
+    async def run() -> None:
+        queue = OutboundQueue(asyncio.get_running_loop())
+        waiting = queue.put(b"cn")
+        queue.clear("link lost")
+        with pytest.raises(CommandExpired):
+            await waiting
+        assert len(queue) == 0 and queue.free == queue.maxsize
+
+    asyncio.run(run())
+
+
+def test_status_poll_is_written_after_earlier_commands() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.transport.write_interval = 0.02
+        fake.sent.clear()
+        panel.sendKeypad(1, "1")
+        panel.outputStatusRequest()
+        schedule = panel.pulseOutput(3, 0.1)
+        assert await asyncio.wait_for(schedule.done, 2) is True
+        assert fake.sent[:3] == ["ks", "cs", "cn"]
+        assert "cs" in fake.sent[fake.sent.index("cf") :]
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_sequence_counts_every_frame_and_is_written_whole() -> None:
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        queue = OutboundQueue(loop, maxsize=4)
+        queue.put(b"cn")
+        with pytest.raises(CommandQueueFull):
+            queue.put_sequence([b"k1", b"k2", b"k3", b"k4"])
+        queue.put_sequence([b"k1", b"k2", b"k3"], deadline=loop.time() + 10)
+        assert queue.free == 0
+        command = await queue.get()
+        command = await queue.get()
+        assert command.frames == (b"k1", b"k2", b"k3")
+        assert queue.free == 4
+
+    asyncio.run(run())
+
+
+def test_long_key_sequence_outlasts_the_command_deadline() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.transport.write_interval = 0.02
+        fake.sent.clear()
+        # 13 frames take longer to write than the deadline allows each one.
+        sent = panel.sendKeypadSequence(1, "1" * 65, timeout=0.1)
+        await asyncio.wait_for(sent, 2)
+        assert fake.sent.count("ks") == 13
+        assert panel.writeQueue.expired == 0
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_expired_key_sequence_sends_nothing() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.transport.write_interval = 0.05
+        fake.sent.clear()
+        panel.sendKeypad(1, "1")
+        sent = panel.sendKeypadSequence(1, "1234567890", timeout=0.01)
+        with pytest.raises(CommandExpired):
+            await asyncio.wait_for(sent, 2)
+        await asyncio.sleep(0.1)
+        assert fake.sent == ["ks"]
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_control_commands_report_their_outcome() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        await asyncio.wait_for(panel.armAway(1, "1234"), 2)
+        await asyncio.wait_for(panel.bypassZone(1, "1234", 5), 2)
+        # Code, bypass key and zone number take two keypad frames.
+        assert fake.sent[-3:] == ["aa", "ks", "ks"]
+        await panel.async_stop()
+        with pytest.raises(CommandExpired):
+            await panel.disam(1, "1234")
+
+    asyncio.run(run())
+
+
+def test_cancelled_caller_does_not_drop_the_link() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.transport.write_interval = 0.05
+        links = []
+        panel.registerCallback(lambda: links.append(panel.connected))
+        # Keeps the writer busy so armAway is still queued when cancelled.
+        panel.sendKeypad(1, "1")
+
+        async def arm() -> None:
+            await panel.armAway(1, "1234")
+
+        caller = asyncio.create_task(arm())
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+        await asyncio.wait_for(panel.sendKeypad(1, "2"), 2)
+        assert fake.sent[-3:] == ["ks", "aa", "ks"]
+        assert False not in links and panel.connected
+        await panel.async_stop()
+
+    asyncio.run(run())
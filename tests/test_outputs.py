@@ -0,0 +1,97 @@
+"""Tests for output state pushed from CS reports."""
+
+from __future__ import annotations
+
+import asyncio
+
+from helpers import start_panel, wait_until
+
+
+def test_callback_fires_only_when_an_output_changes() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        output = panel.getOutput(2)
+        calls = []
+        remove = output.registerCallback(lambda: calls.append(output.isOn))
+        panel.dispatchMessage("CS", "01" + "0" * 94)
+        panel.dispatchMessage("CS", "01" + "0" * 94)
+        panel.dispatchMessage("CS", "0U" + "0" * 94)
+        assert calls == [True]
+        panel.dispatchMessage("CS", "0" * 96)
+        assert calls == [True, False]
+        remove()
+        panel.dispatchMessage("CS", "01" + "0" * 94)
+        assert calls == [True, False]
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_other_outputs_do_not_wake_the_callback() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        calls = []
+        panel.getOutput(2).registerCallback(lambda: calls.append(2))
+        panel.dispatchMessage("CS", "1" + "0" * 95)
+        assert calls == []
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_command_updates_state_before_the_report() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        output = panel.getOutput(4)
+        calls = []
+        output.registerCallback(lambda: calls.append(output.isOn))
+        written = output.turnOn()
+        assert calls == [True]
+        await written
+        fake.sent.clear()
+        panel.outputStatusRequest()
+        await wait_until(
+            lambda: "cs" in fake.sent and "CS" not in panel._pending_requests
+        )
+        # The confirming report matches, so nothing fires again.
+        assert calls == [True]
+        assert panel.snapshot().output_on(4)
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_dropped_command_rereads_the_output() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        output = panel.getOutput(4)
+        fake.sent.clear()
+        written = output.turnOn()
+        assert output.isOn
+        # Fails cn before the writer can take it, as a dropped link would.
+        panel.writeQueue.clear("test")
+        await asyncio.gather(written, return_exceptions=True)
+        # The re-requested report puts the output back off.
+        await wait_until(lambda: "cs" in fake.sent and not output.isOn)
+        assert "cn" not in fake.sent
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_callback_fires_when_a_schedule_starts_and_ends() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        output = panel.getOutput(6)
+        scheduled = []
+        output.registerCallback(lambda: scheduled.append(output.schedule is not None))
+        schedule = panel.pulseOutput(6, 10)
+        assert scheduled[-1] is True
+        schedule.cancel()
+        assert scheduled[-1] is False
+        schedule = panel.pulseOutput(6, 0.01)
+        await asyncio.wait_for(schedule.done, 2)
+        assert scheduled[-1] is False
+        await panel.async_stop()
+
+    asyncio.run(run())
@@ -0,0 +1,84 @@
+"""Tests for the sans-I/O protocol core."""
+
+from __future__ import annotations
+
+from ademco.protocol import (
+    OutputStatusChanged,
+    PanelProtocol,
+    PartitionMapChanged,
+    PartitionStatusChanged,
+    SystemEvent,
+    ZoneStatusChanged,
+)
+from helpers import frame
+
+
+def test_zone_report_yields_only_changed_zones() -> None:
+    protocol = PanelProtocol()
+    assert protocol.apply_zone_status("1" + "0" * 94 + "9") == [
+        ZoneStatusChanged(1, 1),
+        ZoneStatusChanged(96, 9),
+    ]
+    assert protocol.apply_zone_status("1" + "0" * 94 + "9") == []
+    assert protocol.apply_zone_status("0" * 95 + "9") == [ZoneStatusChanged(1, 0)]
+
+
+def test_partition_map_yields_one_record_per_change() -> None:
+    protocol = PanelProtocol()
+    report = "1" * 48 + "2" * 48
+    assert protocol.apply_zone_partitions(report) == [PartitionMapChanged(report)]
+    assert protocol.apply_zone_partitions(report) == []
+    assert protocol.zone_partition(49) == 2
+    assert protocol.zone_partition(97) == 0
+
+
+def test_arming_report_keeps_the_last_valid_status() -> None:
+    protocol = PanelProtocol()
+    assert protocol.apply_arming_status("AD000000") == [
+        PartitionStatusChanged(1, "A"),
+        PartitionStatusChanged(2, "D"),
+        *(PartitionStatusChanged(partition_id, "0") for partition_id in range(3, 9)),
+    ]
+    assert protocol.apply_arming_status("XH000000") == [PartitionStatusChanged(2, "H")]
+    assert protocol.partition_status[1] == "A"
+
+
+def test_output_report_skips_unknown_outputs() -> None:
+    protocol = PanelProtocol()
+    assert protocol.apply_output_status("1U1" + "0" * 93) == [
+        OutputStatusChanged(1, 1),
+        OutputStatusChanged(3, 1),
+    ]
+    assert protocol.apply_output_status("0U1" + "0" * 93) == [OutputStatusChanged(1, 0)]
+
+
+def test_event_comes_before_the_zone_bits_it_changes() -> None:
+    protocol = PanelProtocol()
+    protocol.apply_zone_partitions("2" * 96)
+    records = protocol.apply_system_event("2B0400")
+    assert isinstance(records[0], SystemEvent)
+    assert records[0].event["zone"] == 5
+    assert records[0].event["partition"] == 2
+    assert records[1:] == [ZoneStatusChanged(5, 1)]
+    # Opening an open zone changes no bits.
+    assert len(protocol.apply_system_event("2B0400")) == 1
+
+
+def test_receive_data_reassembles_split_frames() -> None:
+    stream = frame("ZS1" + "0" * 95) + frame("OK") + frame("CS01" + "0" * 94)
+    whole = PanelProtocol().receive_data(stream)
+    protocol = PanelProtocol()
+    chunked = []
+    for offset in range(0, len(stream), 7):
+        chunked.extend(protocol.receive_data(stream[offset : offset + 7]))
+    assert chunked == whole == [ZoneStatusChanged(1, 1), OutputStatusChanged(2, 1)]
+
+
+def test_corrupt_and_partial_lines_yield_nothing() -> None:
+    protocol = PanelProtocol()
+    bad = bytearray(frame("ZS1" + "0" * 95))
+    bad[10] = ord("2")
+    assert protocol.receive_data(bytes(bad)) == []
+    assert protocol.receive_data(frame("ZS1" + "0" * 95)[:20]) == []
+    protocol.connection_lost()
+    assert protocol.receive_data(frame("ZS1" + "0" * 95)) == [ZoneStatusChanged(1, 1)]
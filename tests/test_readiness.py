@@ -0,0 +1,25 @@
+"""Tests for report freshness across refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+
+from helpers import start_panel
+
+
+def test_every_refresh_requests_the_partition_map() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        for _ in range(2):
+            fake.sent.clear()
+            panel.refreshStatus()
+            for _ in range(200):
+                if "zp" in fake.sent:
+                    break
+                await asyncio.sleep(0.01)
+            assert "zp" in fake.sent
+        await asyncio.sleep(0.01)
+        assert panel.is_ready("partition_map")
+        await panel.async_stop()
+
+    asyncio.run(run())
@@ -0,0 +1,93 @@
+"""Tests for status request retries and link statistics."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import ademco
+from helpers import frame, start_panel, wait_until
+
+
+@pytest.fixture(autouse=True)
+def _short_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ademco, "REQUEST_TIMEOUT", 0.03)
+
+
+def test_unanswered_request_is_retried_then_abandoned() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.silent.add("as")
+        fake.sent.clear()
+        panel.armingStatusRequest()
+        await asyncio.sleep(0.3)
+        assert fake.sent.count("as") == 1 + ademco.REQUEST_RETRIES
+        assert panel.link_stats["abandoned"] == 1
+        assert "AS" not in panel._pending_requests
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_late_answer_stops_the_retries() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        retries = panel.link_stats["retries"]
+        fake.silent.add("as")
+        fake.sent.clear()
+        panel.armingStatusRequest()
+        while fake.sent.count("as") < 2:
+            await asyncio.sleep(0.005)
+        fake.silent.clear()
+        fake.feed("AS" + "D" * 8)
+        await asyncio.sleep(0.2)
+        assert fake.sent.count("as") == 2
+        assert panel.link_stats["retries"] == retries + 1
+        assert panel.link_stats["abandoned"] == 0
+        assert not panel._pending_requests
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_corrupt_frame_re_requests_the_outstanding_report(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Long enough that only the corrupt frame can trigger the retry.
+    monkeypatch.setattr(ademco, "REQUEST_TIMEOUT", 5)
+
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.silent.add("cs")
+        fake.sent.clear()
+        panel.outputStatusRequest()
+        await asyncio.sleep(0.02)
+        corrupt = bytearray(frame("CS" + "0" * 96))
+        corrupt[8] = ord("1")
+        fake.transport.feed(bytes(corrupt))
+        await asyncio.sleep(0.02)
+        assert fake.sent.count("cs") == 2
+        assert panel.link_stats["corrupt"] == 1
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_repeated_garbage_re_reads_zones_once() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.sent.clear()
+        garbage = bytearray(frame("NQ2B0400"))
+        garbage[6] = ord("F")
+        # A steady trickle, each line arriving after the last re-read was
+        # answered.
+        for count in range(1, 6):
+            fake.transport.feed(bytes(garbage))
+            await wait_until(lambda: panel.link_stats["corrupt"] == count)
+            await wait_until(lambda: "ZS" not in panel._pending_requests)
+            await asyncio.sleep(0.01)
+        assert fake.sent == ["zs"]
+        await panel.async_stop()
+
+    asyncio.run(run())
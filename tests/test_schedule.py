@@ -0,0 +1,120 @@
+"""Tests for timed output schedules and their CS confirmation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import ademco
+from ademco import CommandExpired, CommandQueueFull
+from helpers import start_panel
+
+
+def test_pulse_is_confirmed_by_the_following_report() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.sent.clear()
+        schedule = panel.pulseOutput(3, 0.02)
+        assert schedule.active
+        assert await asyncio.wait_for(schedule.done, 2) is True
+        assert [code for code in fake.sent if code != "cs"] == ["cn", "cf"]
+        assert not panel.getOutput(3).isOn
+        assert panel.getOutput(3).schedule is None
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_pattern_repeats_the_requested_number_of_times() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.sent.clear()
+        schedule = panel.scheduleOutput(5, [(True, 0.01), (False, 0.01)], repeat=3)
+        assert await asyncio.wait_for(schedule.done, 2) is True
+        assert [code for code in fake.sent if code != "cs"] == ["cn", "cf"] * 3
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_report_that_disagrees_fails_the_schedule() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.silent.add("cs")
+        schedule = panel.pulseOutput(3, 0.01)
+        while "cf" not in fake.sent:
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(0.02)
+        # The relay stuck on.
+        fake.feed("CS001" + "0" * 93)
+        assert await asyncio.wait_for(schedule.done, 2) is False
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_missing_report_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ademco, "OUTPUT_CONFIRM_TIMEOUT", 0.05)
+
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.silent.add("cs")
+        schedule = panel.pulseOutput(3, 0.01)
+        assert await asyncio.wait_for(schedule.done, 2) is False
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_cancel_stops_the_pattern_and_keeps_the_output() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        schedule = panel.pulseOutput(3, 10)
+        schedule.cancel()
+        assert await schedule.done is False
+        assert panel.getOutput(3).isOn
+        assert panel.getOutput(3).schedule is None
+        await asyncio.sleep(0.02)
+        assert "cf" not in fake.sent
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_direct_command_replaces_a_running_schedule() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        schedule = panel.pulseOutput(3, 10)
+        await panel.getOutput(3).turnOn()
+        assert schedule.cancelled
+        assert await schedule.done is False
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_full_queue_cancels_the_schedule() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        panel._link_up.clear()
+        for output_id in range(panel.writeQueue.maxsize):
+            panel.getOutput(output_id + 10).turnOn()
+        with pytest.raises(CommandQueueFull):
+            panel.pulseOutput(3, 0.01)
+        assert panel.getOutput(3).schedule is None
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_rejected_step_fails_the_schedule_at_once() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        await panel.async_stop()
+        schedule = panel.pulseOutput(3, 10)
+        assert await asyncio.wait_for(schedule.done, 1) is False
+        assert isinstance(schedule.error, CommandExpired)
+        assert schedule.cancelled
+
+    asyncio.run(run())
@@ -0,0 +1,36 @@
+"""Tests for panel snapshots taken from callbacks."""
+
+from __future__ import annotations
+
+import asyncio
+
+from helpers import start_panel
+
+
+def test_callbacks_snapshot_the_whole_report() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        seen = []
+        panel.getZone(1).registerCallback(lambda: seen.append(panel.snapshot()))
+        panel.dispatchMessage("ZS", "11" + "0" * 94)
+        assert len(seen) == 1
+        assert seen[0].zone(1).opened and seen[0].zone(2).opened
+        assert seen[0] is panel.snapshot()
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_event_callbacks_run_after_the_event_is_applied() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        seen = []
+        panel.registerEventCallback(
+            lambda event: seen.append((event["zone"], panel.snapshot().zone(3).opened))
+        )
+        # Zone 3 (0x02 + 1) opens.
+        panel.dispatchMessage("NQ", "2B0200")
+        assert seen == [(3, True)]
+        await panel.async_stop()
+
+    asyncio.run(run())
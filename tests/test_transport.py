@@ -0,0 +1,113 @@
+"""Tests for the TCP transport against a local server."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ademco import AlarmPanel, TcpTransport, create_transport
+from ademco.protocol import STATUS_REQUESTS, encode_command
+from helpers import frame, wait_until
+
+ZONE_REPORT = "ZS" + "0" * 96
+
+
+class PanelServer:
+    """A ser2net-style server answering status requests like a panel."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.received: list[bytes] = []
+        self._writers: list[asyncio.StreamWriter] = []
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        self._writers.append(writer)
+        while line := await reader.readline():
+            self.received.append(line)
+            body = {
+                b"zs": ZONE_REPORT,
+                b"zp": "ZP" + "1" * 96,
+                b"cs": "CS" + "0" * 96,
+                b"as": "AS" + "D" * 8,
+            }.get(line[2:4])
+            if body is not None:
+                writer.write(frame(body))
+                await writer.drain()
+        writer.close()
+
+    def drop_clients(self) -> None:
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    async def stop(self) -> None:
+        self.drop_clients()
+        self._server.close()
+        await self._server.wait_closed()
+
+
+def test_tcp_addresses_select_the_tcp_transport() -> None:
+    transport = create_transport({"device": "socket://192.0.2.1:4001"})
+    assert isinstance(transport, TcpTransport)
+    assert (transport.host, transport.port) == ("192.0.2.1", 4001)
+    assert not isinstance(create_transport({"device": "/dev/ttyUSB0"}), TcpTransport)
+    with pytest.raises(ValueError):
+        create_transport({"device": "/dev/ttyUSB0", "transport": "tcp"})
+
+
+def test_tcp_transport_writes_reads_and_sees_eof() -> None:
+    async def run() -> None:
+        server = PanelServer()
+        port = await server.start()
+        transport = TcpTransport("127.0.0.1", port)
+        await transport.connect()
+        assert transport.connected
+        request = encode_command(STATUS_REQUESTS["ZS"])
+        await transport.write(request)
+        assert await transport.read_frame() == frame(ZONE_REPORT)
+        assert server.received == [request]
+
+        server.drop_clients()
+        with pytest.raises(ConnectionResetError):
+            await asyncio.wait_for(transport.read_frame(), 2)
+        await transport.close()
+        assert not transport.connected
+
+        await transport.connect()
+        await transport.write(request)
+        assert await transport.read_frame() == frame(ZONE_REPORT)
+        assert server.connections == 2
+        await transport.close()
+        await server.stop()
+
+    asyncio.run(run())
+
+
+def test_panel_reconnects_when_the_server_drops_it() -> None:
+    async def run() -> None:
+        server = PanelServer()
+        port = await server.start()
+        panel = AlarmPanel(
+            {"device": f"127.0.0.1:{port}"}, loop=asyncio.get_running_loop()
+        )
+        panel._transport.write_interval = 0.001
+        await panel.async_start()
+        await wait_until(lambda: "full_sync" in panel.startup_timings)
+
+        server.drop_clients()
+        await wait_until(lambda: not panel.connected)
+        await wait_until(lambda: server.connections == 2 and panel.connected)
+        await wait_until(lambda: panel.is_ready("zones"))
+        await panel.async_stop()
+        await server.stop()
+
+    asyncio.run(run())
@@ -0,0 +1,57 @@
+"""Tests for zone callbacks and report bookkeeping."""
+
+from __future__ import annotations
+
+import asyncio
+
+from helpers import start_panel
+
+
+def test_callback_removing_itself_does_not_skip_the_next() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        zone = panel.getZone(4)
+        calls = []
+
+        def first() -> None:
+            calls.append("first")
+            remove()
+
+        remove = zone.registerCallback(first)
+        zone.registerCallback(lambda: calls.append("second"))
+        zone.proccessStatus(1)
+        assert calls == ["first", "second"]
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_repeated_zone_report_continues_the_refresh() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        fake.silent.add("zs")
+        panel.refreshStatus()
+        await asyncio.sleep(0.02)
+        fake.sent.clear()
+        # An I/O thread passes an unchanged report on with its data dropped.
+        panel.dispatchMessage("ZS", None)
+        await asyncio.sleep(0.05)
+        assert {"cs", "as", "zp"} <= set(fake.sent)
+        await panel.async_stop()
+
+    asyncio.run(run())
+
+
+def test_stop_releases_latched_zones() -> None:
+    async def run() -> None:
+        panel, fake = await start_panel()
+        zone = panel.getZone(7)
+        zone.latchSeconds = 60
+        zone.proccessStatus(1)
+        zone.proccessStatus(0)
+        assert zone.latched and zone.active
+        await panel.async_stop()
+        assert not zone.latched
+        assert not panel._latch_deadlines
+
+    asyncio.run(run())
@@ -0,0 +1,169 @@
+"""Compiled, immutable view of an Ademco config entry.
+
+The config entry stores zone, partition, garage door and output mappings as
+lists of string dicts. ``compile_topology`` turns them into frozen lookups
+once at setup, so platforms and entities never re-read raw config.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from .const import (
+    CONF_DOORS,
+    CONF_GARAGE_DOORS,
+    CONF_MOTIONS,
+    CONF_OUTPUTS,
+    CONF_PARTITIONS,
+    CONF_PROBLEMS,
+    CONF_WINDOWS,
+    CONF_ZONE_STATUS_ENTITIES,
+)
+
+ZONE_TYPE_KEYS = (
+    ("door", CONF_DOORS),
+    ("window", CONF_WINDOWS),
+    ("motion", CONF_MOTIONS),
+    ("problem", CONF_PROBLEMS),
+)
+ZONE_SUFFIXES = {
+    "door": "Door",
+    "window": "Window",
+    "motion": "Motion",
+    "problem": "Problem",
+}
+BYPASS_ZONE_TYPES = frozenset({"door", "window", "motion"})
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneTopology:
+    """One configured zone entity."""
+
+    zone_id: int
+    zone_type: str
+    name: str
+    latch_seconds: int
+    # "<name or Zone N> <Door|Window|Motion|Problem>"
+    display_name: str
+
+    @property
+    def bypassable(self) -> bool:
+        return self.zone_type in BYPASS_ZONE_TYPES
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionTopology:
+    """One configured partition and the user number used to control it."""
+
+    partition_id: int
+    user_number: str
+    name: str
+
+    @property
+    def controllable(self) -> bool:
+        return bool(self.user_number)
+
+
+@dataclass(frozen=True, slots=True)
+class GarageDoorTopology:
+    """A garage door: the zone reporting its contact and the relay output."""
+
+    zone_id: int
+    output_id: int
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class OutputTopology:
+    """A relay output exposed as a switch."""
+
+    output_id: int
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class PanelTopology:
+    """Everything the platforms need to know about a panel's configuration."""
+
+    zones: tuple[ZoneTopology, ...]
+    # Zone id -> zone; a zone configured as both door/window/motion and
+    # problem resolves to the bypassable entry.
+    zones_by_id: Mapping[int, ZoneTopology]
+    partitions: Mapping[int, PartitionTopology]
+    garage_doors: tuple[GarageDoorTopology, ...]
+    outputs: tuple[OutputTopology, ...]
+    zone_status_entities: bool
+
+    def zones_of_type(self, zone_type: str) -> tuple[ZoneTopology, ...]:
+        return tuple(zone for zone in self.zones if zone.zone_type == zone_type)
+
+    def is_controllable(self, partition_id: int) -> bool:
+        partition = self.partitions.get(partition_id)
+        return partition is not None and partition.controllable
+
+
+def _items(config: Mapping[str, Any], key: str) -> list[Mapping[str, Any]]:
+    return [
+        item
+        for item in config.get(key, []) or []
+        if isinstance(item, Mapping) and str(item.get("id", "")).isdigit()
+    ]
+
+
+def compile_topology(config: Mapping[str, Any]) -> PanelTopology:
+    """Compile normalized config entry data into a ``PanelTopology``."""
+    zones: list[ZoneTopology] = []
+    for zone_type, key in ZONE_TYPE_KEYS:
+        for item in _items(config, key):
+            zone_id = int(item["id"])
+            name = str(item.get("name", "")).strip()
+            zones.append(
+                ZoneTopology(
+                    zone_id=zone_id,
+                    zone_type=zone_type,
+                    name=name,
+                    latch_seconds=int(item.get("latchSeconds", "0") or 0),
+                    display_name=f"{name or f'Zone {zone_id}'} {ZONE_SUFFIXES[zone_type]}",
+                )
+            )
+
+    zones_by_id: dict[int, ZoneTopology] = {}
+    for zone in zones:
+        current = zones_by_id.get(zone.zone_id)
+        if current is None or (zone.bypassable and not current.bypassable):
+            zones_by_id[zone.zone_id] = zone
+
+    partitions = {
+        int(item["id"]): PartitionTopology(
+            partition_id=int(item["id"]),
+            user_number=str(item.get("userNumber", "")).strip(),
+            name=str(item.get("name", "")).strip(),
+        )
+        for item in _items(config, CONF_PARTITIONS)
+    }
+
+    garage_doors = tuple(
+        GarageDoorTopology(
+            zone_id=int(item["id"]),
+            output_id=int(item["output"]),
+            name=str(item.get("name", "")).strip(),
+        )
+        for item in _items(config, CONF_GARAGE_DOORS)
+    )
+
+    outputs = tuple(
+        OutputTopology(output_id=int(item["id"]), name=str(item.get("name", "")).strip())
+        for item in _items(config, CONF_OUTPUTS)
+    )
+
+    return PanelTopology(
+        zones=tuple(zones),
+        zones_by_id=MappingProxyType(zones_by_id),
+        partitions=MappingProxyType(partitions),
+        garage_doors=garage_doors,
+        outputs=outputs,
+        zone_status_entities=bool(config.get(CONF_ZONE_STATUS_ENTITIES, False)),
+    )